@@ -0,0 +1,28 @@
+"""Add version to games
+
+Revision ID: 40b6af63dde8
+Revises: 9111a2fa14f1
+Create Date: 2026-10-17 05:54:59.333595
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '40b6af63dde8'
+down_revision: Union[str, Sequence[str], None] = '9111a2fa14f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('games', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('games', 'version')
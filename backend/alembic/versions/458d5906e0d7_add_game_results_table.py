@@ -0,0 +1,73 @@
+"""Add game results table
+
+Revision ID: 458d5906e0d7
+Revises: 4a25d165a57b
+Create Date: 2026-10-17 05:53:42.109005
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '458d5906e0d7'
+down_revision: Union[str, Sequence[str], None] = '4a25d165a57b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    game_results = op.create_table('game_results',
+    sa.Column('game_id', sa.Integer(), nullable=False),
+    sa.Column('winner_id', sa.Integer(), nullable=True),
+    sa.Column('winner_score', sa.Integer(), nullable=True),
+    sa.Column('final_scores', sa.JSON(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['game_id'], ['games.id'], ),
+    sa.ForeignKeyConstraint(['winner_id'], ['players.id'], ),
+    sa.PrimaryKeyConstraint('game_id')
+    )
+
+    # Backfill results for completed games from their final round's running totals.
+    # The actual completion time was never stored, so the game's creation time is used.
+    rows = op.get_bind().execute(sa.text("""
+        SELECT g.id, g.created_at, gp.player_id, rs.running_total
+        FROM games g
+        JOIN game_players gp ON gp.game_id = g.id
+        JOIN rounds r ON r.game_id = g.id AND r.round_number = g.max_cards * 2 - 1
+        JOIN round_scores rs ON rs.round_id = r.id AND rs.player_id = gp.player_id
+        WHERE g.status = 'COMPLETED'
+        ORDER BY g.id, gp.position
+    """).columns(
+        sa.column('id', sa.Integer),
+        # SQLite returns timestamps as strings unless the column is typed
+        sa.column('created_at', sa.DateTime(timezone=True)),
+        sa.column('player_id', sa.Integer),
+        sa.column('running_total', sa.Integer),
+    )).fetchall()
+
+    results = {}
+    for game_id, created_at, player_id, running_total in rows:
+        result = results.setdefault(game_id, {
+            'game_id': game_id,
+            'winner_id': None,
+            'winner_score': None,
+            'final_scores': [],
+            'completed_at': created_at,
+        })
+        result['final_scores'].append(running_total)
+        # First player in position order wins ties, matching ScoreCalculator.get_winner
+        if result['winner_score'] is None or running_total > result['winner_score']:
+            result['winner_id'] = player_id
+            result['winner_score'] = running_total
+
+    if results:
+        op.bulk_insert(game_results, list(results.values()))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('game_results')
@@ -0,0 +1,53 @@
+"""Add player stats tables
+
+Revision ID: 47c53556fae9
+Revises: 8d02dd5f642e
+Create Date: 2026-10-17 06:09:42.797633
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '47c53556fae9'
+down_revision: Union[str, Sequence[str], None] = '8d02dd5f642e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('player_stats',
+    sa.Column('player_id', sa.Integer(), nullable=False),
+    sa.Column('games_played', sa.Integer(), nullable=False),
+    sa.Column('wins', sa.Integer(), nullable=False),
+    sa.Column('total_score', sa.Integer(), nullable=False),
+    sa.Column('rounds_played', sa.Integer(), nullable=False),
+    sa.Column('exact_bids', sa.Integer(), nullable=False),
+    sa.Column('best_score', sa.Integer(), nullable=False),
+    sa.Column('best_game_id', sa.Integer(), nullable=False),
+    sa.Column('worst_score', sa.Integer(), nullable=False),
+    sa.Column('worst_game_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['best_game_id'], ['games.id'], ),
+    sa.ForeignKeyConstraint(['player_id'], ['players.id'], ),
+    sa.ForeignKeyConstraint(['worst_game_id'], ['games.id'], ),
+    sa.PrimaryKeyConstraint('player_id')
+    )
+    op.create_table('player_bid_stats',
+    sa.Column('player_id', sa.Integer(), nullable=False),
+    sa.Column('cards_count', sa.Integer(), nullable=False),
+    sa.Column('rounds_played', sa.Integer(), nullable=False),
+    sa.Column('exact_bids', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['player_id'], ['players.id'], ),
+    sa.PrimaryKeyConstraint('player_id', 'cards_count')
+    )
+    # Existing games are backfilled with: python -m app.stats rebuild
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('player_bid_stats')
+    op.drop_table('player_stats')
@@ -0,0 +1,39 @@
+"""Add composite indexes for hot queries
+
+Revision ID: 8d02dd5f642e
+Revises: 40b6af63dde8
+Create Date: 2026-10-17 06:04:00.714867
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d02dd5f642e'
+down_revision: Union[str, Sequence[str], None] = '40b6af63dde8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Fails if a game already has duplicate round numbers; those must be cleaned up first
+    op.create_index('ix_rounds_game_id_round_number', 'rounds', ['game_id', 'round_number'], unique=True)
+    op.create_index('ix_round_scores_round_id_player_id', 'round_scores', ['round_id', 'player_id'], unique=False)
+    op.create_index('ix_round_scores_player_id', 'round_scores', ['player_id'], unique=False)
+    op.create_index('ix_game_players_player_id', 'game_players', ['player_id'], unique=False)
+    op.create_index('ix_games_status_created_at', 'games', ['status', 'created_at'], unique=False)
+    op.create_index('ix_games_created_at_id', 'games', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_games_created_at_id', table_name='games')
+    op.drop_index('ix_games_status_created_at', table_name='games')
+    op.drop_index('ix_game_players_player_id', table_name='game_players')
+    op.drop_index('ix_round_scores_player_id', table_name='round_scores')
+    op.drop_index('ix_round_scores_round_id_player_id', table_name='round_scores')
+    op.drop_index('ix_rounds_game_id_round_number', table_name='rounds')
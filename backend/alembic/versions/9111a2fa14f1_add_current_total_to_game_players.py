@@ -0,0 +1,42 @@
+"""Add current total to game players
+
+Revision ID: 9111a2fa14f1
+Revises: dbef52d29c95
+Create Date: 2026-10-17 05:54:35.542774
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9111a2fa14f1'
+down_revision: Union[str, Sequence[str], None] = 'dbef52d29c95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('game_players', sa.Column('current_total', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill from each player's latest round score
+    op.execute("""
+        UPDATE game_players
+        SET current_total = COALESCE((
+            SELECT rs.running_total
+            FROM round_scores rs
+            JOIN rounds r ON r.id = rs.round_id
+            WHERE r.game_id = game_players.game_id
+              AND rs.player_id = game_players.player_id
+            ORDER BY r.round_number DESC
+            LIMIT 1
+        ), 0)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('game_players', 'current_total')
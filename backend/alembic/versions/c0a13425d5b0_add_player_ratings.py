@@ -0,0 +1,35 @@
+"""Add player ratings
+
+Revision ID: c0a13425d5b0
+Revises: 47c53556fae9
+Create Date: 2026-10-17 06:12:43.532249
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0a13425d5b0'
+down_revision: Union[str, Sequence[str], None] = '47c53556fae9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_game_results_completed_at'), 'game_results', ['completed_at'], unique=False)
+    op.add_column('players', sa.Column('rating', sa.Float(), server_default='1500', nullable=False))
+    op.add_column('players', sa.Column('rated_games', sa.Integer(), server_default='0', nullable=False))
+    op.create_index('ix_players_rating', 'players', ['rating'], unique=False)
+    # Existing games are rated with: python -m app.stats rebuild-ratings
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_players_rating', table_name='players')
+    op.drop_column('players', 'rated_games')
+    op.drop_column('players', 'rating')
+    op.drop_index(op.f('ix_game_results_completed_at'), table_name='game_results')
@@ -0,0 +1,32 @@
+"""Add lower name index for player search
+
+Revision ID: c7a51b5d2f2a
+Revises: c0a13425d5b0
+Create Date: 2026-10-17 06:16:16.207737
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7a51b5d2f2a'
+down_revision: Union[str, Sequence[str], None] = 'c0a13425d5b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # text_pattern_ops only exists on PostgreSQL
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index('ix_players_name_lower', 'players', [sa.text('lower(name) text_pattern_ops')], unique=False)
+    else:
+        op.create_index('ix_players_name_lower', 'players', [sa.text('lower(name)')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_players_name_lower', table_name='players')
@@ -0,0 +1,28 @@
+"""Index game results winner score
+
+Revision ID: dbef52d29c95
+Revises: 458d5906e0d7
+Create Date: 2026-10-17 05:54:09.250746
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dbef52d29c95'
+down_revision: Union[str, Sequence[str], None] = '458d5906e0d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_game_results_winner_score'), 'game_results', ['winner_score'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_game_results_winner_score'), table_name='game_results')
@@ -0,0 +1,40 @@
+"""Order game results by winner score
+
+Revision ID: e3b8c41f7a92
+Revises: c7a51b5d2f2a
+Create Date: 2026-10-17 14:12:40.518233
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b8c41f7a92'
+down_revision: Union[str, Sequence[str], None] = 'c7a51b5d2f2a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('game_results', sa.Column('created_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute(
+        "UPDATE game_results SET created_at = "
+        "(SELECT games.created_at FROM games WHERE games.id = game_results.game_id)"
+    )
+    # The composite index also serves winner score range filters
+    op.create_index(
+        'ix_game_results_winner_score_created_at', 'game_results',
+        ['winner_score', 'created_at', 'game_id'], unique=False
+    )
+    op.drop_index(op.f('ix_game_results_winner_score'), table_name='game_results')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_game_results_winner_score'), 'game_results', ['winner_score'], unique=False)
+    op.drop_index('ix_game_results_winner_score_created_at', table_name='game_results')
+    op.drop_column('game_results', 'created_at')
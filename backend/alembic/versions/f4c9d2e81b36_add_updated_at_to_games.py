@@ -0,0 +1,34 @@
+"""Add updated_at to games
+
+Revision ID: f4c9d2e81b36
+Revises: e3b8c41f7a92
+Create Date: 2026-10-17 18:03:21.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c9d2e81b36'
+down_revision: Union[str, Sequence[str], None] = 'e3b8c41f7a92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing games count as changed now, so cached history pages are revalidated once
+    op.add_column(
+        'games',
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False)
+    )
+    op.create_index(op.f('ix_games_updated_at'), 'games', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_games_updated_at'), table_name='games')
+    op.drop_column('games', 'updated_at')
@@ -0,0 +1,217 @@
+"""Fan-out of live game events to streaming clients."""
+
+import asyncio
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Set
+
+from sqlalchemy import make_url
+
+from .database import DATABASE_URL
+
+_CLOSED = object()
+
+
+class SubscriptionClosed(Exception):
+    """Raised by Subscription.get once the subscription has ended."""
+
+
+class BroadcastBackend(ABC):
+    """Transport that carries published messages to every worker process."""
+
+    @abstractmethod
+    async def start(self, broadcaster: "Broadcaster") -> None:
+        """
+        Start receiving messages.
+
+        Every message published by any worker must be handed to
+        broadcaster.deliver; if the transport fails, the backend calls
+        broadcaster.close_all so subscribers reconnect.
+        """
+
+    @abstractmethod
+    async def publish(self, channel: str, message: str) -> None:
+        """Send a message to every worker's subscribers of a channel."""
+
+
+class MemoryBroadcastBackend(BroadcastBackend):
+    """Delivers messages within this process only; enough for a single worker."""
+
+    def __init__(self):
+        self.broadcaster: Optional["Broadcaster"] = None
+
+    async def start(self, broadcaster: "Broadcaster") -> None:
+        self.broadcaster = broadcaster
+
+    async def publish(self, channel: str, message: str) -> None:
+        self.broadcaster.deliver(channel, message)
+
+
+class PostgresBroadcastBackend(BroadcastBackend):
+    """
+    Relays messages between worker processes with PostgreSQL LISTEN/NOTIFY.
+
+    Every worker listens on one notification channel on a dedicated asyncpg
+    connection; each payload starts with the broadcast channel name.
+    PostgreSQL limits payloads to 8000 bytes, plenty for one round.
+    """
+
+    def __init__(self, url: str, notify_channel: str = "boerenbridge_broadcast"):
+        # asyncpg takes a plain libpq URL without the SQLAlchemy driver suffix
+        self.dsn = make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.notify_channel = notify_channel
+        self.connection = None
+        self._lock = asyncio.Lock()
+
+    async def start(self, broadcaster: "Broadcaster") -> None:
+        import asyncpg
+
+        def on_notify(connection, pid, channel, payload):
+            broadcast_channel, _, message = payload.partition("\n")
+            broadcaster.deliver(broadcast_channel, message)
+
+        def on_terminate(connection):
+            if connection is self.connection:
+                self.connection = None
+                broadcaster.close_all()
+
+        # Restarting after a failure replaces the previous connection
+        previous, self.connection = self.connection, None
+        if previous is not None:
+            previous.terminate()
+        self.connection = await asyncpg.connect(self.dsn)
+        self.connection.add_termination_listener(on_terminate)
+        await self.connection.add_listener(self.notify_channel, on_notify)
+
+    async def publish(self, channel: str, message: str) -> None:
+        # One connection runs one query at a time
+        async with self._lock:
+            await self.connection.execute("SELECT pg_notify($1, $2)", self.notify_channel, f"{channel}\n{message}")
+
+
+class Subscription:
+    """Messages published to one channel, queued for one subscriber."""
+
+    def __init__(self, broadcaster: "Broadcaster", channel: str, max_pending: int):
+        self.broadcaster = broadcaster
+        self.channel = channel
+        self.max_pending = max_pending
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    def put(self, message: str) -> None:
+        """Queue a message, ending the subscription if the subscriber has fallen too far behind."""
+        if self.closed:
+            return
+        if self._queue.qsize() >= self.max_pending:
+            self.close()
+        else:
+            self._queue.put_nowait(message)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Wait for the next message, or return None after timeout seconds.
+
+        Raises:
+            SubscriptionClosed: Once the queued messages are drained after close
+        """
+        try:
+            message = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if message is _CLOSED:
+            raise SubscriptionClosed(self.channel)
+        return message
+
+    def close(self) -> None:
+        """Stop receiving messages; messages already queued can still be read."""
+        if not self.closed:
+            self.closed = True
+            self._queue.put_nowait(_CLOSED)
+            self.broadcaster.unsubscribe(self)
+
+
+class Broadcaster:
+    """
+    Publishes messages to channels and fans them out to local subscribers.
+
+    Each worker process keeps its own subscribers; the backend carries
+    messages between workers. A subscriber that falls more than max_pending
+    messages behind, or any backend failure, ends subscriptions, so clients
+    reconnect and start again from a fresh snapshot instead of silently
+    missing messages.
+    """
+
+    def __init__(self, backend: BroadcastBackend, max_pending: int = 100):
+        self.backend = backend
+        self.max_pending = max_pending
+        self.subscriptions: Dict[str, Set[Subscription]] = {}
+        self._started = False
+        self._start_lock = asyncio.Lock()
+
+    async def _ensure_started(self) -> None:
+        if self._started:
+            return
+        async with self._start_lock:
+            if not self._started:
+                await self.backend.start(self)
+                self._started = True
+
+    async def subscribe(self, channel: str) -> Subscription:
+        """Subscribe to a channel; close the subscription when done."""
+        await self._ensure_started()
+        subscription = Subscription(self, channel, self.max_pending)
+        self.subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self.subscriptions.get(subscription.channel)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self.subscriptions[subscription.channel]
+
+    async def publish(self, channel: str, message: str) -> None:
+        """
+        Publish a message to a channel's subscribers in every worker.
+
+        Publishing is best effort: the data is already committed, so a backend
+        failure ends all subscriptions instead of failing the caller.
+        """
+        try:
+            await self._ensure_started()
+            await self.backend.publish(channel, message)
+        except Exception:
+            self.close_all()
+
+    def deliver(self, channel: str, message: str) -> None:
+        """Hand a message from the backend to this worker's subscribers."""
+        for subscription in list(self.subscriptions.get(channel, ())):
+            subscription.put(message)
+
+    def close_all(self) -> None:
+        """End every subscription and restart the backend on next use."""
+        self._started = False
+        for subscriptions in list(self.subscriptions.values()):
+            for subscription in list(subscriptions):
+                subscription.close()
+
+    def stats(self) -> dict:
+        """Get the number of channels and subscribers in this worker."""
+        return {
+            "channels": len(self.subscriptions),
+            "subscribers": sum(len(subscriptions) for subscriptions in self.subscriptions.values()),
+        }
+
+
+def create_backend() -> BroadcastBackend:
+    """Get the broadcast backend selected by BROADCAST_BACKEND (memory or postgres)."""
+    if os.getenv("BROADCAST_BACKEND", "memory").lower() == "postgres":
+        return PostgresBroadcastBackend(os.getenv("BROADCAST_DATABASE_URL", DATABASE_URL))
+    return MemoryBroadcastBackend()
+
+
+broadcaster = Broadcaster(
+    create_backend(),
+    max_pending=int(os.getenv("BROADCAST_MAX_PENDING", "100")),
+)
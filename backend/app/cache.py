@@ -0,0 +1,193 @@
+"""Scoreboard caching keyed by game version."""
+
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from multiprocessing.managers import DictProxy, SyncManager
+from typing import Any, Hashable, MutableMapping, Optional
+
+import orjson
+
+
+class CacheBackend(ABC):
+    """Storage interface for cached values."""
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached values."""
+
+
+class LRUCacheBackend(CacheBackend):
+    """In-process LRU cache with a bounded size and TTL eviction."""
+
+    def __init__(self, max_size: int = 256, ttl: float = 300.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SharedMappingBackend(CacheBackend):
+    """
+    Cache stored in a mapping shared between worker processes.
+
+    Values are stored as JSON so any process can read them; datetimes come
+    back as ISO 8601 strings, which serialize the same way. A dict served by
+    CacheManager serves as a local stand-in for an external store such as
+    Redis. Once the store holds max_size entries, the entries closest to
+    expiring are evicted in one pass to make room.
+    """
+
+    def __init__(self, store: MutableMapping, max_size: int = 1024, ttl: float = 300.0):
+        self.store = store
+        self.max_size = max_size
+        self.ttl = ttl
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self.store.get(repr(key))
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at < time.time():
+            self.store.pop(repr(key), None)
+            return None
+        return orjson.loads(payload)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        key = repr(key)
+        if key not in self.store and len(self.store) >= self.max_size:
+            self.evict()
+        self.store[key] = (time.time() + self.ttl, orjson.dumps(value, option=orjson.OPT_UTC_Z))
+
+    def evict(self) -> None:
+        """Drop expired entries and the quarter of the rest closest to expiring."""
+        # Each store access is a round trip, so entries are read and evicted in bulk
+        entries = sorted(self.store.items(), key=lambda item: item[1][0])
+        now = time.time()
+        expired = sum(1 for _, (expires_at, _) in entries if expires_at < now)
+        for key, _ in entries[:max(expired, self.max_size // 4, 1)]:
+            self.store.pop(key, None)
+
+    def clear(self) -> None:
+        self.store.clear()
+
+
+class CacheManager(SyncManager):
+    """Serves the dict behind SharedMappingBackend to every worker process."""
+
+
+_shared_store: dict = {}
+CacheManager.register("get_store", callable=lambda: _shared_store, proxytype=DictProxy)
+
+
+def create_cache_manager() -> CacheManager:
+    """Get a CacheManager for SCOREBOARD_CACHE_ADDRESS (host:port) and SCOREBOARD_CACHE_AUTHKEY."""
+    host, _, port = os.getenv("SCOREBOARD_CACHE_ADDRESS", "127.0.0.1:50051").rpartition(":")
+    authkey = os.getenv("SCOREBOARD_CACHE_AUTHKEY", "boerenbridge")
+    return CacheManager(address=(host, int(port)), authkey=authkey.encode())
+
+
+class ScoreboardCache:
+    """
+    Scoreboard cache holding the latest cached version of each game, with hit/miss counters.
+
+    Entries are keyed by game ID and tagged with the game version, so
+    caching a new version replaces the older ones.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, game_id: int, version: int) -> Optional[dict]:
+        """Get a cached scoreboard for this version of the game."""
+        entry = self.backend.get(game_id)
+        scoreboard = entry[1] if entry is not None and entry[0] == version else None
+        with self._lock:
+            if scoreboard is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return scoreboard
+
+    def set(self, game_id: int, version: int, scoreboard: dict) -> None:
+        """Cache a scoreboard for this version of the game."""
+        self.backend.set(game_id, (version, scoreboard))
+
+    def clear(self) -> None:
+        """Drop all cached scoreboards and reset the counters."""
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Get hit and miss counters."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+def create_scoreboard_backend() -> CacheBackend:
+    """
+    Get the scoreboard cache backend selected by SCOREBOARD_CACHE_BACKEND.
+
+    "lru" (the default) keeps scoreboards in each worker. "shared" keeps them
+    in the CacheManager listening on SCOREBOARD_CACHE_ADDRESS, started with
+    python -m app.cache.
+    """
+    max_size = int(os.getenv("SCOREBOARD_CACHE_SIZE", "256"))
+    ttl = float(os.getenv("SCOREBOARD_CACHE_TTL", "300"))
+    if os.getenv("SCOREBOARD_CACHE_BACKEND", "lru").lower() == "shared":
+        manager = create_cache_manager()
+        manager.connect()
+        return SharedMappingBackend(manager.get_store(), max_size=max_size, ttl=ttl)
+    return LRUCacheBackend(max_size=max_size, ttl=ttl)
+
+
+scoreboard_cache = ScoreboardCache(create_scoreboard_backend())
+
+# Game history counts per filter combination, refreshed after the TTL
+history_count_cache = LRUCacheBackend(
+    max_size=128,
+    ttl=float(os.getenv("HISTORY_COUNT_CACHE_TTL", "30")),
+)
+
+
+if __name__ == "__main__":
+    # Serve the shared scoreboard store until interrupted
+    create_cache_manager().get_server().serve_forever()
@@ -1,11 +1,43 @@
 """Database CRUD operations for Boerenbridge application."""
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc, asc, and_, func
-from typing import List, Optional, Tuple
-from datetime import datetime
+from sqlalchemy.orm import Session, joinedload, contains_eager, noload
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import desc, asc, and_, case, delete, func, insert, literal, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from typing import List, NamedTuple, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import base64
+import json
+
+import numpy as np
 
 from . import models, schemas
+from .cache import scoreboard_cache, history_count_cache
+from .ratings import INITIAL_RATING, update_ratings
+
+# Window for ranking player search results by how often they played recently
+RECENT_PLAY_DAYS = 90
+
+
+@lru_cache(maxsize=None)
+def get_round_schedule(max_cards: int) -> Tuple[int, ...]:
+    """Cards dealt per round: 1 up to max_cards and back down to 1."""
+    return tuple(range(1, max_cards + 1)) + tuple(range(max_cards - 1, 0, -1))
+
+
+class GamePage(NamedTuple):
+    """A page of game history with keyset cursors to its neighbours."""
+    games: List[models.Game]
+    total_games: Optional[int]
+    next_cursor: Optional[str]
+    prev_cursor: Optional[str]
+
+
+class SubmittedRounds(NamedTuple):
+    """Rounds recorded by RoundCRUD.submit_rounds, with the game's length."""
+    rounds: List[dict]  # Shaped like schemas.RoundResponse
+    total_rounds: int
 
 
 class PlayerCRUD:
@@ -26,6 +58,35 @@ class PlayerCRUD:
         """Get all players with pagination."""
         return db.query(models.Player).order_by(models.Player.name).offset(skip).limit(limit).all()
 
+    @staticmethod
+    def search_players(db: Session, prefix: str, limit: int = 10) -> List[Tuple[models.Player, int]]:
+        """
+        Find players whose name starts with prefix, ignoring case.
+
+        Matches are ranked by the number of games they played in the last
+        RECENT_PLAY_DAYS days, then by name. Only matching players are
+        counted, and the prefix match uses the lower(name) index.
+
+        Returns:
+            (player, recent games) pairs
+        """
+        escaped = prefix.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        cutoff = datetime.now(timezone.utc) - timedelta(days=RECENT_PLAY_DAYS)
+        recent_games = (
+            select(func.count())
+            .select_from(models.GamePlayer)
+            .join(models.Game, models.Game.id == models.GamePlayer.game_id)
+            .where(models.GamePlayer.player_id == models.Player.id, models.Game.created_at >= cutoff)
+            .correlate(models.Player)
+            .scalar_subquery()
+        )
+        return db.execute(
+            select(models.Player, recent_games)
+            .where(func.lower(models.Player.name).like(escaped + "%", escape="\\"))
+            .order_by(desc(recent_games), models.Player.name)
+            .limit(limit)
+        ).tuples().all()
+
     @staticmethod
     def create_player(db: Session, player: schemas.PlayerCreate) -> models.Player:
         """Create a new player."""
@@ -82,33 +143,51 @@ class GameCRUD:
             .first()
         )
 
+    @staticmethod
+    def get_game_state(db: Session, game_id: int):
+        """Get a game's (version, status) row, or None if it doesn't exist."""
+        return db.execute(
+            select(models.Game.version, models.Game.status).where(models.Game.id == game_id)
+        ).first()
+
+    @staticmethod
+    def bump_version(game: models.Game) -> None:
+        """Increment a game's version atomically on the next flush."""
+        game.version = models.Game.version + 1
+        game.updated_at = models.utcnow()
+
     @staticmethod
     def update_game_status(db: Session, game_id: int, status: schemas.GameStatus) -> Optional[models.Game]:
-        """Update game status."""
+        """Update game status, recording the final standings when a game completes."""
         db_game = GameCRUD.get_game(db, game_id)
         if db_game:
             db_game.status = status
+            GameCRUD.bump_version(db_game)
+            if status == schemas.GameStatus.COMPLETED:
+                GameResultCRUD.record_result(db, db_game.id, db_game.created_at, db_game.game_players)
             db.commit()
             db.refresh(db_game)
         return db_game
 
     @staticmethod
-    def get_games_with_filters(
-        db: Session, 
-        filters: schemas.GameHistoryFilter
-    ) -> Tuple[List[models.Game], int]:
-        """Get games with filtering and pagination."""
-        query = db.query(models.Game).options(
-            joinedload(models.Game.game_players).joinedload(models.GamePlayer.player)
-        )
+    def apply_filters(query, filters: schemas.GameHistoryFilter):
+        """
+        Apply history filters to a games query or select.
 
-        # Apply filters
+        Winner score filters need the query to be joined to game_results.
+        """
         if filters.player_ids:
-            # Games that include ALL specified players
-            for player_id in filters.player_ids:
-                query = query.filter(
-                    models.Game.game_players.any(models.GamePlayer.player_id == player_id)
-                )
+            # Games that include ALL specified players, found in a single grouped
+            # pass over game_players; (game_id, player_id) is the primary key,
+            # so each matching row is a distinct player
+            player_ids = set(filters.player_ids)
+            games_with_players = (
+                select(models.GamePlayer.game_id)
+                .where(models.GamePlayer.player_id.in_(player_ids))
+                .group_by(models.GamePlayer.game_id)
+                .having(func.count() == len(player_ids))
+            )
+            query = query.filter(models.Game.id.in_(games_with_players))
 
         if filters.start_date:
             query = query.filter(models.Game.created_at >= filters.start_date)
@@ -118,23 +197,237 @@ class GameCRUD:
             end_date_inclusive = filters.end_date.replace(hour=23, minute=59, second=59)
             query = query.filter(models.Game.created_at <= end_date_inclusive)
 
+        # Winner score filters only match completed games with a stored result
+        if filters.min_winner_score is not None:
+            query = query.filter(models.GameResult.winner_score >= filters.min_winner_score)
+
+        if filters.max_winner_score is not None:
+            query = query.filter(models.GameResult.winner_score <= filters.max_winner_score)
+
+        return query
+
+    @staticmethod
+    def encode_cursor(game: models.Game, direction: str) -> str:
+        """Build an opaque cursor pointing before or after a game."""
+        payload = {"c": game.created_at.isoformat(), "i": game.id, "d": direction}
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int, str]:
+        """
+        Parse a cursor into (created_at, game_id, direction).
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded))
+            direction = payload["d"]
+            if direction not in ("next", "prev"):
+                raise ValueError(direction)
+            return datetime.fromisoformat(payload["c"]), int(payload["i"]), direction
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+
+    @staticmethod
+    def count_games(db: Session, filters: schemas.GameHistoryFilter) -> int:
+        """Count games matching the filters, cached briefly per filter combination."""
+        key = (
+            tuple(sorted(filters.player_ids or ())),
+            filters.start_date,
+            filters.end_date,
+            filters.min_winner_score,
+            filters.max_winner_score,
+        )
+        total = history_count_cache.get(key)
+        if total is None:
+            game_ids = GameCRUD.apply_filters(
+                select(models.Game.id).outerjoin(models.Game.result), filters
+            ).subquery()
+            total = db.execute(select(func.count()).select_from(game_ids)).scalar_one()
+            history_count_cache.set(key, total)
+        return total
+
+    @staticmethod
+    def get_last_update(db: Session, filters: schemas.GameHistoryFilter) -> Optional[datetime]:
+        """
+        Get when a game matching the filters was last created or changed.
+
+        Unfiltered, this reads one entry of the updated_at index.
+        """
+        query = select(func.max(models.Game.updated_at))
+        # Joining results unconditionally would keep the database from reading the index
+        if filters.min_winner_score is not None or filters.max_winner_score is not None:
+            query = query.join(models.Game.result)
+        return db.execute(GameCRUD.apply_filters(query, filters)).scalar_one()
+
+    @staticmethod
+    def get_games_with_filters(
+        db: Session, 
+        filters: schemas.GameHistoryFilter
+    ) -> GamePage:
+        """
+        Get games with filtering and pagination.
+
+        Date-sorted history can be paged with keyset cursors on
+        (created_at, id); the page number is used when no cursor is given.
+        Winner score ties are broken by creation date in the same direction,
+        and games that aren't completed always sort last.
+
+        Raises:
+            ValueError: If a cursor is malformed or used with winner score sorting
+        """
+        players = joinedload(models.Game.game_players).joinedload(models.GamePlayer.player)
+
         # Count total before pagination
-        total_games = query.count()
+        total_games = GameCRUD.count_games(db, filters) if filters.include_total else None
+
+        descending = filters.sort_order == "desc"
+        if filters.sort_by == "winner_score":
+            if filters.cursor:
+                raise ValueError("Cursor pagination is only supported when sorting by date")
+            skip = (filters.page - 1) * filters.page_size
+
+            # Completed games come first, read in the order of the
+            # (winner_score, created_at, game_id) index on game_results
+            order_func = desc if descending else asc
+            games = (
+                GameCRUD.apply_filters(
+                    db.query(models.Game)
+                    .join(models.Game.result)
+                    .options(players, contains_eager(models.Game.result)),
+                    filters
+                )
+                .order_by(
+                    order_func(models.GameResult.winner_score),
+                    order_func(models.GameResult.created_at),
+                    order_func(models.GameResult.game_id)
+                )
+                .offset(skip)
+                .limit(filters.page_size)
+                .all()
+            )
+
+            # Games that aren't completed have no result and fill the rest of
+            # the page, newest first; winner score filters never match them
+            remaining = filters.page_size - len(games)
+            if remaining and filters.min_winner_score is None and filters.max_winner_score is None:
+                completed = models.Game.status == models.GameStatus.COMPLETED
+                # Listing the other statuses lets the (status, created_at) index find them
+                not_completed = models.Game.status.in_(
+                    [status for status in models.GameStatus if status != models.GameStatus.COMPLETED]
+                )
+                offset = 0
+                if skip and not games:
+                    # Only a page past the last completed game needs to know how many came before
+                    offset = skip - GameCRUD.apply_filters(db.query(models.Game).filter(completed), filters).count()
+                games += (
+                    GameCRUD.apply_filters(
+                        db.query(models.Game).filter(not_completed).options(players, noload(models.Game.result)),
+                        filters
+                    )
+                    .order_by(desc(models.Game.created_at), desc(models.Game.id))
+                    .offset(offset)
+                    .limit(remaining)
+                    .all()
+                )
+            return GamePage(games, total_games, None, None)
+
+        query = GameCRUD.apply_filters(
+            db.query(models.Game)
+            .outerjoin(models.Game.result)
+            .options(players, contains_eager(models.Game.result)),
+            filters
+        )
+        key = tuple_(models.Game.created_at, models.Game.id)
+        direction = "next"
+        if filters.cursor:
+            created_at, game_id, direction = GameCRUD.decode_cursor(filters.cursor)
+            # Walking backwards reverses the sort so the nearest games come first
+            forward = descending == (direction == "next")
+            query = query.filter(key < (created_at, game_id) if forward else key > (created_at, game_id))
+            reverse = direction == "prev"
+        else:
+            reverse = False
+
+        order_func = desc if descending != reverse else asc
+        query = query.order_by(order_func(models.Game.created_at), order_func(models.Game.id))
+        if not filters.cursor:
+            query = query.offset((filters.page - 1) * filters.page_size)
+
+        # Fetch one extra game to learn whether another page follows
+        games = query.limit(filters.page_size + 1).all()
+        has_more = len(games) > filters.page_size
+        games = games[:filters.page_size]
+        if reverse:
+            games.reverse()
+
+        if not games:
+            return GamePage(games, total_games, None, None)
+
+        if direction == "prev":
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, bool(filters.cursor) or filters.page > 1
+        return GamePage(
+            games,
+            total_games,
+            GameCRUD.encode_cursor(games[-1], "next") if has_next else None,
+            GameCRUD.encode_cursor(games[0], "prev") if has_prev else None
+        )
 
-        # Apply sorting
-        if filters.sort_by == "date":
-            order_func = desc if filters.sort_order == "desc" else asc
-            query = query.order_by(order_func(models.Game.created_at))
-        elif filters.sort_by == "winner_score":
-            # This would require a complex subquery to get winner scores
-            # For now, default to date sorting
-            query = query.order_by(desc(models.Game.created_at))
+    @staticmethod
+    def get_export_rows_query(filters: schemas.GameHistoryFilter):
+        """
+        Select flat score rows for every game matching the filters.
 
-        # Apply pagination
-        skip = (filters.page - 1) * filters.page_size
-        games = query.offset(skip).limit(filters.page_size).all()
+        Rows are ordered by game, round and seat position. Games without
+        rounds have one row per player with empty round columns.
+        """
+        game_ids = GameCRUD.apply_filters(
+            select(models.Game.id).outerjoin(models.Game.result), filters
+        )
+        return (
+            select(
+                models.Game.id,
+                models.Game.created_at,
+                models.Game.status,
+                models.Game.max_cards,
+                models.GamePlayer.position,
+                models.Player.name,
+                models.Round.round_number,
+                models.Round.cards_count,
+                models.Round.dealer_position,
+                models.RoundScore.bid,
+                models.RoundScore.tricks_won,
+                models.RoundScore.score,
+                models.RoundScore.running_total,
+            )
+            .join(models.GamePlayer, models.GamePlayer.game_id == models.Game.id)
+            .join(models.Player, models.Player.id == models.GamePlayer.player_id)
+            .outerjoin(models.Round, models.Round.game_id == models.Game.id)
+            .outerjoin(
+                models.RoundScore,
+                and_(
+                    models.RoundScore.round_id == models.Round.id,
+                    models.RoundScore.player_id == models.GamePlayer.player_id
+                )
+            )
+            .where(models.Game.id.in_(game_ids))
+            .order_by(models.Game.id, models.Round.round_number, models.GamePlayer.position)
+        )
 
-        return games, total_games
+    @staticmethod
+    def iter_export_rows(db: Session, filters: schemas.GameHistoryFilter, batch_size: int = 1000):
+        """
+        Stream the export rows of get_export_rows_query.
+
+        Rows are fetched in batches through a server-side cursor where the
+        database supports it.
+        """
+        stmt = GameCRUD.get_export_rows_query(filters)
+        yield from db.execute(stmt, execution_options={"yield_per": batch_size})
 
 
 class RoundCRUD:
@@ -145,47 +438,253 @@ class RoundCRUD:
         db: Session, 
         game_id: int, 
         round_data: schemas.RoundDataSubmission
-    ) -> models.Round:
-        """Create a round with all player scores."""
-        # Create the round
-        db_round = models.Round(
-            game_id=game_id,
-            round_number=round_data.round_number,
-            cards_count=round_data.cards_count,
-            dealer_position=round_data.dealer_position
+    ) -> Optional[models.Round]:
+        """Record a round through submit_rounds and load it with its scores."""
+        submitted = RoundCRUD.submit_rounds(db, game_id, [round_data])
+        if submitted is None:
+            return None
+        return RoundCRUD.get_rounds(db, [submitted.rounds[0]["id"]])[0]
+
+    @staticmethod
+    def submit_rounds(
+        db: Session,
+        game_id: int,
+        rounds_data: List[schemas.RoundDataSubmission]
+    ) -> Optional[SubmittedRounds]:
+        """
+        Validate and record consecutive rounds of a game in one transaction.
+
+        Takes four statements. The active game's row is updated first: that
+        bumps its version, locks it against concurrent submissions, completes
+        it when the final round is among the rounds, and returns the header
+        the rounds are checked against, including the round schedule for
+        max_cards and the dealer rotation. One UPDATE then advances the
+        players' current totals and returns the seated players, and rounds
+        and scores are written with one multi-row INSERT each. The final
+        round also records the game's result from the returned players.
+
+        Returns:
+            The new rounds, or None if the game doesn't exist
+
+        Raises:
+            ValueError: If the rounds don't continue the game; nothing is written
+        """
+        # SQLite renders RETURNING columns without table names, subqueries included,
+        # so these filter on the game ID rather than correlate with the games row
+        rounds_played = (
+            select(func.count(models.Round.id))
+            .where(models.Round.game_id == game_id)
+            .scalar_subquery()
         )
-        db.add(db_round)
-        db.flush()  # Get the round ID without committing
+        num_players = (
+            select(func.count(models.GamePlayer.player_id))
+            .where(models.GamePlayer.game_id == game_id)
+            .scalar_subquery()
+        )
+        # A game has max_cards * 2 - 1 rounds; the rounds are validated before committing
+        last_round = rounds_data[-1].round_number
+        game = db.execute(
+            update(models.Game)
+            .where(models.Game.id == game_id, models.Game.status == models.GameStatus.ACTIVE)
+            .values(
+                version=models.Game.version + 1,
+                updated_at=models.utcnow(),
+                status=case(
+                    (
+                        models.Game.max_cards * 2 - 1 == last_round,
+                        literal(models.GameStatus.COMPLETED, models.Game.status.type)
+                    ),
+                    else_=models.Game.status
+                ),
+            )
+            .returning(
+                models.Game.max_cards,
+                models.Game.created_at,
+                rounds_played.label("rounds_played"),
+                num_players.label("num_players"),
+            )
+        ).first()
+        if game is None:
+            db.rollback()
+            if GameCRUD.get_game_state(db, game_id) is None:
+                return None
+            raise ValueError("Game is not active")
 
-        # Get previous round totals for running total calculation
-        previous_totals = RoundCRUD.get_running_totals(db, game_id, round_data.round_number - 1)
+        schedule = get_round_schedule(game.max_cards)
+        try:
+            # Rounds must continue directly from the last recorded round and follow the schedule
+            expected_round = game.rounds_played + 1
+            deltas = {}
+            for round_data in rounds_data:
+                number = round_data.round_number
+                if number != expected_round:
+                    raise ValueError(f"Expected round {expected_round}, got round {number}")
+                if number > len(schedule):
+                    raise ValueError(f"Round {number} exceeds total rounds ({len(schedule)})")
+                cards = schedule[number - 1]
+                if round_data.cards_count != cards:
+                    raise ValueError(f"Round {number} is dealt {cards} cards, got {round_data.cards_count}")
+                dealer = (number - 1) % game.num_players
+                if round_data.dealer_position != dealer:
+                    raise ValueError(
+                        f"Round {number} is dealt by position {dealer}, got {round_data.dealer_position}"
+                    )
+                if not round_data.validate_scores(game.num_players):
+                    raise ValueError(
+                        "Invalid round data: total tricks must equal cards count and all players must have scores"
+                    )
+                for score_data in round_data.scores:
+                    deltas[score_data.player_id] = deltas.get(score_data.player_id, 0) + \
+                        ScoreCalculator.calculate_score(score_data.bid, score_data.tricks_won)
+                expected_round += 1
 
-        # Create scores for each player
-        for score_data in round_data.scores:
-            # Calculate round score
-            round_score = ScoreCalculator.calculate_score(score_data.bid, score_data.tricks_won)
-            
-            # Calculate running total
-            previous_total = previous_totals.get(score_data.player_id, 0)
-            running_total = previous_total + round_score
-
-            db_score = models.RoundScore(
-                round_id=db_round.id,
-                player_id=score_data.player_id,
-                bid=score_data.bid,
-                tricks_won=score_data.tricks_won,
-                score=round_score,
-                running_total=running_total
+            # Advance current totals; the returned rows are the game's players. SQLite's
+            # RETURNING can't name joined tables, so player columns come from subqueries,
+            # whose unqualified player_id can only resolve to game_players.
+            def player_column(column):
+                return select(column).where(models.Player.id == models.GamePlayer.player_id).scalar_subquery()
+
+            seats = db.execute(
+                update(models.GamePlayer)
+                .where(models.GamePlayer.game_id == game_id)
+                .values(current_total=models.GamePlayer.current_total + case(
+                    deltas, value=models.GamePlayer.player_id, else_=0
+                ))
+                .returning(
+                    models.GamePlayer.player_id,
+                    models.GamePlayer.position,
+                    models.GamePlayer.current_total,
+                    player_column(models.Player.name).label("name"),
+                    player_column(models.Player.created_at).label("created_at"),
+                )
+            ).all()
+            game_player_ids = {row.player_id for row in seats}
+            for round_data in rounds_data:
+                if {score.player_id for score in round_data.scores} != game_player_ids:
+                    raise ValueError("Round scores must include all game players")
+
+            try:
+                round_ids = dict(db.execute(
+                    insert(models.Round).returning(models.Round.round_number, models.Round.id),
+                    [
+                        {
+                            "game_id": game_id,
+                            "round_number": round_data.round_number,
+                            "cards_count": round_data.cards_count,
+                            "dealer_position": round_data.dealer_position,
+                        }
+                        for round_data in rounds_data
+                    ]
+                ).all())
+            except IntegrityError:
+                # Another submission recorded these rounds after the header was read
+                raise ValueError(f"Round {rounds_data[0].round_number} has already been recorded")
+        except ValueError:
+            db.rollback()
+            raise
+
+        # Running totals carry forward from the totals before these rounds
+        totals = {row.player_id: row.current_total - deltas[row.player_id] for row in seats}
+        players = {
+            row.player_id: {"name": row.name, "id": row.player_id, "created_at": row.created_at}
+            for row in seats
+        }
+        rounds = []
+        score_rows = []
+        for round_data in rounds_data:
+            round_scores = []
+            for score_data in round_data.scores:
+                round_score = ScoreCalculator.calculate_score(score_data.bid, score_data.tricks_won)
+                totals[score_data.player_id] += round_score
+                cell = {
+                    "player_id": score_data.player_id,
+                    "bid": score_data.bid,
+                    "tricks_won": score_data.tricks_won,
+                    "score": round_score,
+                    "running_total": totals[score_data.player_id],
+                }
+                score_rows.append({"round_id": round_ids[round_data.round_number], **cell})
+                round_scores.append({**cell, "player": players[score_data.player_id]})
+            rounds.append({
+                "round_number": round_data.round_number,
+                "cards_count": round_data.cards_count,
+                "dealer_position": round_data.dealer_position,
+                "id": round_ids[round_data.round_number],
+                "game_id": game_id,
+                "round_scores": round_scores,
+            })
+
+        score_ids = {
+            (round_id, player_id): score_id
+            for round_id, player_id, score_id in db.execute(
+                insert(models.RoundScore).returning(
+                    models.RoundScore.round_id, models.RoundScore.player_id, models.RoundScore.id
+                ),
+                score_rows
             )
-            db.add(db_score)
+        }
+        for round_response in rounds:
+            for score in round_response["round_scores"]:
+                score["id"] = score_ids[(round_response["id"], score["player_id"])]
+
+        # The header UPDATE completed the game; record its result in the same transaction
+        if last_round == len(schedule):
+            GameResultCRUD.record_result(db, game_id, game.created_at, seats)
 
         db.commit()
-        db.refresh(db_round)
-        return db_round
+        return SubmittedRounds(rounds, len(schedule))
+
+    @staticmethod
+    def get_rounds(db: Session, round_ids: List[int]) -> List[models.Round]:
+        """Get rounds by ID with their scores."""
+        return (
+            db.query(models.Round)
+            .options(joinedload(models.Round.round_scores).joinedload(models.RoundScore.player))
+            .filter(models.Round.id.in_(round_ids))
+            .order_by(models.Round.round_number)
+            .all()
+        )
+
+    @staticmethod
+    def get_current_totals(db: Session, game_id: int) -> dict:
+        """Get running totals for all players after the latest round."""
+        results = (
+            db.query(models.GamePlayer.player_id, models.GamePlayer.current_total)
+            .filter(models.GamePlayer.game_id == game_id)
+            .all()
+        )
+        return {player_id: total for player_id, total in results}
+
+    @staticmethod
+    def audit_running_totals(db: Session, game_id: int) -> dict:
+        """
+        Compare stored current totals against totals recomputed from round scores.
+
+        Returns:
+            Mapping of player_id to (current_total, recomputed_total) for every
+            player whose stored total is out of step; empty when consistent
+        """
+        latest_round = (
+            db.query(func.max(models.Round.round_number))
+            .filter(models.Round.game_id == game_id)
+            .scalar()
+        ) or 0
+        recomputed = RoundCRUD.get_running_totals(db, game_id, latest_round)
+        current = RoundCRUD.get_current_totals(db, game_id)
+        return {
+            player_id: (total, recomputed.get(player_id, 0))
+            for player_id, total in current.items()
+            if total != recomputed.get(player_id, 0)
+        }
 
     @staticmethod
     def get_running_totals(db: Session, game_id: int, through_round: int) -> dict:
-        """Get running totals for all players through a specific round."""
+        """
+        Get running totals for all players through a specific round.
+
+        This recomputes totals from round scores and is meant for auditing;
+        use get_current_totals for the latest totals.
+        """
         if through_round <= 0:
             return {}
 
@@ -232,6 +731,325 @@ class RoundCRUD:
         )
 
 
+class GameResultCRUD:
+    """CRUD operations for the denormalized GameResult model."""
+
+    @staticmethod
+    def record_result(db: Session, game_id: int, created_at: datetime, seats) -> models.GameResult:
+        """
+        Store the final standings of a game without committing.
+
+        Args:
+            game_id: The completed game
+            created_at: When the game was created
+            seats: The game's players, as GamePlayer objects or rows with
+                player_id, position and current_total
+
+        Returns:
+            The new or updated GameResult
+        """
+        seats = sorted(seats, key=lambda seat: seat.position)
+        final_scores = [seat.current_total for seat in seats]
+        winner_id = ScoreCalculator.get_winner([(seat.player_id, seat.current_total) for seat in seats])
+
+        result = db.get(models.GameResult, game_id)
+        is_new = result is None
+        if is_new:
+            result = models.GameResult(game_id=game_id)
+            db.add(result)
+        result.final_scores = final_scores
+        result.winner_id = winner_id
+        result.winner_score = max(final_scores) if winner_id is not None else None
+        result.created_at = created_at
+        result.completed_at = func.now()
+
+        # A game only counts towards player statistics and ratings the first time it completes
+        if is_new:
+            PlayerStatsCRUD.record_games(db, [game_id])
+            PlayerRatingCRUD.record_games(db, [game_id])
+        return result
+
+
+class PlayerStatsCRUD:
+    """CRUD operations for the incrementally maintained PlayerStats model."""
+
+    @staticmethod
+    def record_games(db: Session, game_ids: List[int]) -> None:
+        """
+        Add completed games to their players' statistics without committing.
+
+        Only the rows of the given games are read; their totals are added to
+        the stats rows with an upsert, so concurrent completions don't lose
+        updates.
+        """
+        if not game_ids:
+            return
+
+        # Pending rounds and results of the completing games must be visible below
+        db.flush()
+        seats = db.execute(
+            select(
+                models.GamePlayer.player_id,
+                models.GamePlayer.game_id,
+                models.GamePlayer.current_total,
+                models.GameResult.winner_id,
+            )
+            .join(models.GameResult, models.GameResult.game_id == models.GamePlayer.game_id)
+            .where(models.GamePlayer.game_id.in_(game_ids))
+            .order_by(models.GamePlayer.game_id)
+        ).all()
+        bids = db.execute(
+            select(
+                models.RoundScore.player_id,
+                models.Round.cards_count,
+                func.count(),
+                func.sum(case((models.RoundScore.bid == models.RoundScore.tricks_won, 1), else_=0)),
+            )
+            .join(models.Round, models.Round.id == models.RoundScore.round_id)
+            .where(models.Round.game_id.in_(game_ids))
+            .group_by(models.RoundScore.player_id, models.Round.cards_count)
+        ).all()
+
+        stats = {}
+        for player_id, game_id, total, winner_id in seats:
+            row = stats.get(player_id)
+            if row is None:
+                row = stats[player_id] = {
+                    "player_id": player_id,
+                    "games_played": 0,
+                    "wins": 0,
+                    "total_score": 0,
+                    "rounds_played": 0,
+                    "exact_bids": 0,
+                    "best_score": total,
+                    "best_game_id": game_id,
+                    "worst_score": total,
+                    "worst_game_id": game_id,
+                }
+            row["games_played"] += 1
+            row["wins"] += int(winner_id == player_id)
+            row["total_score"] += total
+            # Ties keep the earlier game
+            if total > row["best_score"]:
+                row["best_score"], row["best_game_id"] = total, game_id
+            if total < row["worst_score"]:
+                row["worst_score"], row["worst_game_id"] = total, game_id
+        if not stats:
+            return
+
+        bid_rows = []
+        for player_id, cards_count, rounds_played, exact_bids in bids:
+            stats[player_id]["rounds_played"] += rounds_played
+            stats[player_id]["exact_bids"] += exact_bids
+            bid_rows.append({
+                "player_id": player_id,
+                "cards_count": cards_count,
+                "rounds_played": rounds_played,
+                "exact_bids": exact_bids,
+            })
+
+        dialect_insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+        table = models.PlayerStats.__table__
+        stmt = dialect_insert(table)
+        new = stmt.excluded
+        is_best = new.best_score > table.c.best_score
+        is_worst = new.worst_score < table.c.worst_score
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["player_id"],
+            set_={
+                "games_played": table.c.games_played + new.games_played,
+                "wins": table.c.wins + new.wins,
+                "total_score": table.c.total_score + new.total_score,
+                "rounds_played": table.c.rounds_played + new.rounds_played,
+                "exact_bids": table.c.exact_bids + new.exact_bids,
+                "best_score": case((is_best, new.best_score), else_=table.c.best_score),
+                "best_game_id": case((is_best, new.best_game_id), else_=table.c.best_game_id),
+                "worst_score": case((is_worst, new.worst_score), else_=table.c.worst_score),
+                "worst_game_id": case((is_worst, new.worst_game_id), else_=table.c.worst_game_id),
+            }
+        )
+        # Rows are locked in player order so concurrent completions can't deadlock
+        db.execute(stmt, [stats[player_id] for player_id in sorted(stats)])
+
+        if bid_rows:
+            bid_table = models.PlayerBidStats.__table__
+            bid_stmt = dialect_insert(bid_table)
+            bid_stmt = bid_stmt.on_conflict_do_update(
+                index_elements=["player_id", "cards_count"],
+                set_={
+                    "rounds_played": bid_table.c.rounds_played + bid_stmt.excluded.rounds_played,
+                    "exact_bids": bid_table.c.exact_bids + bid_stmt.excluded.exact_bids,
+                }
+            )
+            bid_rows.sort(key=lambda row: (row["player_id"], row["cards_count"]))
+            db.execute(bid_stmt, bid_rows)
+
+    @staticmethod
+    def rebuild(db: Session, batch_size: int = 1000) -> int:
+        """
+        Recompute all player statistics from completed games in one transaction.
+
+        Returns:
+            The number of games counted
+        """
+        db.execute(delete(models.PlayerBidStats))
+        db.execute(delete(models.PlayerStats))
+        game_ids = db.execute(
+            select(models.GameResult.game_id).order_by(models.GameResult.game_id)
+        ).scalars().all()
+        for start in range(0, len(game_ids), batch_size):
+            PlayerStatsCRUD.record_games(db, game_ids[start:start + batch_size])
+        db.commit()
+        return len(game_ids)
+
+    @staticmethod
+    def get_player_stats(db: Session, player: models.Player) -> schemas.PlayerStatsResponse:
+        """Get a player's statistics from the stats tables."""
+        stats = db.get(models.PlayerStats, player.id)
+        by_cards = db.execute(
+            select(models.PlayerBidStats)
+            .where(models.PlayerBidStats.player_id == player.id)
+            .order_by(models.PlayerBidStats.cards_count)
+        ).scalars().all()
+
+        def ratio(part: int, whole: int) -> Optional[float]:
+            return part / whole if whole else None
+
+        response = schemas.PlayerStatsResponse(
+            player_id=player.id,
+            player_name=player.name,
+            games_played=0,
+            wins=0,
+            bid_accuracy_by_cards=[
+                schemas.BidAccuracy(
+                    cards_count=row.cards_count,
+                    rounds_played=row.rounds_played,
+                    exact_bids=row.exact_bids,
+                    accuracy=ratio(row.exact_bids, row.rounds_played),
+                )
+                for row in by_cards
+            ]
+        )
+        if stats:
+            response.games_played = stats.games_played
+            response.wins = stats.wins
+            response.win_rate = ratio(stats.wins, stats.games_played)
+            response.average_score = ratio(stats.total_score, stats.games_played)
+            response.bid_accuracy = ratio(stats.exact_bids, stats.rounds_played)
+            response.best_game = schemas.GameHighlight(game_id=stats.best_game_id, final_score=stats.best_score)
+            response.worst_game = schemas.GameHighlight(game_id=stats.worst_game_id, final_score=stats.worst_score)
+        return response
+
+
+class PlayerRatingCRUD:
+    """CRUD operations for player ratings, see app/ratings.py for the rating model."""
+
+    @staticmethod
+    def get_rated_games_query(game_ids: Optional[List[int]] = None):
+        """Select final totals of completed games as flat rows in completion and seating order."""
+        query = (
+            select(models.GameResult.game_id, models.GamePlayer.player_id, models.GamePlayer.current_total)
+            .join(models.GamePlayer, models.GamePlayer.game_id == models.GameResult.game_id)
+            .order_by(models.GameResult.completed_at, models.GameResult.game_id, models.GamePlayer.position)
+        )
+        if game_ids is not None:
+            query = query.where(models.GameResult.game_id.in_(game_ids))
+        return query
+
+    @staticmethod
+    def record_games(db: Session, game_ids: List[int]) -> None:
+        """Update the ratings of the players of newly completed games without committing."""
+        if not game_ids:
+            return
+
+        # Pending results of the completing games must be visible below
+        db.flush()
+        games = {}
+        for game_id, player_id, total in db.execute(PlayerRatingCRUD.get_rated_games_query(game_ids)):
+            seats, totals = games.setdefault(game_id, ([], []))
+            seats.append(player_id)
+            totals.append(total)
+        if not games:
+            return
+
+        # Lock the players' ratings in ID order so concurrent completions apply in turn
+        player_ids = sorted({player_id for seats, _ in games.values() for player_id in seats})
+        players = db.execute(
+            select(models.Player)
+            .where(models.Player.id.in_(player_ids))
+            .order_by(models.Player.id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        ).scalars().all()
+        index = {player.id: i for i, player in enumerate(players)}
+
+        ratings = np.array([player.rating for player in players])
+        update_ratings(ratings, [
+            ([index[player_id] for player_id in seats], totals)
+            for seats, totals in games.values()
+        ])
+        for player, rating in zip(players, ratings):
+            player.rating = float(rating)
+        for seats, _ in games.values():
+            for player_id in seats:
+                players[index[player_id]].rated_games += 1
+
+    @staticmethod
+    def rebuild(db: Session, chunk_size: int = 10000) -> int:
+        """
+        Replay all completed games in completion order and store the ratings in one transaction.
+
+        Games are streamed from the database and rated in chunks, so memory
+        only grows with the number of players.
+
+        Returns:
+            The number of games rated
+        """
+        player_ids = db.execute(select(models.Player.id)).scalars().all()
+        index = {player_id: i for i, player_id in enumerate(player_ids)}
+        ratings = np.full(len(player_ids), INITIAL_RATING)
+        rated_games = np.zeros(len(player_ids), dtype=np.int64)
+
+        rows = db.execute(
+            PlayerRatingCRUD.get_rated_games_query(),
+            execution_options={"yield_per": chunk_size * 4}
+        )
+        games = []
+        current_game = None
+        game_count = 0
+        for game_id, player_id, total in rows:
+            if game_id != current_game:
+                if len(games) >= chunk_size:
+                    update_ratings(ratings, games)
+                    games = []
+                games.append(([], []))
+                current_game = game_id
+                game_count += 1
+            games[-1][0].append(index[player_id])
+            games[-1][1].append(total)
+            rated_games[index[player_id]] += 1
+        update_ratings(ratings, games)
+
+        if player_ids:
+            db.execute(update(models.Player), [
+                {"id": player_id, "rating": float(rating), "rated_games": int(count)}
+                for player_id, rating, count in zip(player_ids, ratings, rated_games)
+            ])
+        db.commit()
+        return game_count
+
+    @staticmethod
+    def get_leaderboard(db: Session, limit: int = 50, min_games: int = 1) -> List[models.Player]:
+        """Get the highest rated players with at least min_games rated games."""
+        return (
+            db.query(models.Player)
+            .filter(models.Player.rated_games >= min_games)
+            .order_by(desc(models.Player.rating), models.Player.id)
+            .limit(limit)
+            .all()
+        )
+
+
 class ScoreCalculator:
     """Utility class for score calculations."""
 
@@ -273,72 +1091,221 @@ class ScoreboardService:
 
     @staticmethod
     def get_scoreboard(db: Session, game_id: int) -> Optional[schemas.ScoreboardResponse]:
-        """Generate complete scoreboard for a game."""
-        game = GameCRUD.get_game(db, game_id)
-        if not game:
+        """Get the scoreboard for a game as a validated model."""
+        data = ScoreboardService.get_scoreboard_data(db, game_id)
+        return schemas.ScoreboardResponse.model_validate(data) if data else None
+
+    @staticmethod
+    def get_scoreboard_data(db: Session, game_id: int, header: Optional[list] = None) -> Optional[dict]:
+        """Get the scoreboard for a game as plain data, served from cache for unchanged versions."""
+        if header is None:
+            header = ScoreboardService.get_scoreboard_header(db, game_id)
+        if not header:
             return None
 
-        # Get game players sorted by position
-        players = sorted(game.game_players, key=lambda gp: gp.position)
-        total_rounds = (game.max_cards * 2) - 1
-
-        # Get all rounds
-        rounds = RoundCRUD.get_game_rounds(db, game_id)
-        current_round = len(rounds) + 1 if len(rounds) < total_rounds else total_rounds
-
-        # Build player scoreboard data
-        player_scoreboard_data = []
-        final_totals = []
-
-        for game_player in players:
-            player_rounds = [None] * total_rounds
-            final_total = 0
-
-            # Fill in completed rounds
-            for round_obj in rounds:
-                round_index = round_obj.round_number - 1
-                
-                # Find this player's score for this round
-                player_score = next(
-                    (rs for rs in round_obj.round_scores if rs.player_id == game_player.player_id),
-                    None
-                )
-                
-                if player_score:
-                    player_rounds[round_index] = schemas.RoundScoreResponse(
-                        id=player_score.id,
-                        player_id=player_score.player_id,
-                        bid=player_score.bid,
-                        tricks_won=player_score.tricks_won,
-                        score=player_score.score,
-                        running_total=player_score.running_total,
-                        player=schemas.PlayerResponse(
-                            id=game_player.player.id,
-                            name=game_player.player.name,
-                            created_at=game_player.player.created_at
-                        )
-                    )
-                    final_total = player_score.running_total
+        version = header[0].version
+        scoreboard = scoreboard_cache.get(game_id, version)
+        if scoreboard is None:
+            scoreboard = ScoreboardService.build_scoreboard(db, game_id, header)
+            if scoreboard:
+                scoreboard_cache.set(game_id, version, scoreboard)
+        return scoreboard
 
-            player_scoreboard_data.append(schemas.PlayerScoreboardData(
-                player_id=game_player.player_id,
-                player_name=game_player.player.name,
-                position=game_player.position,
-                rounds=player_rounds,
-                final_total=final_total
-            ))
-            final_totals.append((game_player.player_id, final_total))
+    @staticmethod
+    def get_scoreboard_header(db: Session, game_id: int) -> list:
+        """Get game settings, version, status and progress, and players in position order as flat rows."""
+        rounds_played = (
+            select(func.count(models.Round.id))
+            .where(models.Round.game_id == models.Game.id)
+            .correlate(models.Game)
+            .scalar_subquery()
+        )
+        return db.execute(
+            select(
+                models.Game.max_cards,
+                models.Game.version,
+                models.Game.status,
+                rounds_played.label("rounds_played"),
+                models.GamePlayer.player_id,
+                models.GamePlayer.position,
+                models.GamePlayer.current_total,
+                models.Player.name,
+                models.Player.created_at,
+            )
+            .join(models.GamePlayer, models.GamePlayer.game_id == models.Game.id)
+            .join(models.Player, models.Player.id == models.GamePlayer.player_id)
+            .where(models.Game.id == game_id)
+            .order_by(models.GamePlayer.position)
+        ).all()
+
+    @staticmethod
+    def build_scoreboard(
+        db: Session,
+        game_id: int,
+        header: Optional[list] = None
+    ) -> Optional[dict]:
+        """
+        Generate complete scoreboard for a game.
+
+        All round scores are fetched as flat rows with a single select and
+        placed into a preallocated players x rounds matrix in one pass. The
+        result is plain data shaped like schemas.ScoreboardResponse; it comes
+        straight from the database, so it is not validated again.
+        """
+        if header is None:
+            header = ScoreboardService.get_scoreboard_header(db, game_id)
+        if not header:
+            return None
+
+        max_cards = header[0].max_cards
+        total_rounds = (max_cards * 2) - 1
+
+        # One shared player dict per player, reused by every cell
+        players = [
+            {"name": row.name, "id": row.player_id, "created_at": row.created_at}
+            for row in header
+        ]
+        player_index = {row.player_id: index for index, row in enumerate(header)}
+        matrix = [[None] * total_rounds for _ in players]
+        final_totals = [0] * len(players)
+        rounds_played = set()
+
+        rows = db.execute(
+            select(
+                models.Round.round_number,
+                models.RoundScore.player_id,
+                models.RoundScore.bid,
+                models.RoundScore.tricks_won,
+                models.RoundScore.score,
+                models.RoundScore.running_total,
+                models.RoundScore.id,
+            )
+            .join(models.Round, models.Round.id == models.RoundScore.round_id)
+            .where(models.Round.game_id == game_id)
+            .order_by(models.Round.round_number)
+        )
+        for round_number, player_id, bid, tricks_won, score, running_total, score_id in rows:
+            index = player_index.get(player_id)
+            if index is None or not 1 <= round_number <= total_rounds:
+                continue
+            matrix[index][round_number - 1] = {
+                "player_id": player_id,
+                "bid": bid,
+                "tricks_won": tricks_won,
+                "id": score_id,
+                "score": score,
+                "running_total": running_total,
+                "player": players[index],
+            }
+            final_totals[index] = running_total
+            rounds_played.add(round_number)
+
+        player_scoreboard_data = [
+            {
+                "player_id": row.player_id,
+                "player_name": row.name,
+                "position": row.position,
+                "rounds": matrix[index],
+                "final_total": final_totals[index],
+            }
+            for index, row in enumerate(header)
+        ]
 
         # Determine winner if game is complete
-        is_complete = len(rounds) == total_rounds
-        winner_id = ScoreCalculator.get_winner(final_totals) if is_complete else None
-
-        return schemas.ScoreboardResponse(
-            game_id=game_id,
-            max_cards=game.max_cards,
-            total_rounds=total_rounds,
-            current_round=current_round,
-            players=player_scoreboard_data,
-            is_complete=is_complete,
-            winner_id=winner_id
+        played = len(rounds_played)
+        current_round = played + 1 if played < total_rounds else total_rounds
+        is_complete = played == total_rounds
+        winner_id = (
+            ScoreCalculator.get_winner([(row.player_id, total) for row, total in zip(header, final_totals)])
+            if is_complete else None
         )
+
+        return {
+            "game_id": game_id,
+            "max_cards": max_cards,
+            "total_rounds": total_rounds,
+            "current_round": current_round,
+            "players": player_scoreboard_data,
+            "is_complete": is_complete,
+            "winner_id": winner_id,
+        }
+
+    @staticmethod
+    def build_scoreboard_delta(
+        db: Session,
+        game_id: int,
+        since_round: int,
+        header: Optional[list] = None
+    ) -> Optional[dict]:
+        """
+        Get the rounds after since_round with the current standings.
+
+        Only the scores of those rounds are fetched; totals come from the
+        players' maintained current totals, so a poll that finds one new
+        round costs one cell per player instead of the whole matrix. The
+        result is plain data shaped like schemas.ScoreboardDelta.
+        """
+        if header is None:
+            header = ScoreboardService.get_scoreboard_header(db, game_id)
+        if not header:
+            return None
+
+        total_rounds = (header[0].max_cards * 2) - 1
+        players = {
+            row.player_id: {"name": row.name, "id": row.player_id, "created_at": row.created_at}
+            for row in header
+        }
+        seats = {row.player_id: seat for seat, row in enumerate(header)}
+
+        rounds = []
+        rows = db.execute(
+            select(
+                models.Round.round_number,
+                models.Round.cards_count,
+                models.Round.dealer_position,
+                models.RoundScore.player_id,
+                models.RoundScore.bid,
+                models.RoundScore.tricks_won,
+                models.RoundScore.score,
+                models.RoundScore.running_total,
+                models.RoundScore.id,
+            )
+            .join(models.Round, models.Round.id == models.RoundScore.round_id)
+            .where(models.Round.game_id == game_id, models.Round.round_number > since_round)
+            .order_by(models.Round.round_number)
+        )
+        for round_number, cards_count, dealer_position, player_id, bid, tricks_won, score, running_total, score_id in rows:
+            if player_id not in seats:
+                continue
+            if not rounds or rounds[-1]["round_number"] != round_number:
+                rounds.append({
+                    "round_number": round_number,
+                    "cards_count": cards_count,
+                    "dealer_position": dealer_position,
+                    "scores": [],
+                })
+            rounds[-1]["scores"].append({
+                "player_id": player_id,
+                "bid": bid,
+                "tricks_won": tricks_won,
+                "id": score_id,
+                "score": score,
+                "running_total": running_total,
+                "player": players[player_id],
+            })
+        for round_data in rounds:
+            round_data["scores"].sort(key=lambda cell: seats[cell["player_id"]])
+
+        played = header[0].rounds_played
+        is_complete = played == total_rounds
+        totals = [(row.player_id, row.current_total) for row in header]
+        return {
+            "game_id": game_id,
+            "since_round": since_round,
+            "total_rounds": total_rounds,
+            "current_round": played + 1 if played < total_rounds else total_rounds,
+            "rounds": rounds,
+            "totals": [{"player_id": player_id, "final_total": total} for player_id, total in totals],
+            "is_complete": is_complete,
+            "winner_id": ScoreCalculator.get_winner(totals) if is_complete else None,
+        }
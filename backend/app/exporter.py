@@ -0,0 +1,162 @@
+"""Streaming export of game history as NDJSON or CSV.
+
+NDJSON records use the same shape as the importer's input, so an export can
+be loaded into another database with `python -m app.importer`. CSV rows use
+the importer's columns plus each round's score and running total.
+"""
+
+import csv
+import io
+import json
+from typing import AsyncIterator, Iterable, Iterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from . import crud, schemas
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# Rows fetched per batch from the database
+EXPORT_BATCH_ROWS = 1000
+
+CSV_COLUMNS = (
+    "game", "created_at", "max_cards", "round_number", "player",
+    "bid", "tricks_won", "score", "running_total",
+)
+
+# Rows buffered before a CSV chunk is sent
+CSV_CHUNK_ROWS = 1000
+
+
+def group_games(rows: Iterable) -> Iterator[dict]:
+    """Group flat export rows (ordered by game, round, position) into game records."""
+    game = None
+    for row in rows:
+        if game is None or game["id"] != row.id:
+            if game is not None:
+                yield game
+            game = {
+                "id": row.id,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+                "status": row.status.value,
+                "max_cards": row.max_cards,
+                "players": [],
+                "rounds": [],
+            }
+
+        if row.round_number is None:
+            game["players"].append(row.name)
+            continue
+
+        if not game["rounds"] or game["rounds"][-1]["round_number"] != row.round_number:
+            game["rounds"].append({
+                "round_number": row.round_number,
+                "cards_count": row.cards_count,
+                "dealer_position": row.dealer_position,
+                "bids": [],
+                "tricks": [],
+                "scores": [],
+            })
+        if len(game["rounds"]) == 1:
+            game["players"].append(row.name)
+
+        round_data = game["rounds"][-1]
+        round_data["bids"].append(row.bid)
+        round_data["tricks"].append(row.tricks_won)
+        round_data["scores"].append(row.score)
+
+    if game is not None:
+        yield game
+
+
+def stream_ndjson(rows: Iterable) -> Iterator[str]:
+    """Serialize one game per line."""
+    for game in group_games(rows):
+        yield json.dumps(game) + "\n"
+
+
+def stream_csv(rows: Iterable, header: bool = True) -> Iterator[str]:
+    """Serialize one line per player per round, in chunks."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(CSV_COLUMNS)
+
+    pending = 0
+    for row in rows:
+        if row.round_number is None:
+            continue
+        writer.writerow((
+            row.id,
+            row.created_at.isoformat() if row.created_at else "",
+            row.max_cards,
+            row.round_number,
+            row.name,
+            row.bid,
+            row.tricks_won,
+            row.score,
+            row.running_total,
+        ))
+        pending += 1
+        if pending >= CSV_CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    yield buffer.getvalue()
+
+
+def stream_export(db: Session, filters: schemas.GameHistoryFilter, file_format: str) -> Iterator[str]:
+    """
+    Stream every game matching the filters, closing the session when done.
+
+    The session is handed over by the request because the response body is
+    produced after the request's dependencies have exited.
+    """
+    try:
+        rows = crud.GameCRUD.iter_export_rows(db, filters, EXPORT_BATCH_ROWS)
+        if file_format == "csv":
+            yield from stream_csv(rows)
+        else:
+            yield from stream_ndjson(rows)
+    finally:
+        db.close()
+
+
+async def stream_export_async(
+    db: AsyncSession,
+    filters: schemas.GameHistoryFilter,
+    file_format: str
+) -> AsyncIterator[str]:
+    """
+    Stream every game matching the filters through an async session, closing it when done.
+
+    Rows arrive in batches; the rows of the last game in a batch are held
+    back until the next one, so every batch is serialized as whole games.
+    """
+    def serialize(rows, header):
+        return stream_csv(rows, header) if file_format == "csv" else stream_ndjson(rows)
+
+    try:
+        result = await db.stream(
+            crud.GameCRUD.get_export_rows_query(filters),
+            execution_options={"yield_per": EXPORT_BATCH_ROWS}
+        )
+        header = True
+        pending = []
+        async for batch in result.partitions():
+            rows = pending + list(batch)
+            split = len(rows)
+            while split > 0 and rows[split - 1].id == rows[-1].id:
+                split -= 1
+            rows, pending = rows[:split], rows[split:]
+            if rows:
+                for chunk in serialize(rows, header):
+                    yield chunk
+                header = False
+        for chunk in serialize(pending, header):
+            yield chunk
+    finally:
+        await db.close()
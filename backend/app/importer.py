@@ -0,0 +1,359 @@
+"""Bulk import of historical games from NDJSON or CSV.
+
+Records are parsed lazily and written in chunks, so memory stays bounded
+regardless of the input size.
+
+NDJSON: one game per line, matching schemas.GameImportRecord:
+    {"players": ["Alice", "Bob", "Carol"], "max_cards": 5, "created_at": "2024-03-01",
+     "rounds": [{"bids": [1, 0, 0], "tricks": [1, 0, 0]}, ...]}
+
+CSV: one row per player per round, with the rows of each game kept together:
+    game,created_at,max_cards,round_number,player,bid,tricks_won
+
+Usage: python -m app.importer games.ndjson [--format csv] [--chunk-size 500]
+"""
+
+import argparse
+import csv
+import json
+import sys
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from . import models, schemas
+from .crud import PlayerRatingCRUD, PlayerStatsCRUD, ScoreCalculator, get_round_schedule
+
+CHUNK_SIZE = 500
+MAX_REPORTED_ERRORS = 100
+
+CSV_COLUMNS = ("game", "created_at", "max_cards", "round_number", "player", "bid", "tricks_won")
+
+
+def detect_format(filename: Optional[str]) -> str:
+    """Guess the record format from a file name, defaulting to NDJSON."""
+    return "csv" if filename and filename.lower().endswith(".csv") else "ndjson"
+
+
+def read_records(lines: Iterable[str], file_format: str) -> Iterator[Tuple[int, dict]]:
+    """Parse raw game records as (line number, record) pairs."""
+    if file_format == "csv":
+        return read_csv(lines)
+    return read_ndjson(lines)
+
+
+def read_ndjson(lines: Iterable[str]) -> Iterator[Tuple[int, dict]]:
+    """Parse one JSON game record per line, skipping blank lines."""
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, {"_error": f"Invalid JSON: {e.msg}"}
+
+
+def read_csv(lines: Iterable[str]) -> Iterator[Tuple[int, dict]]:
+    """Group consecutive CSV rows of the same game into game records."""
+    reader = csv.DictReader(lines)
+    missing = set(CSV_COLUMNS) - set(reader.fieldnames or ())
+    if missing:
+        yield 1, {"_error": f"Missing CSV columns: {', '.join(sorted(missing))}"}
+        return
+
+    current_key = None
+    start_line = 0
+    game: dict = {}
+    rounds: Dict[int, Dict[str, Tuple[str, str]]] = {}
+
+    def build() -> dict:
+        players = list(rounds[min(rounds)]) if rounds else []
+        game["players"] = players
+        game["rounds"] = [
+            {
+                "bids": [rounds[number].get(player, (None, None))[0] for player in players],
+                "tricks": [rounds[number].get(player, (None, None))[1] for player in players],
+            }
+            for number in sorted(rounds)
+        ]
+        return game
+
+    for row in reader:
+        if row["game"] != current_key:
+            if current_key is not None:
+                yield start_line, build()
+            current_key = row["game"]
+            start_line = reader.line_num
+            game = {"max_cards": row["max_cards"], "created_at": row["created_at"] or None}
+            rounds = {}
+        try:
+            round_number = int(row["round_number"])
+        except ValueError:
+            game["_error"] = f"Invalid round number on line {reader.line_num}"
+            continue
+        rounds.setdefault(round_number, {})[row["player"]] = (row["bid"], row["tricks_won"])
+
+    if current_key is not None:
+        yield start_line, build()
+
+
+def validate_record(raw: dict) -> schemas.GameImportRecord:
+    """Validate a raw record against the game rules."""
+    if "_error" in raw:
+        raise ValueError(raw["_error"])
+
+    record = schemas.GameImportRecord.model_validate(raw)
+    num_players = len(record.players)
+    if len(set(record.players)) != num_players:
+        raise ValueError("Player names must be unique within a game")
+    if record.max_cards > 52 // num_players:
+        raise ValueError(f"Maximum cards ({record.max_cards}) exceeds limit for {num_players} players")
+
+    schedule = get_round_schedule(record.max_cards)
+    if len(record.rounds) > len(schedule):
+        raise ValueError(f"Game has {len(record.rounds)} rounds, expected at most {len(schedule)}")
+
+    for index, round_data in enumerate(record.rounds):
+        round_number = index + 1
+        if len(round_data.bids) != num_players or len(round_data.tricks) != num_players:
+            raise ValueError(f"Round {round_number} must have a bid and tricks for every player")
+        if round_data.cards_count is None:
+            round_data.cards_count = schedule[index]
+        elif round_data.cards_count != schedule[index]:
+            raise ValueError(
+                f"Round {round_number} is dealt {schedule[index]} cards, got {round_data.cards_count}"
+            )
+        if round_data.dealer_position is None:
+            round_data.dealer_position = index % num_players
+        if round_data.dealer_position >= num_players:
+            raise ValueError(f"Round {round_number} dealer position exceeds number of players")
+        if min(round_data.bids + round_data.tricks) < 0:
+            raise ValueError(f"Round {round_number} has a negative bid or trick count")
+        if sum(round_data.tricks) != round_data.cards_count:
+            raise ValueError(f"Round {round_number} tricks must sum to {round_data.cards_count}")
+
+    return record
+
+
+def upsert_players(db: Session, names: Set[str]) -> Tuple[Dict[str, int], int]:
+    """
+    Get player IDs by name, creating missing players in bulk.
+
+    Returns:
+        Mapping of name to player ID, and the number of players created
+    """
+    player_ids = dict(
+        db.execute(select(models.Player.name, models.Player.id).where(models.Player.name.in_(names))).all()
+    )
+    missing = names - player_ids.keys()
+    if not missing:
+        return player_ids, 0
+
+    dialect = db.get_bind().dialect.name
+    rows = [{"name": name} for name in sorted(missing)]
+    if dialect in ("postgresql", "sqlite"):
+        # Only inserted rows are returned, not names another import created first
+        dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        inserted = dict(db.execute(
+            dialect_insert(models.Player)
+            .on_conflict_do_nothing(index_elements=["name"])
+            .returning(models.Player.name, models.Player.id),
+            rows
+        ).all())
+        created = len(inserted)
+    else:
+        # A plain INSERT either creates every missing player or fails
+        db.execute(insert(models.Player), rows)
+        inserted = {}
+        created = len(missing)
+
+    player_ids.update(inserted)
+    remaining = missing - inserted.keys()
+    if remaining:
+        player_ids.update(
+            db.execute(select(models.Player.name, models.Player.id).where(models.Player.name.in_(remaining))).all()
+        )
+    return player_ids, created
+
+
+def import_chunk(db: Session, records: List[schemas.GameImportRecord], result: schemas.ImportResult) -> None:
+    """Write a chunk of validated games with one multi-row INSERT per table and commit."""
+    player_ids, created = upsert_players(db, {name for record in records for name in record.players})
+    now = datetime.now(timezone.utc)
+
+    # Score every game in memory first
+    scored = []
+    for record in records:
+        totals = [0] * len(record.players)
+        round_scores = []
+        for round_data in record.rounds:
+            scores = []
+            for index, (bid, tricks_won) in enumerate(zip(round_data.bids, round_data.tricks)):
+                score = ScoreCalculator.calculate_score(bid, tricks_won)
+                totals[index] += score
+                scores.append((bid, tricks_won, score, totals[index]))
+            round_scores.append(scores)
+        is_complete = len(record.rounds) == (record.max_cards * 2) - 1
+        scored.append((record, round_scores, totals, is_complete))
+
+    # Ordered RETURNING is batched on PostgreSQL; SQLite falls back to one row per statement
+    game_ids = db.execute(
+        insert(models.Game).returning(models.Game.id, sort_by_parameter_order=True),
+        [
+            {
+                "created_at": record.created_at or now,
+                "max_cards": record.max_cards,
+                "status": models.GameStatus.COMPLETED if is_complete else models.GameStatus.ABANDONED,
+                "version": 1,
+            }
+            for record, _, _, is_complete in scored
+        ]
+    ).scalars().all()
+
+    game_player_rows = []
+    round_rows = []
+    result_rows = []
+    for game_id, (record, _, totals, is_complete) in zip(game_ids, scored):
+        seats = [player_ids[name] for name in record.players]
+        for position, (player_id, total) in enumerate(zip(seats, totals)):
+            game_player_rows.append({
+                "game_id": game_id,
+                "player_id": player_id,
+                "position": position,
+                "current_total": total,
+            })
+        for round_number, round_data in enumerate(record.rounds, start=1):
+            round_rows.append({
+                "game_id": game_id,
+                "round_number": round_number,
+                "cards_count": round_data.cards_count,
+                "dealer_position": round_data.dealer_position,
+            })
+        if is_complete:
+            winner_id = ScoreCalculator.get_winner(list(zip(seats, totals)))
+            result_rows.append({
+                "game_id": game_id,
+                "winner_id": winner_id,
+                "winner_score": max(totals),
+                "final_scores": totals,
+                "completed_at": record.created_at or now,
+                "created_at": record.created_at or now,
+            })
+
+    db.execute(insert(models.GamePlayer), game_player_rows)
+
+    round_ids = {}
+    if round_rows:
+        round_ids = {
+            (game_id, round_number): round_id
+            for game_id, round_number, round_id in db.execute(
+                insert(models.Round).returning(
+                    models.Round.game_id, models.Round.round_number, models.Round.id
+                ),
+                round_rows
+            )
+        }
+
+    score_rows = []
+    for game_id, (record, round_scores, _, _) in zip(game_ids, scored):
+        seats = [player_ids[name] for name in record.players]
+        for round_number, scores in enumerate(round_scores, start=1):
+            round_id = round_ids[(game_id, round_number)]
+            for player_id, (bid, tricks_won, score, running_total) in zip(seats, scores):
+                score_rows.append({
+                    "round_id": round_id,
+                    "player_id": player_id,
+                    "bid": bid,
+                    "tricks_won": tricks_won,
+                    "score": score,
+                    "running_total": running_total,
+                })
+    if score_rows:
+        db.execute(insert(models.RoundScore), score_rows)
+    if result_rows:
+        db.execute(insert(models.GameResult), result_rows)
+        completed_ids = [row["game_id"] for row in result_rows]
+        PlayerStatsCRUD.record_games(db, completed_ids)
+        PlayerRatingCRUD.record_games(db, completed_ids)
+
+    db.commit()
+    result.games_imported += len(records)
+    result.rounds_imported += len(round_rows)
+    result.players_created += created
+
+
+def import_games(
+    db: Session,
+    rows: Iterable[Tuple[int, dict]],
+    chunk_size: int = CHUNK_SIZE,
+    progress: Optional[Callable[[schemas.ImportResult], None]] = None
+) -> schemas.ImportResult:
+    """
+    Import raw game records in chunks.
+
+    Invalid records are skipped and reported with their line number; each
+    chunk of valid games is committed on its own.
+    """
+    result = schemas.ImportResult(games_imported=0, rounds_imported=0, players_created=0, errors=[])
+    chunk: List[schemas.GameImportRecord] = []
+
+    for line, raw in rows:
+        try:
+            chunk.append(validate_record(raw))
+        except (ValidationError, ValueError) as e:
+            if len(result.errors) < MAX_REPORTED_ERRORS:
+                if isinstance(e, ValidationError):
+                    error = e.errors()[0]
+                    detail = f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                else:
+                    detail = str(e)
+                result.errors.append(schemas.ImportRecordError(line=line, detail=detail))
+            continue
+
+        if len(chunk) >= chunk_size:
+            import_chunk(db, chunk, result)
+            chunk = []
+            if progress:
+                progress(result)
+
+    if chunk:
+        import_chunk(db, chunk, result)
+        if progress:
+            progress(result)
+
+    return result
+
+
+def main() -> None:
+    """Import games from a file on the command line."""
+    from .database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Bulk import historical Boerenbridge games")
+    parser.add_argument("path", help="NDJSON or CSV file to import")
+    parser.add_argument("--format", choices=("ndjson", "csv"), help="Record format (default: from file extension)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Games per transaction")
+    args = parser.parse_args()
+
+    def report(result: schemas.ImportResult) -> None:
+        print(f"Imported {result.games_imported} games, {result.rounds_imported} rounds", file=sys.stderr)
+
+    file_format = args.format or detect_format(args.path)
+    db = SessionLocal()
+    try:
+        with open(args.path, newline="", encoding="utf-8") as f:
+            result = import_games(db, read_records(f, file_format), args.chunk_size, report)
+    finally:
+        db.close()
+
+    print(f"✅ Imported {result.games_imported} games ({result.rounds_imported} rounds), "
+          f"created {result.players_created} players")
+    for error in result.errors:
+        print(f"❌ Line {error.line}: {error.detail}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.exc import OperationalError
 from dotenv import load_dotenv
 
-from .routes import players_router, games_router
+from .routes import players_router, games_router, metrics_router
 from .database import engine
+from .metrics import MetricsMiddleware
 from . import models
 
 # Load environment variables
@@ -38,9 +39,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Record per-route latency, response size and SQL usage for /metrics
+app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(players_router)
 app.include_router(games_router)
+app.include_router(metrics_router)
 
 @app.get("/")
 async def root():
@@ -0,0 +1,305 @@
+"""In-process metrics collection and Prometheus exposition."""
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+
+# Latency buckets in seconds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Response size buckets in bytes
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+# SQL statements per request
+STATEMENT_BUCKETS = (0, 1, 2, 3, 4, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    """Histogram with preallocated buckets."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+        with self._lock:
+            self.observe_unlocked(value)
+
+    def observe_unlocked(self, value: float) -> None:
+        """Record an observation while the caller holds a lock covering this histogram."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> list:
+        """Get (upper bound, cumulative count) pairs, ending with +Inf."""
+        pairs = []
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def snapshot(self) -> dict:
+        """Get the histogram as a JSON-friendly dict."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": {
+                ("+Inf" if bound == float("inf") else str(bound)): count
+                for bound, count in self.cumulative_counts()
+            },
+        }
+
+
+class PoolMetrics:
+    """Checkout statistics for a connection pool."""
+
+    def __init__(self):
+        self.checkout_latency = Histogram()
+        self.timeouts = 0
+
+
+def pool_status(pool) -> Optional[dict]:
+    """Get the current state and checkout statistics of a connection pool."""
+    metrics = getattr(pool, "metrics", None)
+    if metrics is None:
+        return None
+
+    return {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "timeouts": metrics.timeouts,
+        "checkouts": metrics.checkout_latency.count,
+        "wait_time_seconds": metrics.checkout_latency.sum,
+        "checkout_latency_seconds": metrics.checkout_latency.snapshot()["buckets"],
+    }
+
+
+class RouteMetrics:
+    """Aggregated metrics of one route."""
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.response_size = Histogram(SIZE_BUCKETS)
+        self.statements = Histogram(STATEMENT_BUCKETS)
+        self.db_time = Histogram()
+        self.responses: Dict[int, int] = {}  # Status code to count
+        self._lock = threading.Lock()
+
+    def observe(self, request: "RequestContext", elapsed: float) -> None:
+        """Record a finished request under a single lock."""
+        with self._lock:
+            self.latency.observe_unlocked(elapsed)
+            self.response_size.observe_unlocked(request.response_size)
+            self.statements.observe_unlocked(request.statements)
+            self.db_time.observe_unlocked(request.db_time)
+            self.responses[request.status] = self.responses.get(request.status, 0) + 1
+
+
+class RequestContext:
+    """
+    Per-request accumulator, the only object allocated for each request.
+
+    It is also the ASGI send callable passed down the stack, so response
+    status and size are recorded without wrapping send in a closure.
+    """
+
+    __slots__ = ("send", "status", "response_size", "statements", "db_time", "query_start")
+
+    def __init__(self, send):
+        self.send = send
+        self.status = 500
+        self.response_size = 0
+        self.statements = 0
+        self.db_time = 0.0
+        self.query_start = 0.0
+
+    async def __call__(self, message) -> None:
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+        elif message["type"] == "http.response.body":
+            self.response_size += len(message.get("body", b""))
+        await self.send(message)
+
+
+# The request being handled; copied into threadpool workers and run_sync greenlets
+current_request: ContextVar[Optional[RequestContext]] = ContextVar("current_request", default=None)
+
+
+class RequestMetrics:
+    """Per-route request metrics, keyed by method and route template."""
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self.in_flight: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def route(self, method: str, path: str) -> RouteMetrics:
+        """Get the metrics of a route, creating them on its first request."""
+        metrics = self.routes.get((method, path))
+        if metrics is None:
+            with self._lock:
+                metrics = self.routes.setdefault((method, path), RouteMetrics())
+        return metrics
+
+    def observe(self, method: str, path: str, request: RequestContext, elapsed: float) -> None:
+        """Record a finished request."""
+        self.route(method, path).observe(request, elapsed)
+
+
+request_metrics = RequestMetrics()
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, response size and SQL usage per route.
+
+    Requests are labelled with the matched route template, e.g.
+    /games/{game_id}, so label cardinality stays bounded; requests that
+    match no route share the "unmatched" label.
+    """
+
+    def __init__(self, app, metrics: RequestMetrics = request_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        in_flight = self.metrics.in_flight
+        in_flight[method] = in_flight.get(method, 0) + 1
+        request = RequestContext(send)
+        token = current_request.set(request)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, request)
+        finally:
+            elapsed = time.perf_counter() - start
+            current_request.reset(token)
+            in_flight[method] -= 1
+            route = scope.get("route")
+            self.metrics.observe(method, getattr(route, "path", "unmatched"), request, elapsed)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    request = current_request.get()
+    if request is not None:
+        request.query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    request = current_request.get()
+    if request is not None:
+        request.statements += 1
+        request.db_time += time.perf_counter() - request.query_start
+
+
+def instrument_engine(engine) -> None:
+    """Count statements and database time of the current request on a sync engine."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+class PrometheusWriter:
+    """Builds the Prometheus text exposition format."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def header(self, name: str, kind: str, help_text: str) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, labels: str, value) -> None:
+        self.lines.append(f"{name}{{{labels}}} {value}" if labels else f"{name} {value}")
+
+    def histogram(self, name: str, labels: str, histogram: Histogram) -> None:
+        prefix = f"{labels}," if labels else ""
+        for bound, count in histogram.cumulative_counts():
+            self.sample(f"{name}_bucket", f'{prefix}le="{_format_bound(bound)}"', count)
+        self.sample(f"{name}_sum", labels, histogram.sum)
+        self.sample(f"{name}_count", labels, histogram.count)
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def render_prometheus(
+    metrics: RequestMetrics,
+    pools: Dict[str, object],
+    caches: Optional[Dict[str, dict]] = None
+) -> str:
+    """Render request, connection pool and cache metrics in Prometheus text format."""
+    writer = PrometheusWriter()
+    routes = sorted(metrics.routes.items())
+    labels = {key: f'method="{key[0]}",route="{_escape(key[1])}"' for key, _ in routes}
+
+    histograms = (
+        ("http_request_duration_seconds", "Request latency by route.", "latency"),
+        ("http_response_size_bytes", "Response body size by route.", "response_size"),
+        ("http_request_db_statements", "SQL statements executed per request.", "statements"),
+        ("http_request_db_duration_seconds", "Time spent executing SQL per request.", "db_time"),
+    )
+    for name, help_text, attribute in histograms:
+        writer.header(name, "histogram", help_text)
+        for key, route in routes:
+            writer.histogram(name, labels[key], getattr(route, attribute))
+
+    writer.header("http_requests_total", "counter", "Requests by route and status code.")
+    for key, route in routes:
+        for status, count in sorted(route.responses.items()):
+            writer.sample("http_requests_total", f'{labels[key]},status="{status}"', count)
+
+    writer.header("http_requests_in_flight", "gauge", "Requests currently being handled.")
+    for method, count in sorted(metrics.in_flight.items()):
+        writer.sample("http_requests_in_flight", f'method="{method}"', count)
+
+    pool_states = {name: (pool, pool_status(pool)) for name, pool in pools.items()}
+    pool_states = {name: state for name, state in pool_states.items() if state[1] is not None}
+    gauges = (
+        ("db_pool_size", "Configured connection pool size.", "pool_size"),
+        ("db_pool_checked_out", "Connections currently checked out.", "checked_out"),
+        ("db_pool_idle", "Idle connections in the pool.", "idle"),
+        ("db_pool_overflow", "Overflow connections currently open.", "overflow"),
+    )
+    for name, help_text, key in gauges:
+        writer.header(name, "gauge", help_text)
+        for engine_name, (_, status) in pool_states.items():
+            writer.sample(name, f'engine="{engine_name}"', status[key])
+    writer.header("db_pool_timeouts_total", "counter", "Connection checkouts that timed out.")
+    for engine_name, (_, status) in pool_states.items():
+        writer.sample("db_pool_timeouts_total", f'engine="{engine_name}"', status["timeouts"])
+    writer.header("db_pool_checkout_duration_seconds", "histogram", "Time waiting for a pooled connection.")
+    for engine_name, (pool, _) in pool_states.items():
+        writer.histogram("db_pool_checkout_duration_seconds", f'engine="{engine_name}"', pool.metrics.checkout_latency)
+
+    caches = caches or {}
+    for name, help_text, key in (
+        ("cache_hits_total", "Cache lookups that found a value.", "hits"),
+        ("cache_misses_total", "Cache lookups that found nothing.", "misses"),
+    ):
+        writer.header(name, "counter", help_text)
+        for cache_name, stats in sorted(caches.items()):
+            writer.sample(name, f'cache="{_escape(cache_name)}"', stats[key])
+
+    return writer.render()
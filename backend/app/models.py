@@ -1,12 +1,18 @@
 """SQLAlchemy database models for Boerenbridge scorekeeping."""
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Index, JSON, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from datetime import datetime, timezone
 from enum import Enum
 from .database import Base
 
 
+def utcnow() -> datetime:
+    """Current time with microseconds, also on databases whose now() has whole seconds."""
+    return datetime.now(timezone.utc)
+
+
 class GameStatus(str, Enum):
     """Game status enumeration."""
     ACTIVE = "active"
@@ -17,37 +23,62 @@ class GameStatus(str, Enum):
 class Player(Base):
     """Player model - stores player names and basic info."""
     __tablename__ = "players"
+    __table_args__ = (
+        Index("ix_players_rating", "rating"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False, unique=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    rating = Column(Float, nullable=False, default=1500.0, server_default="1500")  # Multiplayer Elo, see app/ratings.py
+    rated_games = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Relationships
     game_players = relationship("GamePlayer", back_populates="player")
     round_scores = relationship("RoundScore", back_populates="player")
 
 
+# Case-insensitive prefix search; text_pattern_ops lets PostgreSQL use it for LIKE 'abc%' in any collation
+Index(
+    "ix_players_name_lower",
+    func.lower(Player.name).label("name_lower"),
+    postgresql_ops={"name_lower": "text_pattern_ops"},
+)
+
+
 class Game(Base):
     """Game model - stores game configuration and metadata."""
     __tablename__ = "games"
+    __table_args__ = (
+        Index("ix_games_status_created_at", "status", "created_at"),
+        Index("ix_games_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     max_cards = Column(Integer, nullable=False)
     status = Column(SQLEnum(GameStatus), default=GameStatus.ACTIVE, nullable=False)
+    version = Column(Integer, nullable=False, default=1, server_default="1")  # Bumped on every change to the game
+    # Set with every version bump, so the newest one tells when a history page last changed
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utcnow, server_default=func.now(), index=True)
 
     # Relationships
     game_players = relationship("GamePlayer", back_populates="game", cascade="all, delete-orphan")
     rounds = relationship("Round", back_populates="game", cascade="all, delete-orphan")
+    result = relationship("GameResult", back_populates="game", uselist=False, cascade="all, delete-orphan")
 
 
 class GamePlayer(Base):
     """Game-player association table with player positions."""
     __tablename__ = "game_players"
+    __table_args__ = (
+        Index("ix_game_players_player_id", "player_id"),
+    )
 
     game_id = Column(Integer, ForeignKey("games.id"), primary_key=True)
     player_id = Column(Integer, ForeignKey("players.id"), primary_key=True)
     position = Column(Integer, nullable=False)  # 0-based position in clockwise order
+    current_total = Column(Integer, nullable=False, default=0, server_default="0")  # Running total after latest round
 
     # Relationships
     game = relationship("Game", back_populates="game_players")
@@ -57,6 +88,9 @@ class GamePlayer(Base):
 class Round(Base):
     """Round model - stores round configuration and metadata."""
     __tablename__ = "rounds"
+    __table_args__ = (
+        Index("ix_rounds_game_id_round_number", "game_id", "round_number", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     game_id = Column(Integer, ForeignKey("games.id"), nullable=False)
@@ -72,6 +106,10 @@ class Round(Base):
 class RoundScore(Base):
     """Round score model - stores individual player scores for each round."""
     __tablename__ = "round_scores"
+    __table_args__ = (
+        Index("ix_round_scores_round_id_player_id", "round_id", "player_id"),
+        Index("ix_round_scores_player_id", "player_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     round_id = Column(Integer, ForeignKey("rounds.id"), nullable=False)
@@ -84,3 +122,52 @@ class RoundScore(Base):
     # Relationships
     round = relationship("Round", back_populates="round_scores")
     player = relationship("Player", back_populates="round_scores")
+
+
+class GameResult(Base):
+    """Game result model - denormalized final standings of a completed game."""
+    __tablename__ = "game_results"
+    __table_args__ = (
+        # Pages history sorted by winner score straight off the index
+        Index("ix_game_results_winner_score_created_at", "winner_score", "created_at", "game_id"),
+    )
+
+    game_id = Column(Integer, ForeignKey("games.id"), primary_key=True)
+    winner_id = Column(Integer, ForeignKey("players.id"), nullable=True)
+    winner_score = Column(Integer, nullable=True)
+    final_scores = Column(JSON, nullable=False)     # Final totals ordered by player position
+    created_at = Column(DateTime(timezone=True))    # Copy of games.created_at, the winner score tie-break
+    completed_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    # Relationships
+    game = relationship("Game", back_populates="result")
+    winner = relationship("Player")
+
+
+class PlayerStats(Base):
+    """Player stats model - career totals, updated incrementally as games complete."""
+    __tablename__ = "player_stats"
+
+    player_id = Column(Integer, ForeignKey("players.id"), primary_key=True)
+    games_played = Column(Integer, nullable=False, default=0)
+    wins = Column(Integer, nullable=False, default=0)
+    total_score = Column(Integer, nullable=False, default=0)  # Sum of final totals, for the average
+    rounds_played = Column(Integer, nullable=False, default=0)
+    exact_bids = Column(Integer, nullable=False, default=0)   # Rounds where tricks won matched the bid
+    best_score = Column(Integer, nullable=False)
+    best_game_id = Column(Integer, ForeignKey("games.id"), nullable=False)
+    worst_score = Column(Integer, nullable=False)
+    worst_game_id = Column(Integer, ForeignKey("games.id"), nullable=False)
+
+    # Relationships
+    player = relationship("Player")
+
+
+class PlayerBidStats(Base):
+    """Player bid stats model - bid accuracy per number of cards dealt."""
+    __tablename__ = "player_bid_stats"
+
+    player_id = Column(Integer, ForeignKey("players.id"), primary_key=True)
+    cards_count = Column(Integer, primary_key=True)
+    rounds_played = Column(Integer, nullable=False, default=0)
+    exact_bids = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,75 @@
+"""Multiplayer Elo ratings computed with NumPy.
+
+A game of n players is scored as n - 1 head-to-head matches per player:
+beating a player's final total counts as a win, an equal total as a draw.
+Each player's rating moves by K / (n - 1) times the sum over opponents of
+actual minus expected score, so a game moves a rating by at most K points.
+
+Replaying history is serial per player, but games without a common player
+are independent. update_ratings therefore splits a run of games into waves
+of games with disjoint players and updates each wave with array operations.
+The result is identical to applying the games one at a time.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+INITIAL_RATING = 1500.0
+K_FACTOR = 32.0
+ELO_SCALE = 400.0
+
+# A rated game: indexes into the ratings array, and final totals in the same order
+RatedGame = Tuple[Sequence[int], Sequence[int]]
+
+
+def pairwise_deltas(ratings: np.ndarray, totals: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Compute rating changes for a batch of games.
+
+    Args:
+        ratings: Ratings before the games, shape (games, seats)
+        totals: Final totals, shape (games, seats)
+        mask: Which seats are occupied, shape (games, seats)
+
+    Returns:
+        Rating changes, shape (games, seats), zero for empty seats
+    """
+    # expected[g, i, j]: expected score of seat i against seat j
+    expected = 1.0 / (1.0 + 10.0 ** ((ratings[:, None, :] - ratings[:, :, None]) / ELO_SCALE))
+    actual = (totals[:, :, None] > totals[:, None, :]) + 0.5 * (totals[:, :, None] == totals[:, None, :])
+    pairs = mask[:, :, None] & mask[:, None, :]
+    opponents = np.maximum(mask.sum(axis=1, keepdims=True) - 1, 1)
+    return K_FACTOR * np.where(pairs, actual - expected, 0.0).sum(axis=2) / opponents * mask
+
+
+def schedule_waves(games: Sequence[RatedGame]) -> List[List[int]]:
+    """Group games into waves with disjoint players, keeping each player's games in order."""
+    last_wave: Dict[int, int] = {}
+    waves: List[List[int]] = []
+    for index, (players, _) in enumerate(games):
+        wave = 1 + max((last_wave.get(player, -1) for player in players), default=-1)
+        if wave == len(waves):
+            waves.append([])
+        waves[wave].append(index)
+        for player in players:
+            last_wave[player] = wave
+    return waves
+
+
+def update_ratings(ratings: np.ndarray, games: Sequence[RatedGame]) -> None:
+    """Apply games to a ratings array in place, in the order given."""
+    for wave in schedule_waves(games):
+        seats = max(len(games[index][0]) for index in wave)
+        players = np.zeros((len(wave), seats), dtype=np.intp)
+        totals = np.zeros((len(wave), seats))
+        mask = np.zeros((len(wave), seats), dtype=bool)
+        for row, index in enumerate(wave):
+            game_players, game_totals = games[index]
+            players[row, :len(game_players)] = game_players
+            totals[row, :len(game_totals)] = game_totals
+            mask[row, :len(game_players)] = True
+
+        deltas = pairwise_deltas(ratings[players], totals, mask)
+        # Players are unique within a wave, so the scatter has no collisions
+        ratings[players[mask]] += deltas[mask]
@@ -0,0 +1,62 @@
+"""Fast JSON responses and HTTP caching helpers."""
+
+import os
+from typing import Any, Optional
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+# How long clients may keep responses about completed games, which never change
+COMPLETED_GAME_MAX_AGE = int(os.getenv("COMPLETED_GAME_MAX_AGE", "31536000"))
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson.
+
+    Hot routes return this directly with plain dicts and lists built from
+    database rows. FastAPI passes a returned Response through untouched, so
+    the data is neither validated against response_model nor encoded by
+    jsonable_encoder; the route's response_model still documents the schema.
+    UTC datetimes are written with a Z suffix, as Pydantic writes them.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the values a response is derived from.
+
+    The tag describes the data (e.g. a game's id and version), not the exact
+    bytes, so it is weak and survives changes to how the data is encoded.
+    """
+    return 'W/"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in if_none_match.split(","))
+
+
+def cache_headers(etag: str, immutable: bool = False) -> dict:
+    """
+    Get ETag and Cache-Control headers for a response.
+
+    Immutable responses may be kept for COMPLETED_GAME_MAX_AGE seconds;
+    anything else must be revalidated with If-None-Match on every use.
+    """
+    cache_control = f"public, max-age={COMPLETED_GAME_MAX_AGE}, immutable" if immutable else "no-cache"
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def not_modified(headers: dict) -> Response:
+    """304 response confirming the client's cached copy is current."""
+    return Response(status_code=304, headers=headers)
@@ -1,57 +1,317 @@
 """API routes for Boerenbridge scorekeeping application."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, UploadFile
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple, Union
 from datetime import datetime
+import hashlib
+import io
+import orjson
 
-from . import schemas, crud
-from .database import get_db
+from . import schemas, crud, importer, exporter
+from .broadcast import Subscription, SubscriptionClosed, broadcaster
+from .cache import scoreboard_cache
+from .database import SessionRunner, get_export_session, get_runner, engine, async_engine
+from .metrics import pool_status, render_prometheus, request_metrics
+from .responses import ORJSONResponse, cache_headers, etag_matches, make_etag, not_modified
 
 # Create routers
 players_router = APIRouter(prefix="/players", tags=["players"])
 games_router = APIRouter(prefix="/games", tags=["games"])
+metrics_router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+# Seconds between keep-alive comments on idle scoreboard streams
+STREAM_KEEPALIVE_SECONDS = 15.0
+
+
+def _create_game(db: Session, game_data: schemas.GameCreate) -> schemas.GameResponse:
+    """Create a game and build its response while the session is active."""
+    return schemas.GameResponse.model_validate(crud.GameCRUD.create_game(db, game_data))
+
+
+def _submit_rounds(
+    db: Session,
+    game_id: int,
+    rounds_data: List[schemas.RoundDataSubmission]
+) -> Optional[Tuple[int, List[schemas.RoundResponse]]]:
+    """
+    Validate and record rounds in one transaction and build their responses.
+
+    Returns None if the game doesn't exist, otherwise the game's total
+    rounds and the new rounds.
+    """
+    submitted = crud.RoundCRUD.submit_rounds(db, game_id, rounds_data)
+    if submitted is None:
+        return None
+    return submitted.total_rounds, [
+        schemas.RoundResponse.model_validate(round_data) for round_data in submitted.rounds
+    ]
+
+
+def _game_summary(game) -> dict:
+    """Build a history entry shaped like schemas.GameSummary from a loaded game."""
+    # Final scores and winner come from the stored game result
+    result = game.result if game.status == schemas.GameStatus.COMPLETED else None
+    return {
+        "id": game.id,
+        "created_at": game.created_at,
+        "status": game.status,
+        "max_cards": game.max_cards,
+        "players": [
+            {"name": gp.player.name, "id": gp.player.id, "created_at": gp.player.created_at}
+            for gp in sorted(game.game_players, key=lambda x: x.position)
+        ],
+        "final_scores": result.final_scores if result else None,
+        "winner_id": result.winner_id if result else None,
+    }
+
+
+def _get_game_detail(
+    db: Session,
+    game_id: int,
+    if_none_match: Optional[str]
+) -> Optional[Tuple[dict, Optional[schemas.GameDetailResponse]]]:
+    """
+    Check the client's ETag against the game's version and load the game only if it changed.
+
+    Returns None if the game doesn't exist, otherwise the cache headers and
+    the game, which is None when the client's copy is current.
+    """
+    state = crud.GameCRUD.get_game_state(db, game_id)
+    if not state:
+        return None
+    headers = cache_headers(make_etag(game_id, state.version), state.status == schemas.GameStatus.COMPLETED)
+    if etag_matches(if_none_match, headers["ETag"]):
+        return headers, None
+
+    # Rounds, scores and players are loaded together with the game
+    game = crud.GameCRUD.get_game(db, game_id)
+    if not game:
+        return None
+    headers = cache_headers(make_etag(game_id, game.version), game.status == schemas.GameStatus.COMPLETED)
+    return headers, schemas.GameDetailResponse(
+        id=game.id,
+        created_at=game.created_at,
+        status=game.status,
+        max_cards=game.max_cards,
+        players=[schemas.PlayerResponse(
+            id=gp.player.id,
+            name=gp.player.name,
+            created_at=gp.player.created_at
+        ) for gp in sorted(game.game_players, key=lambda x: x.position)],
+        rounds=[
+            schemas.RoundResponse.model_validate(round_obj)
+            for round_obj in sorted(game.rounds, key=lambda x: x.round_number)
+        ]
+    )
+
+
+def _get_scoreboard(
+    db: Session,
+    game_id: int,
+    if_none_match: Optional[str],
+    since_round: Optional[int] = None
+) -> Optional[Tuple[dict, Optional[dict]]]:
+    """
+    Check the client's ETag against the game's version and get the scoreboard only if it changed.
+
+    Returns None if the game doesn't exist, otherwise the cache headers and
+    the scoreboard data, which is None when the client's copy is current.
+    With since_round the data is a ScoreboardDelta instead of the full scoreboard.
+    """
+    header = crud.ScoreboardService.get_scoreboard_header(db, game_id)
+    if not header:
+        return None
+    game = header[0]
+    headers = cache_headers(make_etag(game_id, game.version), game.status == schemas.GameStatus.COMPLETED)
+    if etag_matches(if_none_match, headers["ETag"]):
+        return headers, None
+    if since_round is not None:
+        return headers, crud.ScoreboardService.build_scoreboard_delta(db, game_id, since_round, header)
+    return headers, crud.ScoreboardService.get_scoreboard_data(db, game_id, header)
+
+
+def _scoreboard_channel(game_id: int) -> str:
+    """Broadcast channel for a game's scoreboard streams."""
+    return f"game:{game_id}:scoreboard"
+
+
+def _round_update(game_id: int, total_rounds: int, round_response: schemas.RoundResponse) -> dict:
+    """Build the ScoreboardRoundUpdate pushed to scoreboard streams for a committed round."""
+    # Every player scores every round, so the running totals are the new standings
+    totals = [(score.player_id, score.running_total) for score in round_response.round_scores]
+    is_complete = round_response.round_number == total_rounds
+    return {
+        "game_id": game_id,
+        "round_number": round_response.round_number,
+        "cards_count": round_response.cards_count,
+        "dealer_position": round_response.dealer_position,
+        "scores": [score.model_dump() for score in round_response.round_scores],
+        "totals": [{"player_id": player_id, "final_total": total} for player_id, total in totals],
+        "current_round": min(round_response.round_number + 1, total_rounds),
+        "is_complete": is_complete,
+        "winner_id": crud.ScoreCalculator.get_winner(totals) if is_complete else None,
+    }
+
+
+async def _submit_or_reject(
+    db: SessionRunner,
+    game_id: int,
+    rounds_data: List[schemas.RoundDataSubmission]
+) -> Tuple[int, List[schemas.RoundResponse]]:
+    """Record rounds, turning a missing game into 404 and rounds that don't fit it into 400."""
+    try:
+        submitted = await db.run(_submit_rounds, game_id, rounds_data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if submitted is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    return submitted
+
+
+async def _publish_rounds(game_id: int, total_rounds: int, rounds: List[schemas.RoundResponse]) -> None:
+    """Push committed rounds to the game's scoreboard streams."""
+    for round_response in rounds:
+        message = orjson.dumps(_round_update(game_id, total_rounds, round_response), option=orjson.OPT_UTC_Z)
+        await broadcaster.publish(_scoreboard_channel(game_id), message.decode())
+
+
+def _sse_event(event: str, event_id: int, data: str) -> str:
+    """Format one Server-Sent Event; data must be a single line, as compact JSON is."""
+    return f"id: {event_id}\nevent: {event}\ndata: {data}\n\n"
+
+
+async def _scoreboard_events(scoreboard: dict, subscription: Subscription) -> AsyncIterator[str]:
+    """Yield the scoreboard, then every newly committed round, as Server-Sent Events."""
+    try:
+        complete = scoreboard["is_complete"]
+        rounds_played = scoreboard["total_rounds"] if complete else scoreboard["current_round"] - 1
+        yield _sse_event("scoreboard", rounds_played, orjson.dumps(scoreboard, option=orjson.OPT_UTC_Z).decode())
+
+        while not complete:
+            try:
+                message = await subscription.get(timeout=STREAM_KEEPALIVE_SECONDS)
+            except SubscriptionClosed:
+                # Fell behind or lost the backend; the client reconnects for a fresh snapshot
+                return
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+
+            update = orjson.loads(message)
+            if update["round_number"] <= rounds_played:
+                # Committed before the snapshot was taken
+                continue
+            if update["round_number"] != rounds_played + 1:
+                # A round went missing; end so the client resynchronises
+                return
+            rounds_played = update["round_number"]
+            complete = update["is_complete"]
+            yield _sse_event("round", rounds_played, message)
+    finally:
+        subscription.close()
+
+
+def _get_player_stats(db: Session, player_id: int) -> Optional[schemas.PlayerStatsResponse]:
+    """Look up a player and their statistics in one session call."""
+    player = crud.PlayerCRUD.get_player(db, player_id)
+    if not player:
+        return None
+    return crud.PlayerStatsCRUD.get_player_stats(db, player)
 
 
 # Player endpoints
 @players_router.get("", response_model=List[schemas.PlayerResponse])
-def get_players(
+async def get_players(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: SessionRunner = Depends(get_runner)
 ):
     """Get all player names for dropdown/selection."""
-    players = crud.PlayerCRUD.get_players(db, skip=skip, limit=limit)
+    players = await db.run(crud.PlayerCRUD.get_players, skip=skip, limit=limit)
     return players
 
 
 @players_router.post("", response_model=schemas.PlayerResponse)
-def create_player(
+async def create_player(
     player: schemas.PlayerCreate,
-    db: Session = Depends(get_db)
+    db: SessionRunner = Depends(get_runner)
 ):
     """Create a new player."""
     # Check if player already exists
-    existing_player = crud.PlayerCRUD.get_player_by_name(db, player.name)
+    existing_player = await db.run(crud.PlayerCRUD.get_player_by_name, player.name)
     if existing_player:
         raise HTTPException(
             status_code=400,
             detail=f"Player with name '{player.name}' already exists"
         )
     
-    return crud.PlayerCRUD.create_player(db, player)
+    return await db.run(crud.PlayerCRUD.create_player, player)
+
+
+@players_router.get("/search", response_model=List[schemas.PlayerSearchResult])
+async def search_players(
+    q: str = Query(..., min_length=1, max_length=100, description="Case-insensitive name prefix"),
+    limit: int = Query(10, ge=1, le=50),
+    db: SessionRunner = Depends(get_runner)
+):
+    """Autocomplete player names, most active players first."""
+    matches = await db.run(crud.PlayerCRUD.search_players, q, limit=limit)
+    return [
+        schemas.PlayerSearchResult(
+            id=player.id,
+            name=player.name,
+            created_at=player.created_at,
+            recent_games=recent_games
+        )
+        for player, recent_games in matches
+    ]
+
+
+@players_router.get("/leaderboard", response_model=List[schemas.LeaderboardEntry])
+async def get_leaderboard(
+    limit: int = Query(50, ge=1, le=500),
+    min_games: int = Query(1, ge=0, description="Only rank players with at least this many rated games"),
+    db: SessionRunner = Depends(get_runner)
+):
+    """Get players ranked by rating."""
+    players = await db.run(crud.PlayerRatingCRUD.get_leaderboard, limit=limit, min_games=min_games)
+    return [
+        schemas.LeaderboardEntry(
+            rank=rank,
+            player_id=player.id,
+            player_name=player.name,
+            rating=player.rating,
+            rated_games=player.rated_games
+        )
+        for rank, player in enumerate(players, start=1)
+    ]
+
+
+@players_router.get("/{player_id}/stats", response_model=schemas.PlayerStatsResponse)
+async def get_player_stats(
+    player_id: int,
+    db: SessionRunner = Depends(get_runner)
+):
+    """Get a player's career statistics over completed games."""
+    stats = await db.run(_get_player_stats, player_id)
+    if not stats:
+        raise HTTPException(status_code=404, detail="Player not found")
+    return stats
 
 
 # Game endpoints
 @games_router.post("", response_model=schemas.GameResponse)
-def create_game(
+async def create_game(
     game_data: schemas.GameCreate,
-    db: Session = Depends(get_db)
+    db: SessionRunner = Depends(get_runner)
 ):
     """Create a new game with players."""
     # Validate all player IDs exist
     for player_id in game_data.player_ids:
-        player = crud.PlayerCRUD.get_player(db, player_id)
+        player = await db.run(crud.PlayerCRUD.get_player, player_id)
         if not player:
             raise HTTPException(
                 status_code=400,
@@ -67,41 +327,81 @@ def create_game(
             detail=f"Maximum cards ({game_data.max_cards}) exceeds limit for {num_players} players ({max_possible_cards})"
         )
     
-    return crud.GameCRUD.create_game(db, game_data)
+    return await db.run(_create_game, game_data)
+
+
+@games_router.post("/import", response_model=schemas.ImportResult)
+async def import_games(
+    file: UploadFile,
+    format: Optional[str] = Query(default=None, pattern="^(ndjson|csv)$"),
+    db: SessionRunner = Depends(get_runner)
+):
+    """Bulk import historical games from an NDJSON or CSV upload."""
+    file_format = format or importer.detect_format(file.filename)
+    lines = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    return await db.run(importer.import_games, importer.read_records(lines, file_format))
+
+
+@games_router.get("/export")
+async def export_games(
+    format: str = Query(default="ndjson", pattern="^(ndjson|csv)$"),
+    player_ids: Optional[List[int]] = Query(None),
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    min_winner_score: Optional[int] = None,
+    max_winner_score: Optional[int] = None,
+    db: Session | AsyncSession = Depends(get_export_session)
+):
+    """Stream every game matching the history filters as NDJSON or CSV."""
+    filters = schemas.GameHistoryFilter(
+        player_ids=player_ids,
+        start_date=start_date,
+        end_date=end_date,
+        min_winner_score=min_winner_score,
+        max_winner_score=max_winner_score
+    )
+    return StreamingResponse(
+        exporter.stream_export_async(db, filters, format)
+        if isinstance(db, AsyncSession) else exporter.stream_export(db, filters, format),
+        media_type=exporter.MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="games.{format}"'}
+    )
 
 
 @games_router.get("/{game_id}", response_model=schemas.GameDetailResponse)
-def get_game(
+async def get_game(
     game_id: int,
-    db: Session = Depends(get_db)
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: SessionRunner = Depends(get_runner)
 ):
-    """Get detailed game information by ID."""
-    game = crud.GameCRUD.get_game(db, game_id)
-    if not game:
+    """
+    Get detailed game information by ID.
+
+    The ETag follows the game's version: send it back as If-None-Match to
+    get 304 Not Modified while the game is unchanged.
+    """
+    found = await db.run(_get_game_detail, game_id, if_none_match)
+    if not found:
         raise HTTPException(status_code=404, detail="Game not found")
-    
-    # Get all rounds for this game
-    rounds = crud.RoundCRUD.get_game_rounds(db, game_id)
-    
-    # Get players in position order
-    players = [schemas.PlayerResponse(
-        id=gp.player.id,
-        name=gp.player.name,
-        created_at=gp.player.created_at
-    ) for gp in sorted(game.game_players, key=lambda x: x.position)]
-    
-    return schemas.GameDetailResponse(
-        id=game.id,
-        created_at=game.created_at,
-        status=game.status,
-        max_cards=game.max_cards,
-        players=players,
-        rounds=rounds
-    )
+    headers, game = found
+    if game is None:
+        return not_modified(headers)
+    response.headers.update(headers)
+    return game
+
 
+def _history_state(
+    db: Session,
+    filters: schemas.GameHistoryFilter
+) -> Tuple[Optional[datetime], Optional[int]]:
+    """Get what a history page depends on without loading it: the last change and, if asked for, the count."""
+    total_games = crud.GameCRUD.count_games(db, filters) if filters.include_total else None
+    return crud.GameCRUD.get_last_update(db, filters), total_games
 
-@games_router.get("", response_model=schemas.GameHistoryResponse)
-def get_games_history(
+
+@games_router.get("", response_model=schemas.GameHistoryResponse, response_class=ORJSONResponse)
+async def get_games_history(
     player_ids: Optional[List[int]] = Query(None),
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
@@ -111,9 +411,19 @@ def get_games_history(
     sort_order: str = Query(default="desc", pattern="^(asc|desc)$"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    if_none_match: Optional[str] = Header(None),
+    db: SessionRunner = Depends(get_runner)
 ):
-    """Get game history with filtering and sorting."""
+    """
+    Get game history with filtering and sorting.
+
+    Pass the returned next_cursor or prev_cursor as cursor to page by keyset
+    instead of page number; include_total=false skips counting. The ETag
+    follows when a matching game was last created or changed, so
+    If-None-Match returns 304 Not Modified before the page is loaded.
+    """
     filters = schemas.GameHistoryFilter(
         player_ids=player_ids,
         start_date=start_date,
@@ -123,120 +433,170 @@ def get_games_history(
         sort_by=sort_by,
         sort_order=sort_order,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        cursor=cursor,
+        include_total=include_total
     )
     
-    games, total_games = crud.GameCRUD.get_games_with_filters(db, filters)
-    total_pages = (total_games + page_size - 1) // page_size
-    
-    # Convert to GameSummary format
-    game_summaries = []
-    for game in games:
-        # Get final scores and winner if game is completed
-        final_scores = None
-        winner_id = None
-        
-        if game.status == schemas.GameStatus.COMPLETED:
-            scoreboard = crud.ScoreboardService.get_scoreboard(db, game.id)
-            if scoreboard and scoreboard.is_complete:
-                final_scores = [p.final_total for p in scoreboard.players]
-                winner_id = scoreboard.winner_id
-        
-        game_summary = schemas.GameSummary(
-            id=game.id,
-            created_at=game.created_at,
-            status=game.status,
-            max_cards=game.max_cards,
-            players=[schemas.PlayerResponse(
-                id=gp.player.id,
-                name=gp.player.name,
-                created_at=gp.player.created_at
-            ) for gp in sorted(game.game_players, key=lambda x: x.position)],
-            final_scores=final_scores,
-            winner_id=winner_id
+    last_update, total_games = await db.run(_history_state, filters)
+    etag = hashlib.blake2b(repr((last_update, total_games)).encode(), digest_size=16).hexdigest()
+    headers = cache_headers(make_etag(etag))
+    if etag_matches(if_none_match, headers["ETag"]):
+        return not_modified(headers)
+
+    try:
+        # The total was counted above
+        games, _, next_cursor, prev_cursor = await db.run(
+            crud.GameCRUD.get_games_with_filters, filters.model_copy(update={"include_total": False})
         )
-        game_summaries.append(game_summary)
-    
-    return schemas.GameHistoryResponse(
-        games=game_summaries,
-        total_games=total_games,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages
-    )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    total_pages = (total_games + page_size - 1) // page_size if total_games is not None else None
+
+    return ORJSONResponse({
+        "games": [_game_summary(game) for game in games],
+        "total_games": total_games,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor,
+    }, headers=headers)
 
 
 @games_router.post("/{game_id}/rounds", response_model=schemas.RoundResponse)
-def submit_round_data(
+async def submit_round_data(
     game_id: int,
     round_data: schemas.RoundDataSubmission,
-    db: Session = Depends(get_db)
+    db: SessionRunner = Depends(get_runner)
 ):
-    """Submit round data (bids and tricks) for a game."""
-    # Validate game exists
-    game = crud.GameCRUD.get_game(db, game_id)
-    if not game:
+    """
+    Submit round data (bids and tricks) for a game.
+
+    The round must be the game's next round, with the cards count and
+    dealer position of the round schedule. It is checked and written in a
+    single transaction; the final round also completes the game.
+    """
+    total_rounds, new_rounds = await _submit_or_reject(db, game_id, [round_data])
+    await _publish_rounds(game_id, total_rounds, new_rounds)
+    return new_rounds[0]
+
+
+@games_router.post("/{game_id}/rounds:batch", response_model=List[schemas.RoundResponse])
+async def submit_rounds_batch(
+    game_id: int,
+    batch: schemas.RoundBatchSubmission,
+    db: SessionRunner = Depends(get_runner)
+):
+    """Submit several consecutive rounds at once, e.g. when a tablet catches up after being offline."""
+    # All rounds are checked and written in a single transaction; the final round also completes the game
+    total_rounds, new_rounds = await _submit_or_reject(db, game_id, batch.rounds)
+    await _publish_rounds(game_id, total_rounds, new_rounds)
+    return new_rounds
+
+
+@games_router.get(
+    "/{game_id}/scoreboard",
+    response_model=Union[schemas.ScoreboardResponse, schemas.ScoreboardDelta],
+    response_class=ORJSONResponse
+)
+async def get_game_scoreboard(
+    game_id: int,
+    since_round: Optional[int] = Query(None, ge=0, description="Only return rounds after this one, as a ScoreboardDelta"),
+    if_none_match: Optional[str] = Header(None),
+    db: SessionRunner = Depends(get_runner)
+):
+    """
+    Get current scoreboard for a game.
+
+    With since_round, returns a ScoreboardDelta instead: only the rounds
+    after since_round, plus the current totals and progress, so a client
+    polling with the last round it has gets one row per player per new
+    round rather than the whole scoreboard.
+
+    The ETag follows the game's version: polling with If-None-Match gets
+    304 Not Modified, without building the scoreboard, until a round is
+    submitted. Completed games are cacheable for good.
+    """
+    found = await db.run(_get_scoreboard, game_id, if_none_match, since_round)
+    if not found:
         raise HTTPException(status_code=404, detail="Game not found")
-    
-    if game.status != schemas.GameStatus.ACTIVE:
-        raise HTTPException(status_code=400, detail="Game is not active")
-    
-    # Validate round data
-    total_players = len(game.game_players)
-    if not round_data.validate_scores(total_players):
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid round data: total tricks must equal cards count and all players must have scores"
-        )
-    
-    # Validate all player IDs belong to this game
-    game_player_ids = {gp.player_id for gp in game.game_players}
-    round_player_ids = {score.player_id for score in round_data.scores}
-    if round_player_ids != game_player_ids:
-        raise HTTPException(
-            status_code=400,
-            detail="Round scores must include all game players"
-        )
-    
-    # Validate dealer position
-    if round_data.dealer_position >= total_players:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Dealer position ({round_data.dealer_position}) exceeds number of players ({total_players})"
-        )
-    
-    # Check if this is the final round
-    total_rounds = (game.max_cards * 2) - 1
-    is_final_round = round_data.round_number == total_rounds
-    
-    # Create the round with scores
-    new_round = crud.RoundCRUD.create_round_with_scores(db, game_id, round_data)
-    
-    # If this is the final round, mark game as completed
-    if is_final_round:
-        crud.GameCRUD.update_game_status(db, game_id, schemas.GameStatus.COMPLETED)
-    
-    return new_round
+    headers, scoreboard = found
+    if scoreboard is None:
+        return not_modified(headers)
+    return ORJSONResponse(scoreboard, headers=headers)
 
 
-@games_router.get("/{game_id}/scoreboard", response_model=schemas.ScoreboardResponse)
-def get_game_scoreboard(
+@games_router.get(
+    "/{game_id}/scoreboard/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}, "description": "Server-Sent Events"}}
+)
+async def stream_game_scoreboard(
     game_id: int,
-    db: Session = Depends(get_db)
+    db: SessionRunner = Depends(get_runner)
 ):
-    """Get current scoreboard for a game."""
-    scoreboard = crud.ScoreboardService.get_scoreboard(db, game_id)
+    """
+    Follow a game's scoreboard as Server-Sent Events.
+
+    The first `scoreboard` event carries the full ScoreboardResponse. Each
+    round committed afterwards arrives as a `round` event carrying a
+    ScoreboardRoundUpdate: that round's scores and the new totals. Event ids
+    are round numbers. The stream ends once the game is complete. If it ends
+    before that, reconnect to get a fresh snapshot.
+    """
+    # Subscribe before taking the snapshot so no round can fall in between
+    subscription = await broadcaster.subscribe(_scoreboard_channel(game_id))
+    try:
+        scoreboard = await db.run(crud.ScoreboardService.get_scoreboard_data, game_id)
+    except BaseException:
+        subscription.close()
+        raise
     if not scoreboard:
+        subscription.close()
         raise HTTPException(status_code=404, detail="Game not found")
-    return scoreboard
+
+    return StreamingResponse(
+        _scoreboard_events(scoreboard, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 # Health check endpoint
 @games_router.get("/health", response_model=schemas.HealthResponse)
-def health_check():
+async def health_check():
     """Health check endpoint."""
     return schemas.HealthResponse(
         status="healthy",
         service="boerenbridge-api",
         timestamp=datetime.now()
     )
+
+
+# Metrics endpoints
+@metrics_router.get("", response_class=PlainTextResponse)
+async def get_prometheus_metrics():
+    """Request, SQL, connection pool and cache metrics in Prometheus text format."""
+    pools = {"sync": engine.pool}
+    if async_engine:
+        pools["async"] = async_engine.pool
+    return PlainTextResponse(
+        render_prometheus(request_metrics, pools, {"scoreboard": scoreboard_cache.stats()}),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@metrics_router.get("/cache")
+async def get_cache_metrics():
+    """Scoreboard cache hit and miss counters of this worker."""
+    return {"scoreboard": scoreboard_cache.stats()}
+
+
+@metrics_router.get("/db-pool")
+async def get_db_pool_metrics():
+    """Connection pool state and checkout latency for the sync and async engines."""
+    return {
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.pool) if async_engine else None,
+    }
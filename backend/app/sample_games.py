@@ -0,0 +1,120 @@
+"""Deterministic synthetic Boerenbridge games.
+
+The seeded game generator behind the sample data script, the benchmarks
+and the tests. Games follow the real rules: cards go 1 up to max_cards and
+back down to 1, seat 0 deals first and the deal rotates clockwise, the
+dealer (bidding last) may not make the bids add up to the cards dealt, and
+tricks always sum to the cards dealt. Players belong to circles of regulars
+with the occasional guest, so player filters and statistics behave like a
+real club. The same seed and players always give the same games.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Hashable, Iterator, List, NamedTuple, Sequence, Tuple
+
+from .crud import get_round_schedule
+
+CIRCLE_SIZE = 12
+GUEST_RATE = 0.1
+ABANDON_RATE = 0.08
+
+
+class SampleGame(NamedTuple):
+    """A generated game, with its players in seating order."""
+    players: List[Hashable]
+    max_cards: int
+    rounds: List[List[Tuple[int, int]]]  # (bid, tricks_won) per seat, per round played
+    completed: bool
+
+
+class GameGenerator:
+    """Seeded generator of games among a fixed list of players, such as names or IDs."""
+
+    def __init__(
+        self,
+        players: Sequence[Hashable],
+        seed: int,
+        seats: Tuple[int, int] = (3, 7),
+        guest_rate: float = GUEST_RATE,
+        abandon_rate: float = ABANDON_RATE
+    ):
+        self.rng = random.Random(seed)
+        self.players = list(players)
+        self.circles = [self.players[i:i + CIRCLE_SIZE] for i in range(0, len(self.players), CIRCLE_SIZE)]
+        self.seats = seats
+        self.guest_rate = guest_rate
+        self.abandon_rate = abandon_rate
+        # A player's skill is their chance of bidding exactly what their hand is worth
+        self.skill = {player: self.rng.uniform(0.25, 0.65) for player in self.players}
+
+    def pick_players(self) -> list:
+        """Seat players from one circle, sometimes with a guest from elsewhere."""
+        rng = self.rng
+        circle = rng.choice(self.circles)
+        players = rng.sample(circle, min(len(circle), rng.randint(*self.seats)))
+        if len(players) < 10 and rng.random() < self.guest_rate:
+            guest = rng.choice(self.players)
+            if guest not in players:
+                players.insert(rng.randrange(len(players) + 1), guest)
+        return players
+
+    def play_round(self, players: Sequence[Hashable], cards: int, dealer: int) -> List[Tuple[int, int]]:
+        """Deal a round and return (bid, tricks_won) per seat."""
+        rng = self.rng
+        num_players = len(players)
+        strength = [rng.random() ** 2 + 0.05 for _ in players]
+        tricks = [0] * num_players
+        for winner in rng.choices(range(num_players), weights=strength, k=cards):
+            tricks[winner] += 1
+
+        # Bidding starts left of the dealer; the dealer bids last
+        total_strength = sum(strength)
+        bids = [0] * num_players
+        for offset in range(1, num_players + 1):
+            seat = (dealer + offset) % num_players
+            if rng.random() < self.skill[players[seat]]:
+                bid = tricks[seat]
+            else:
+                estimate = round(cards * strength[seat] / total_strength)
+                bid = estimate + rng.choice((-1, 1)) if rng.random() < 0.5 else estimate
+            bids[seat] = min(max(bid, 0), cards)
+
+        # The dealer may not make the bids add up to the cards dealt
+        if sum(bids) == cards:
+            if bids[dealer] == 0:
+                bids[dealer] = 1
+            elif bids[dealer] == cards:
+                bids[dealer] -= 1
+            else:
+                bids[dealer] += rng.choice((-1, 1))
+        return list(zip(bids, tricks))
+
+    def play_game(self) -> SampleGame:
+        """Generate one game; a few are abandoned part way through."""
+        rng = self.rng
+        players = self.pick_players()
+        max_cards = rng.randint(5, min(10, 52 // len(players)))
+        schedule = get_round_schedule(max_cards)
+        played = len(schedule)
+        if rng.random() < self.abandon_rate:
+            played = rng.randint(1, len(schedule) - 1)
+        rounds = [
+            self.play_round(players, cards, index % len(players))
+            for index, cards in enumerate(schedule[:played])
+        ]
+        return SampleGame(players, max_cards, rounds, played == len(schedule))
+
+    def import_records(self, num_games: int, start: datetime, step: timedelta) -> Iterator[Tuple[int, dict]]:
+        """Generate (line number, record) pairs for importer.import_games, one game per step."""
+        for line in range(num_games):
+            game = self.play_game()
+            yield line + 1, {
+                "players": game.players,
+                "max_cards": game.max_cards,
+                "created_at": (start + step * line).isoformat(),
+                "rounds": [
+                    {"bids": [bid for bid, _ in scores], "tricks": [tricks for _, tricks in scores]}
+                    for scores in game.rounds
+                ],
+            }
@@ -33,6 +33,48 @@ class PlayerResponse(PlayerBase):
     created_at: datetime
 
 
+class PlayerSearchResult(PlayerResponse):
+    """A player matching a name search, with how often they played recently."""
+    recent_games: int
+
+
+class BidAccuracy(BaseModel):
+    """Bid accuracy for rounds with a given number of cards."""
+    cards_count: int
+    rounds_played: int
+    exact_bids: int
+    accuracy: Optional[float] = None
+
+
+class GameHighlight(BaseModel):
+    """A notable game in a player's history."""
+    game_id: int
+    final_score: int
+
+
+class PlayerStatsResponse(BaseModel):
+    """Career statistics over a player's completed games."""
+    player_id: int
+    player_name: str
+    games_played: int
+    wins: int
+    win_rate: Optional[float] = None
+    average_score: Optional[float] = None
+    bid_accuracy: Optional[float] = None
+    bid_accuracy_by_cards: List[BidAccuracy]
+    best_game: Optional[GameHighlight] = None
+    worst_game: Optional[GameHighlight] = None
+
+
+class LeaderboardEntry(BaseModel):
+    """A player's place on the rating leaderboard."""
+    rank: int
+    player_id: int
+    player_name: str
+    rating: float
+    rated_games: int
+
+
 # Game schemas
 class GameBase(BaseModel):
     """Base game schema."""
@@ -127,6 +169,11 @@ class RoundDataSubmission(BaseModel):
         return total_tricks == self.cards_count
 
 
+class RoundBatchSubmission(BaseModel):
+    """Schema for submitting several consecutive rounds in one request."""
+    rounds: List[RoundDataSubmission] = Field(..., min_length=1, description="Rounds in round number order")
+
+
 class RoundResponse(RoundBase):
     """Schema for round response."""
     model_config = ConfigDict(from_attributes=True)
@@ -157,6 +204,42 @@ class ScoreboardResponse(BaseModel):
     winner_id: Optional[int] = None
 
 
+class PlayerTotal(BaseModel):
+    """A player's running total after a round."""
+    player_id: int
+    final_total: int
+
+
+class ScoreboardRound(RoundBase):
+    """One round of a scoreboard with a cell per player."""
+    scores: List[RoundScoreResponse]
+
+
+class ScoreboardDelta(BaseModel):
+    """Scoreboard changes after a given round: the new rounds and the current standings."""
+    game_id: int
+    since_round: int
+    total_rounds: int
+    current_round: int
+    rounds: List[ScoreboardRound]
+    totals: List[PlayerTotal]  # In seat order
+    is_complete: bool
+    winner_id: Optional[int] = None
+
+
+class ScoreboardRoundUpdate(BaseModel):
+    """A submitted round as pushed to scoreboard streams."""
+    game_id: int
+    round_number: int
+    cards_count: int
+    dealer_position: int
+    scores: List[RoundScoreResponse]  # The new cell for each player
+    totals: List[PlayerTotal]
+    current_round: int
+    is_complete: bool
+    winner_id: Optional[int] = None
+
+
 # Game history schemas
 class GameHistoryFilter(BaseModel):
     """Schema for game history filtering."""
@@ -169,15 +252,19 @@ class GameHistoryFilter(BaseModel):
     sort_order: str = Field(default="desc", pattern="^(asc|desc)$")
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=100)
+    cursor: Optional[str] = Field(default=None, description="Opaque keyset cursor; takes precedence over page")
+    include_total: bool = Field(default=True, description="Whether to count all matching games")
 
 
 class GameHistoryResponse(BaseModel):
     """Schema for game history response."""
     games: List[GameSummary]
-    total_games: int
+    total_games: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
 
 class GameDetailResponse(BaseModel):
@@ -192,6 +279,37 @@ class GameDetailResponse(BaseModel):
     rounds: List[RoundResponse]
 
 
+# Import schemas
+class GameImportRound(BaseModel):
+    """One round of a historical game; cards and dealer default to the standard schedule."""
+    bids: List[int]
+    tricks: List[int]
+    cards_count: Optional[int] = Field(default=None, ge=1, le=17)
+    dealer_position: Optional[int] = Field(default=None, ge=0)
+
+
+class GameImportRecord(BaseModel):
+    """A complete historical game, with players listed in seating order."""
+    players: List[str] = Field(..., min_length=3, max_length=10)
+    max_cards: int = Field(..., ge=5, le=17)
+    created_at: Optional[datetime] = None
+    rounds: List[GameImportRound]
+
+
+class ImportRecordError(BaseModel):
+    """A rejected import record."""
+    line: int
+    detail: str
+
+
+class ImportResult(BaseModel):
+    """Summary of a bulk game import."""
+    games_imported: int
+    rounds_imported: int
+    players_created: int
+    errors: List[ImportRecordError]
+
+
 # Utility schemas
 class HealthResponse(BaseModel):
     """Health check response."""
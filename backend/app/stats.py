@@ -0,0 +1,43 @@
+"""Maintenance commands for the incrementally maintained player statistics and ratings.
+
+Statistics and ratings are updated as games complete. Rebuild them after
+restoring a backup or upgrading an existing database; rebuilding ratings
+also replays imported games in completion order.
+
+Usage: python -m app.stats rebuild | rebuild-ratings
+"""
+
+import argparse
+import time
+
+from .crud import PlayerRatingCRUD, PlayerStatsCRUD
+
+
+def main() -> None:
+    """Run a statistics maintenance command."""
+    from .database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Maintain Boerenbridge player statistics")
+    commands = parser.add_subparsers(dest="command", required=True)
+    rebuild = commands.add_parser("rebuild", help="Recompute all player statistics from completed games")
+    rebuild.add_argument("--batch-size", type=int, default=1000, help="Games read per query")
+    rebuild_ratings = commands.add_parser("rebuild-ratings", help="Replay all completed games to recompute ratings")
+    rebuild_ratings.add_argument("--chunk-size", type=int, default=10000, help="Games rated per chunk")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    db = SessionLocal()
+    try:
+        if args.command == "rebuild-ratings":
+            games = PlayerRatingCRUD.rebuild(db, args.chunk_size)
+            summary = f"Rebuilt player ratings from {games} completed games"
+        else:
+            games = PlayerStatsCRUD.rebuild(db, args.batch_size)
+            summary = f"Rebuilt player statistics from {games} completed games"
+    finally:
+        db.close()
+    print(f"✅ {summary} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
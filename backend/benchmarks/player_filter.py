@@ -0,0 +1,126 @@
+"""Benchmark the grouped player co-occurrence filter against per-player EXISTS filters.
+
+Seeds games the way a club plays them: players belong to groups of 12
+regulars, and each game seats 3 to 10 players from one group. The first
+history page and the total count are then timed for 5 to 10 selected
+players from the same group. Use --groups 1 for the worst case, where every
+player appears in about half of all games.
+
+Usage: python benchmarks/player_filter.py [--games 100000] [--groups 50] [--database-url URL]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add the backend directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, desc, func, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app import crud, models, schemas
+from app.sample_games import CIRCLE_SIZE, GameGenerator
+
+CHUNK_SIZE = 10000
+
+
+def seed(engine, num_games: int, num_groups: int) -> list:
+    """Insert games and seatings only; rounds don't affect the player filter."""
+    with Session(engine) as db:
+        db.execute(insert(models.Player), [{"name": f"Filter Player {i}"} for i in range(num_groups * CIRCLE_SIZE)])
+        player_ids = db.execute(select(models.Player.id).order_by(models.Player.id)).scalars().all()
+        generator = GameGenerator(player_ids, 13, seats=(3, 10), guest_rate=0)
+        start = datetime(2020, 1, 1)
+
+        next_id = 1
+        for offset in range(0, num_games, CHUNK_SIZE):
+            count = min(CHUNK_SIZE, num_games - offset)
+            games = []
+            seats = []
+            for game_id in range(next_id, next_id + count):
+                games.append({
+                    "id": game_id,
+                    "created_at": start + timedelta(minutes=game_id),
+                    "max_cards": 5,
+                    "status": models.GameStatus.COMPLETED,
+                    "version": 1,
+                })
+                for position, player_id in enumerate(generator.pick_players()):
+                    seats.append({"game_id": game_id, "player_id": player_id, "position": position})
+            db.execute(insert(models.Game), games)
+            db.execute(insert(models.GamePlayer), seats)
+            next_id += count
+        db.commit()
+    return player_ids
+
+
+def legacy_filter(query, player_ids):
+    """One EXISTS subquery per selected player, as before."""
+    for player_id in player_ids:
+        query = query.where(models.Game.game_players.any(models.GamePlayer.player_id == player_id))
+    return query
+
+
+def grouped_filter(query, player_ids):
+    """The grouped semi-join used by GameCRUD.apply_filters."""
+    return crud.GameCRUD.apply_filters(query, schemas.GameHistoryFilter(player_ids=player_ids))
+
+
+def time_query(engine, stmt, repeat: int):
+    """Best-of-repeat wall time and the result of a statement."""
+    best = float("inf")
+    with engine.connect() as connection:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = connection.execute(stmt).all()
+            best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--groups", type=int, default=50, help=f"Groups of {CIRCLE_SIZE} regular players")
+    parser.add_argument("--database-url", default="sqlite://", help="Database to seed (default: in-memory SQLite)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.database_url == "sqlite://":
+        engine = create_engine(args.database_url, connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    else:
+        engine = create_engine(args.database_url)
+    models.Base.metadata.drop_all(bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+
+    start = time.perf_counter()
+    player_ids = seed(engine, args.games, args.groups)
+    if engine.dialect.name == "postgresql":
+        with engine.connect() as connection:
+            connection.exec_driver_sql("ANALYZE")
+            connection.commit()
+    print(f"Seeded {args.games} games for {args.groups} player groups "
+          f"in {time.perf_counter() - start:.1f}s ({engine.dialect.name})")
+    print(f"{'players':>7} {'matches':>8} {'legacy page':>12} {'grouped page':>13} {'legacy count':>13} {'grouped count':>14}")
+
+    for num_selected in range(5, 11):
+        selected = player_ids[:num_selected]
+        timings = {}
+        for name, apply in (("legacy", legacy_filter), ("grouped", grouped_filter)):
+            base = select(models.Game.id).outerjoin(models.Game.result)
+            page = apply(base, selected).order_by(desc(models.Game.created_at), desc(models.Game.id)).limit(20)
+            count = select(func.count()).select_from(apply(base, selected).subquery())
+            timings[name] = (time_query(engine, page, args.repeat), time_query(engine, count, args.repeat))
+
+        (legacy_page, legacy_rows), (legacy_count, legacy_total) = timings["legacy"]
+        (grouped_page, grouped_rows), (grouped_count, grouped_total) = timings["grouped"]
+        assert legacy_rows == grouped_rows and legacy_total == grouped_total
+        print(f"{num_selected:>7} {grouped_total[0][0]:>8} {legacy_page * 1000:>10.2f}ms {grouped_page * 1000:>11.2f}ms "
+              f"{legacy_count * 1000:>11.2f}ms {grouped_count * 1000:>12.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark the full rating rebuild against replaying games one at a time.
+
+Seeds completed games with their final standings (3 to 10 players from
+groups of 12 regulars), then times PlayerRatingCRUD.rebuild, which streams
+the games and rates them in waves of independent games, and a sequential
+replay of the same games. Both must produce the same ratings.
+
+Usage: python benchmarks/rating_rebuild.py [--games 100000] [--groups 50] [--database-url URL]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add the backend directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import numpy as np
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app import crud, models
+from app.ratings import INITIAL_RATING, pairwise_deltas
+from app.sample_games import CIRCLE_SIZE, GameGenerator
+CHUNK_SIZE = 10000
+
+
+def seed(engine, num_games: int, num_groups: int) -> None:
+    """
+    Insert games, seatings with final totals and results; rounds don't affect ratings.
+
+    Playing every round would dominate the seeding time, so final totals are drawn at random.
+    """
+    with Session(engine) as db:
+        db.execute(insert(models.Player), [{"name": f"Rated Player {i}"} for i in range(num_groups * CIRCLE_SIZE)])
+        player_ids = db.execute(select(models.Player.id).order_by(models.Player.id)).scalars().all()
+        generator = GameGenerator(player_ids, 15, seats=(3, 10), guest_rate=0)
+        rng = generator.rng
+        start = datetime(2020, 1, 1)
+
+        next_id = 1
+        for offset in range(0, num_games, CHUNK_SIZE):
+            count = min(CHUNK_SIZE, num_games - offset)
+            games, seats, results = [], [], []
+            for game_id in range(next_id, next_id + count):
+                played_at = start + timedelta(minutes=game_id)
+                games.append({
+                    "id": game_id,
+                    "created_at": played_at,
+                    "max_cards": 5,
+                    "status": models.GameStatus.COMPLETED,
+                    "version": 1,
+                })
+                players = generator.pick_players()
+                totals = [rng.randint(-40, 160) for _ in players]
+                for position, (player_id, total) in enumerate(zip(players, totals)):
+                    seats.append({"game_id": game_id, "player_id": player_id, "position": position, "current_total": total})
+                winner = max(range(len(players)), key=totals.__getitem__)
+                results.append({
+                    "game_id": game_id,
+                    "winner_id": players[winner],
+                    "winner_score": totals[winner],
+                    "final_scores": totals,
+                    "completed_at": played_at,
+                    "created_at": played_at,
+                })
+            db.execute(insert(models.Game), games)
+            db.execute(insert(models.GamePlayer), seats)
+            db.execute(insert(models.GameResult), results)
+            next_id += count
+        db.commit()
+
+
+def sequential_ratings(engine) -> dict:
+    """Replay every game on its own, in completion order."""
+    with Session(engine) as db:
+        ratings = {}
+        games = {}
+        for game_id, player_id, total in db.execute(crud.PlayerRatingCRUD.get_rated_games_query()):
+            players, totals = games.setdefault(game_id, ([], []))
+            players.append(player_id)
+            totals.append(total)
+    for players, totals in games.values():
+        before = np.array([[ratings.get(player_id, INITIAL_RATING) for player_id in players]])
+        deltas = pairwise_deltas(before, np.array([totals]), np.ones_like(before, dtype=bool))[0]
+        for player_id, rating in zip(players, before[0] + deltas):
+            ratings[player_id] = rating
+    return ratings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--groups", type=int, default=50, help=f"Groups of {CIRCLE_SIZE} regular players")
+    parser.add_argument("--database-url", default="sqlite://", help="Database to seed (default: in-memory SQLite)")
+    args = parser.parse_args()
+
+    if args.database_url == "sqlite://":
+        engine = create_engine(args.database_url, connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    else:
+        engine = create_engine(args.database_url)
+    models.Base.metadata.drop_all(bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+
+    start = time.perf_counter()
+    seed(engine, args.games, args.groups)
+    print(f"Seeded {args.games} games in {time.perf_counter() - start:.1f}s ({engine.dialect.name})")
+
+    start = time.perf_counter()
+    with Session(engine) as db:
+        crud.PlayerRatingCRUD.rebuild(db)
+    rebuild_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = sequential_ratings(engine)
+    sequential_time = time.perf_counter() - start
+
+    with Session(engine) as db:
+        rebuilt = dict(db.execute(select(models.Player.id, models.Player.rating)).all())
+    drift = max(abs(rebuilt[player_id] - rating) for player_id, rating in expected.items())
+    assert drift < 1e-6, f"Ratings differ by {drift}"
+
+    print(f"Rebuild (waves):     {rebuild_time:.2f}s")
+    print(f"Sequential replay:   {sequential_time:.2f}s")
+    print(f"Speedup:             {sequential_time / rebuild_time:.1f}x (max rating difference {drift:.1e})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Benchmark the orjson response path against validated response models.
+
+Seeds an in-memory SQLite database with one completed game of 10 players and
+33 rounds, plus enough imported games for a full history page. It then
+measures CPU time per request, across all threads, for the scoreboard and
+history routes in two versions:
+
+- before: handlers that build validated Pydantic models and let FastAPI
+  validate and serialize them again through response_model
+- after: the app's handlers, which return plain dicts as ORJSONResponse
+
+Both must return the same JSON.
+
+Usage: python benchmarks/response_serialization.py [requests]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+# Add the backend directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.testclient import TestClient
+from fastapi.utils import create_model_field
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import crud, importer, models, schemas
+from app.cache import scoreboard_cache
+from app.database import SessionRunner, get_runner
+from app.main import app
+from app.responses import ORJSONResponse
+from scoreboard_builder import MAX_CARDS, NUM_PLAYERS, seed_game
+from suite import generate_records
+
+HISTORY_GAMES = 150
+PAGE_SIZE = 100
+
+
+def validated_scoreboard(data: dict) -> schemas.ScoreboardResponse:
+    """Build scoreboard models the way the handler did before: one validated model per cell."""
+    players = {}
+    player_rows = []
+    for player_data in data["players"]:
+        rounds = []
+        for cell in player_data["rounds"]:
+            if cell is None:
+                rounds.append(None)
+                continue
+            player = players.get(cell["player_id"])
+            if player is None:
+                player = players[cell["player_id"]] = schemas.PlayerResponse(**cell["player"])
+            rounds.append(schemas.RoundScoreResponse(**{**cell, "player": player}))
+        player_rows.append(schemas.PlayerScoreboardData(**{**player_data, "rounds": rounds}))
+    return schemas.ScoreboardResponse(**{**data, "players": player_rows})
+
+
+def validated_history(games: list, page_size: int) -> schemas.GameHistoryResponse:
+    """Build history models the way the handler did before."""
+    summaries = []
+    for game in games:
+        result = game.result if game.status == schemas.GameStatus.COMPLETED else None
+        summaries.append(schemas.GameSummary(
+            id=game.id,
+            created_at=game.created_at,
+            status=game.status,
+            max_cards=game.max_cards,
+            players=[schemas.PlayerResponse(
+                id=gp.player.id,
+                name=gp.player.name,
+                created_at=gp.player.created_at
+            ) for gp in sorted(game.game_players, key=lambda x: x.position)],
+            final_scores=result.final_scores if result else None,
+            winner_id=result.winner_id if result else None
+        ))
+    return schemas.GameHistoryResponse(games=summaries, page=1, page_size=page_size)
+
+
+# The previous handlers, relying on response_model validation and serialization
+legacy_router = APIRouter(prefix="/legacy")
+# Models built per cached scoreboard, as the cache used to hold models
+legacy_models = {}
+
+
+@legacy_router.get("/games/{game_id}/scoreboard", response_model=schemas.ScoreboardResponse)
+async def legacy_scoreboard(game_id: int, db: SessionRunner = Depends(get_runner)):
+    data = await db.run(crud.ScoreboardService.get_scoreboard_data, game_id)
+    if id(data) not in legacy_models:
+        legacy_models.clear()
+        legacy_models[id(data)] = (data, validated_scoreboard(data))
+    return legacy_models[id(data)][1]
+
+
+@legacy_router.get("/games", response_model=schemas.GameHistoryResponse)
+async def legacy_history(page_size: int = Query(default=20), db: SessionRunner = Depends(get_runner)):
+    page = await db.run(
+        crud.GameCRUD.get_games_with_filters,
+        schemas.GameHistoryFilter(page_size=page_size, include_total=False)
+    )
+    return validated_history(page.games, page_size)
+
+
+def cpu_per_call(work: Callable[[], None], count: int, setup: Optional[Callable[[], None]] = None) -> float:
+    """Process CPU time per call in microseconds, setup excluded."""
+    work()
+    total = 0.0
+    for _ in range(count):
+        if setup:
+            setup()
+        start = time.process_time()
+        work()
+        total += time.process_time() - start
+    return total / count * 1e6
+
+
+def report(title: str, rows: List[tuple]) -> None:
+    print(f"\n{title}")
+    print(f"  {'':<28}{'before µs':>11}{'after µs':>11}{'speedup':>9}")
+    for name, before, after in rows:
+        print(f"  {name:<28}{before:>11.0f}{after:>11.0f}{before / after:>8.1f}x")
+
+
+def main(count: int = 300) -> None:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    models.Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with Session(engine) as db:
+        game_id = seed_game(db)
+        importer.import_games(db, generate_records(HISTORY_GAMES, 21))
+
+    async def get_test_runner():
+        db = session_factory()
+        try:
+            yield SessionRunner(db)
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_runner] = get_test_runner
+    app.include_router(legacy_router)
+    client = TestClient(app)
+
+    scoreboard_path = f"/games/{game_id}/scoreboard"
+    history_path = f"/games?page_size={PAGE_SIZE}&include_total=false"
+    assert client.get(scoreboard_path).content == client.get(f"/legacy{scoreboard_path}").content
+    history = client.get(history_path).json()["games"]
+    assert len(history) == PAGE_SIZE and history == client.get(f"/legacy{history_path}").json()["games"]
+
+    # Serialization only, from a cached scoreboard
+    with session_factory() as db:
+        data = crud.ScoreboardService.get_scoreboard_data(db, game_id)
+    model = validated_scoreboard(data)
+    field = create_model_field(name="scoreboard", type_=schemas.ScoreboardResponse, mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    def serialize_before():
+        JSONResponse(loop.run_until_complete(serialize_response(field=field, response_content=model)))
+
+    report(f"Serialize a cached {NUM_PLAYERS}-player, {MAX_CARDS * 2 - 1}-round scoreboard", [
+        ("scoreboard", cpu_per_call(serialize_before, count), cpu_per_call(lambda: ORJSONResponse(data), count)),
+    ])
+
+    # Whole requests through the app, including routing, middleware and the database
+    def request(path: str) -> Callable[[], None]:
+        return lambda: client.get(path).raise_for_status()
+
+    report(f"Per-request CPU through TestClient ({count} requests)", [
+        ("scoreboard (cached)",
+         cpu_per_call(request(f"/legacy{scoreboard_path}"), count),
+         cpu_per_call(request(scoreboard_path), count)),
+        ("scoreboard (cache cleared)",
+         cpu_per_call(request(f"/legacy{scoreboard_path}"), count, scoreboard_cache.clear),
+         cpu_per_call(request(scoreboard_path), count, scoreboard_cache.clear)),
+        (f"history ({PAGE_SIZE} games)",
+         cpu_per_call(request(f"/legacy{history_path}"), count),
+         cpu_per_call(request(history_path), count)),
+    ])
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
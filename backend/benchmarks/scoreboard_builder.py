@@ -0,0 +1,153 @@
+"""Benchmark the single-query scoreboard builder against the previous ORM path.
+
+Seeds an in-memory SQLite database with one completed game of 10 players and
+33 rounds (17 cards at the peak) and times both builders.
+
+Usage: python benchmarks/scoreboard_builder.py [iterations]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+from typing import Optional
+
+# Add the backend directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app import models, schemas, crud
+from app.sample_games import GameGenerator
+
+NUM_PLAYERS = 10
+MAX_CARDS = 17
+
+
+def legacy_build_scoreboard(db: Session, game_id: int) -> Optional[schemas.ScoreboardResponse]:
+    """Scoreboard builder as it was before the single-query engine."""
+    game = crud.GameCRUD.get_game(db, game_id)
+    if not game:
+        return None
+
+    # Get game players sorted by position
+    players = sorted(game.game_players, key=lambda gp: gp.position)
+    total_rounds = (game.max_cards * 2) - 1
+
+    # Get all rounds
+    rounds = crud.RoundCRUD.get_game_rounds(db, game_id)
+    current_round = len(rounds) + 1 if len(rounds) < total_rounds else total_rounds
+
+    # Build player scoreboard data
+    player_scoreboard_data = []
+    final_totals = []
+
+    for game_player in players:
+        player_rounds = [None] * total_rounds
+        final_total = 0
+
+        # Fill in completed rounds
+        for round_obj in rounds:
+            round_index = round_obj.round_number - 1
+
+            # Find this player's score for this round
+            player_score = next(
+                (rs for rs in round_obj.round_scores if rs.player_id == game_player.player_id),
+                None
+            )
+
+            if player_score:
+                player_rounds[round_index] = schemas.RoundScoreResponse(
+                    id=player_score.id,
+                    player_id=player_score.player_id,
+                    bid=player_score.bid,
+                    tricks_won=player_score.tricks_won,
+                    score=player_score.score,
+                    running_total=player_score.running_total,
+                    player=schemas.PlayerResponse(
+                        id=game_player.player.id,
+                        name=game_player.player.name,
+                        created_at=game_player.player.created_at
+                    )
+                )
+                final_total = player_score.running_total
+
+        player_scoreboard_data.append(schemas.PlayerScoreboardData(
+            player_id=game_player.player_id,
+            player_name=game_player.player.name,
+            position=game_player.position,
+            rounds=player_rounds,
+            final_total=final_total
+        ))
+        final_totals.append((game_player.player_id, final_total))
+
+    # Determine winner if game is complete
+    is_complete = len(rounds) == total_rounds
+    winner_id = crud.ScoreCalculator.get_winner(final_totals) if is_complete else None
+
+    return schemas.ScoreboardResponse(
+        game_id=game_id,
+        max_cards=game.max_cards,
+        total_rounds=total_rounds,
+        current_round=current_round,
+        players=player_scoreboard_data,
+        is_complete=is_complete,
+        winner_id=winner_id
+    )
+
+
+def seed_game(db: Session) -> int:
+    """Create a completed game with generated bids and tricks."""
+    players = [models.Player(name=f"Benchmark Player {i}") for i in range(NUM_PLAYERS)]
+    db.add_all(players)
+    db.flush()
+
+    player_ids = [p.id for p in players]
+    generator = GameGenerator(player_ids, 42)
+    game = crud.GameCRUD.create_game(db, schemas.GameCreate(max_cards=MAX_CARDS, player_ids=player_ids))
+    for round_number, cards in enumerate(crud.get_round_schedule(MAX_CARDS), start=1):
+        dealer = (round_number - 1) % NUM_PLAYERS
+        crud.RoundCRUD.create_round_with_scores(db, game.id, schemas.RoundDataSubmission(
+            round_number=round_number,
+            cards_count=cards,
+            dealer_position=dealer,
+            scores=[
+                schemas.RoundScoreCreate(player_id=player_id, bid=bid, tricks_won=tricks_won)
+                for player_id, (bid, tricks_won) in zip(player_ids, generator.play_round(player_ids, cards, dealer))
+            ]
+        ))
+    return game.id
+
+
+def main(iterations: int = 200) -> None:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    models.Base.metadata.create_all(bind=engine)
+
+    with Session(engine) as db:
+        game_id = seed_game(db)
+
+    with Session(engine) as db:
+        assert legacy_build_scoreboard(db, game_id) == schemas.ScoreboardResponse.model_validate(
+            crud.ScoreboardService.build_scoreboard(db, game_id)
+        )
+
+    def run_legacy():
+        with Session(engine) as db:
+            legacy_build_scoreboard(db, game_id)
+
+    def run_current():
+        with Session(engine) as db:
+            crud.ScoreboardService.build_scoreboard(db, game_id)
+
+    print(f"Scoreboard for {NUM_PLAYERS} players x {MAX_CARDS * 2 - 1} rounds, {iterations} iterations")
+    results = {}
+    for name, func in (("legacy", run_legacy), ("single-query", run_current)):
+        seconds = min(timeit.repeat(func, number=iterations, repeat=3)) / iterations
+        results[name] = seconds
+        print(f"  {name:<14}{seconds * 1000:8.2f} ms/build")
+    print(f"  speedup       {results['legacy'] / results['single-query']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,284 @@
+"""Benchmark suite for the CRUD and scoreboard hot paths.
+
+Seeds a database deterministically with --games historical games through the
+bulk importer, then times each hot path and reports latency percentiles and
+the number of SQL statements per call. Results are written as JSON, and
+--compare flags regressions against an earlier run: a p50 slower by more
+than --threshold, or more SQL statements per call. The exit status is 1 when
+a regression is found.
+
+Usage:
+    python benchmarks/suite.py --games 10000 --output baseline.json
+    python benchmarks/suite.py --games 10000 --reuse --compare baseline.json
+
+The database defaults to a SQLite file in the temp directory; pass
+--database-url to benchmark PostgreSQL. It is wiped unless --reuse is given.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+# Add the backend directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import numpy as np
+
+DEFAULT_DATABASE_URL = f"sqlite:///{Path(tempfile.gettempdir()) / 'boerenbridge_bench.db'}"
+SEED_START = datetime(2022, 1, 1, tzinfo=timezone.utc)
+PERCENTILES = (50, 90, 99)
+
+
+def generate_records(num_games: int, seed: int) -> Iterator[Tuple[int, dict]]:
+    """Generate deterministic importer records, 30 minutes apart; most games are completed."""
+    from app.sample_games import GameGenerator
+
+    names = [f"Bench Player {i}" for i in range(max(60, num_games // 50))]
+    return GameGenerator(names, seed).import_records(num_games, SEED_START, timedelta(minutes=30))
+
+
+def seed(engine, num_games: int, seed_value: int) -> None:
+    """Recreate the schema and import the generated games."""
+    from sqlalchemy.orm import Session
+    from app import importer, models
+
+    models.Base.metadata.drop_all(bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        result = importer.import_games(db, generate_records(num_games, seed_value), chunk_size=1000)
+        assert not result.errors, result.errors[:3]
+    if engine.dialect.name == "postgresql":
+        with engine.connect() as connection:
+            connection.exec_driver_sql("ANALYZE")
+            connection.commit()
+
+
+class StatementCounter:
+    """Counts SQL statements sent to an engine."""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._count)
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def measure(
+    name: str,
+    work: Callable[[int], None],
+    counter: StatementCounter,
+    iterations: int,
+    warmup: int,
+    setup: Callable[[int], None] = None
+) -> dict:
+    """Time work(i) for each iteration and summarize latency and statement counts."""
+    samples = []
+    statements = []
+    for i in range(-warmup, iterations):
+        if setup:
+            setup(i)
+        before = counter.count
+        start = time.perf_counter()
+        work(i)
+        elapsed = time.perf_counter() - start
+        if i >= 0:
+            samples.append(elapsed * 1000)
+            statements.append(counter.count - before)
+
+    values = np.percentile(samples, PERCENTILES)
+    result = {f"p{p}_ms": round(float(v), 3) for p, v in zip(PERCENTILES, values)}
+    result.update({
+        "mean_ms": round(float(np.mean(samples)), 3),
+        "min_ms": round(float(np.min(samples)), 3),
+        "max_ms": round(float(np.max(samples)), 3),
+        "statements": max(statements),
+        "iterations": iterations,
+    })
+    print(f"{name:<46} {result['p50_ms']:>9.2f} {result['p90_ms']:>9.2f} {result['p99_ms']:>9.2f} "
+          f"{result['statements']:>6}")
+    return result
+
+
+def run_suite(iterations: int, warmup: int, seed_value: int) -> Dict[str, dict]:
+    """Run every benchmark against the database configured in app.database."""
+    from fastapi.testclient import TestClient
+    from sqlalchemy import func, select
+
+    from app import crud, models, schemas
+    from app.cache import history_count_cache, scoreboard_cache
+    from app.database import SessionLocal, engine
+    from app.main import app
+
+    rng = random.Random(seed_value)
+    with SessionLocal() as db:
+        completed = db.execute(
+            select(models.Game.id).where(models.Game.status == models.GameStatus.COMPLETED).order_by(models.Game.id)
+        ).scalars().all()
+        frequent_players = db.execute(
+            select(models.GamePlayer.player_id)
+            .group_by(models.GamePlayer.player_id)
+            .order_by(func.count().desc(), models.GamePlayer.player_id)
+            .limit(2)
+        ).scalars().all()
+        player_ids = db.execute(select(models.Player.id).order_by(models.Player.id).limit(4)).scalars().all()
+    assert completed, "The database has no completed games to benchmark"
+    games = [rng.choice(completed) for _ in range(warmup + iterations)]
+
+    # Fresh games to submit rounds to, removed again afterwards
+    with SessionLocal() as db:
+        new_games = [
+            crud.GameCRUD.create_game(db, schemas.GameCreate(max_cards=5, player_ids=player_ids)).id
+            for _ in range(warmup + iterations)
+        ]
+    round_data = schemas.RoundDataSubmission(
+        round_number=1,
+        cards_count=1,
+        dealer_position=0,
+        scores=[
+            schemas.RoundScoreCreate(player_id=player_id, bid=int(i == 0), tricks_won=int(i == 0))
+            for i, player_id in enumerate(player_ids)
+        ]
+    )
+
+    def with_session(fn: Callable) -> Callable[[int], None]:
+        def work(i: int) -> None:
+            with SessionLocal() as db:
+                fn(db, i)
+        return work
+
+    def history(filters: schemas.GameHistoryFilter) -> Callable[[int], None]:
+        return with_session(lambda db, i: crud.GameCRUD.get_games_with_filters(db, filters))
+
+    counter = StatementCounter(engine)
+    client = TestClient(app)
+    clear_counts = lambda i: history_count_cache.clear()
+    clear_scoreboards = lambda i: scoreboard_cache.clear()
+
+    benchmarks = [
+        ("RoundCRUD.submit_rounds", with_session(
+            lambda db, i: crud.RoundCRUD.submit_rounds(db, new_games[i + warmup], [round_data])
+        ), None),
+        ("RoundCRUD.get_running_totals", with_session(
+            lambda db, i: crud.RoundCRUD.get_running_totals(db, games[i + warmup], 5)
+        ), None),
+        ("ScoreboardService.get_scoreboard_data (cold)", with_session(
+            lambda db, i: crud.ScoreboardService.get_scoreboard_data(db, games[i + warmup])
+        ), clear_scoreboards),
+        ("ScoreboardService.get_scoreboard_data (cached)", with_session(
+            lambda db, i: crud.ScoreboardService.get_scoreboard_data(db, games[0])
+        ), None),
+        ("GameCRUD.get_games_with_filters (date)",
+         history(schemas.GameHistoryFilter()), clear_counts),
+        ("GameCRUD.get_games_with_filters (players)",
+         history(schemas.GameHistoryFilter(player_ids=frequent_players)), clear_counts),
+        ("GameCRUD.get_games_with_filters (winner)",
+         history(schemas.GameHistoryFilter(sort_by="winner_score")), clear_counts),
+        ("GameCRUD.get_games_with_filters (no total)",
+         history(schemas.GameHistoryFilter(include_total=False)), None),
+        ("GET /games (get_games_history)",
+         lambda i: client.get("/games").raise_for_status(), clear_counts),
+    ]
+
+    print(f"{'benchmark':<46} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'stmts':>6}")
+    try:
+        return {
+            name: measure(name, work, counter, iterations, warmup, setup)
+            for name, work, setup in benchmarks
+        }
+    finally:
+        with SessionLocal() as db:
+            for game_id in new_games:
+                db.delete(db.get(models.Game, game_id))
+            db.commit()
+
+
+def compare(baseline: dict, results: Dict[str, dict], threshold: float) -> List[str]:
+    """List the benchmarks that regressed against a baseline run."""
+    regressions = []
+    print(f"\n{'benchmark':<46} {'base p50':>9} {'p50':>9} {'ratio':>6} {'stmts':>9}")
+    for name, result in results.items():
+        before = baseline["results"].get(name)
+        if not before:
+            continue
+        ratio = result["p50_ms"] / before["p50_ms"] if before["p50_ms"] else 1.0
+        slower = ratio > 1 + threshold
+        more_statements = result["statements"] > before["statements"]
+        flag = "  REGRESSION" if slower or more_statements else ""
+        print(f"{name:<46} {before['p50_ms']:>9.2f} {result['p50_ms']:>9.2f} {ratio:>5.2f}x "
+              f"{before['statements']:>4} -> {result['statements']:<3}{flag}")
+        if slower:
+            regressions.append(f"{name}: p50 {before['p50_ms']:.2f}ms -> {result['p50_ms']:.2f}ms")
+        if more_statements:
+            regressions.append(f"{name}: {before['statements']} -> {result['statements']} statements")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=1000, help="Games to seed, e.g. 1000, 10000 or 100000")
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--reuse", action="store_true", help="Benchmark the existing database without reseeding")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=17)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed p50 slowdown (default: 0.2 = 20%%)")
+    args = parser.parse_args()
+
+    # The app reads its database settings on import
+    os.environ["DATABASE_URL"] = args.database_url
+    import sqlalchemy
+    from app.database import engine
+
+    if not args.reuse:
+        start = time.perf_counter()
+        seed(engine, args.games, args.seed)
+        print(f"Seeded {args.games} games in {time.perf_counter() - start:.1f}s ({engine.dialect.name})")
+
+    results = run_suite(args.iterations, args.warmup, args.seed)
+    report = {
+        "meta": {
+            "games": args.games,
+            "dialect": engine.dialect.name,
+            "iterations": args.iterations,
+            "seed": args.seed,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        for key in ("games", "dialect"):
+            if baseline["meta"].get(key) != report["meta"][key]:
+                print(f"⚠️  Baseline {key} differs: {baseline['meta'].get(key)} vs {report['meta'][key]}")
+        regressions = compare(baseline, results, args.threshold)
+        if regressions:
+            print("\n❌ Regressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
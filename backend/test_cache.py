@@ -0,0 +1,58 @@
+"""Tests for the scoreboard cache and its backends."""
+
+import sys
+import threading
+from pathlib import Path
+
+# Add the app directory to the Python path
+sys.path.append(str(Path(__file__).parent))
+
+from app.cache import LRUCacheBackend, ScoreboardCache, SharedMappingBackend
+from app.metrics import RequestMetrics, render_prometheus
+
+
+def test_new_version_replaces_cached_scoreboard():
+    """Caching a game's new version drops the older one instead of keeping both."""
+    backend = LRUCacheBackend()
+    cache = ScoreboardCache(backend)
+    cache.set(1, 1, {"version": 1})
+    cache.set(1, 2, {"version": 2})
+    assert len(backend._entries) == 1
+    assert cache.get(1, 1) is None
+    assert cache.get(1, 2) == {"version": 2}
+    assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_shared_backend_is_bounded():
+    """The shared store never grows past max_size."""
+    store = {}
+    cache = ScoreboardCache(SharedMappingBackend(store, max_size=8))
+    for game_id in range(50):
+        cache.set(game_id, 1, {"game_id": game_id})
+        assert len(store) <= 8
+    assert cache.get(49, 1) == {"game_id": 49}
+
+
+def test_counters_are_thread_safe():
+    """Concurrent lookups are all counted."""
+    cache = ScoreboardCache(LRUCacheBackend())
+    cache.set(1, 1, {})
+
+    def look_up():
+        for _ in range(2000):
+            cache.get(1, 1)
+            cache.get(2, 1)
+
+    threads = [threading.Thread(target=look_up) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.stats() == {"hits": 16000, "misses": 16000}
+
+
+def test_cache_counters_are_exported():
+    """Cache hits and misses appear in the Prometheus output."""
+    text = render_prometheus(RequestMetrics(), {}, {"scoreboard": {"hits": 3, "misses": 2}})
+    assert 'cache_hits_total{cache="scoreboard"} 3' in text
+    assert 'cache_misses_total{cache="scoreboard"} 2' in text
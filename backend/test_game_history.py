@@ -0,0 +1,145 @@
+"""Tests for paging through game history.
+
+Uses an in-memory SQLite database seeded through the importer.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add the app directory to the Python path
+sys.path.append(str(Path(__file__).parent))
+
+from sqlalchemy.orm import Session
+
+from app import crud, importer, models, schemas
+from app.cache import history_count_cache
+from testutils import memory_engine, sample_records
+
+NUM_GAMES = 60
+
+
+@pytest.fixture(scope="module")
+def db():
+    """Session on a seeded in-memory database."""
+    engine = memory_engine()
+    history_count_cache.clear()
+    with Session(engine) as db:
+        result = importer.import_games(db, sample_records(NUM_GAMES))
+        assert not result.errors
+        yield db
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def tied_db():
+    """Session on a seeded in-memory database where games are created three at a time."""
+    engine = memory_engine()
+    start = datetime(2024, 5, 1)
+    records = (
+        (line, {**record, "created_at": (start + timedelta(hours=line // 3)).isoformat()})
+        for line, record in sample_records(NUM_GAMES - 1)
+    )
+    with Session(engine) as db:
+        result = importer.import_games(db, records)
+        assert not result.errors
+        yield db
+    engine.dispose()
+
+
+def all_pages(db, **filters):
+    """Concatenate every page of the history for the given filters."""
+    games = []
+    for page in range(1, NUM_GAMES):
+        page = crud.GameCRUD.get_games_with_filters(
+            db, schemas.GameHistoryFilter(page=page, page_size=7, include_total=False, **filters)
+        )
+        if not page.games:
+            return games
+        games.extend(page.games)
+    raise AssertionError("History never ran out of pages")
+
+
+@pytest.mark.parametrize("sort_order", ["desc", "asc"])
+def test_winner_score_pages_put_unfinished_games_last(db, sort_order):
+    """Pages sorted by winner score cover every game once, unfinished games after the completed ones."""
+    games = db.query(models.Game).all()
+    completed = sorted(
+        (game for game in games if game.status == models.GameStatus.COMPLETED),
+        key=lambda game: (game.result.winner_score, game.result.created_at, game.id),
+        reverse=sort_order == "desc"
+    )
+    unfinished = sorted(
+        (game for game in games if game.status != models.GameStatus.COMPLETED),
+        key=lambda game: (game.created_at, game.id),
+        reverse=True
+    )
+    assert completed and unfinished
+
+    paged = all_pages(db, sort_by="winner_score", sort_order=sort_order)
+    assert [game.id for game in paged] == [game.id for game in completed + unfinished]
+    assert all(game.result is None for game in paged[len(completed):])
+
+
+def test_winner_score_filters_skip_unfinished_games(db):
+    """Winner score filters only ever match completed games."""
+    paged = all_pages(db, sort_by="winner_score", min_winner_score=0)
+    assert paged
+    assert all(game.result.winner_score >= 0 for game in paged)
+
+
+def walk_cursors(db, direction: str, cursor=None, **filters):
+    """Follow next or prev cursors from a page, returning the pages visited."""
+    pages = []
+    while True:
+        page = crud.GameCRUD.get_games_with_filters(
+            db, schemas.GameHistoryFilter(page_size=4, include_total=False, cursor=cursor, **filters)
+        )
+        pages.append([game.id for game in page.games])
+        cursor = page.next_cursor if direction == "next" else page.prev_cursor
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize("sort_order", ["desc", "asc"])
+def test_cursors_page_through_tied_dates(tied_db, sort_order):
+    """Next and prev cursors visit every game once, in order, when creation dates tie."""
+    games = tied_db.query(models.Game).all()
+    assert len({game.created_at for game in games}) < len(games)
+    expected = [
+        game.id for game in sorted(
+            games, key=lambda game: (game.created_at, game.id), reverse=sort_order == "desc"
+        )
+    ]
+
+    forward = walk_cursors(tied_db, "next", sort_order=sort_order)
+    assert [game_id for page in forward for game_id in page] == expected
+    # 59 games in pages of 4 end with a short page, which has no next cursor
+    assert [len(page) for page in forward] == [4] * 14 + [3]
+
+    # Walking back from the last page revisits the same pages in reverse
+    last = crud.GameCRUD.get_games_with_filters(
+        tied_db, schemas.GameHistoryFilter(page=len(forward), page_size=4, include_total=False, sort_order=sort_order)
+    )
+    assert [game.id for game in last.games] == forward[-1]
+    assert last.next_cursor is None
+    backward = walk_cursors(tied_db, "prev", last.prev_cursor, sort_order=sort_order)
+    assert backward == forward[-2::-1]
+
+
+def test_cursor_round_trip_returns_the_same_page(tied_db):
+    """Going to the next page and back gives the starting page and its cursors."""
+    first = crud.GameCRUD.get_games_with_filters(
+        tied_db, schemas.GameHistoryFilter(page_size=4, include_total=False)
+    )
+    second = crud.GameCRUD.get_games_with_filters(
+        tied_db, schemas.GameHistoryFilter(page_size=4, include_total=False, cursor=first.next_cursor)
+    )
+    back = crud.GameCRUD.get_games_with_filters(
+        tied_db, schemas.GameHistoryFilter(page_size=4, include_total=False, cursor=second.prev_cursor)
+    )
+    assert [game.id for game in back.games] == [game.id for game in first.games]
+    assert back.next_cursor == first.next_cursor
+    assert first.prev_cursor is None and back.prev_cursor is None
@@ -0,0 +1,177 @@
+"""Tests for the bulk game importer.
+
+Uses an in-memory SQLite database.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the app directory to the Python path
+sys.path.append(str(Path(__file__).parent))
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import exporter, importer, models, schemas
+from app.crud import get_round_schedule
+from app.database import get_async_database_url
+from testutils import MAX_CARDS, api_client, memory_engine, sample_records
+
+
+@pytest.fixture
+def db():
+    """Session on an empty in-memory database."""
+    engine = memory_engine()
+    with Session(engine) as db:
+        yield db
+    engine.dispose()
+
+
+def game(players, played=None, **round_fields):
+    """Game record in which the first player bids and wins every trick."""
+    schedule = get_round_schedule(MAX_CARDS)
+    rounds = [
+        {"bids": [cards] + [0] * (len(players) - 1), "tricks": [cards] + [0] * (len(players) - 1), **round_fields}
+        for cards in schedule[:played]
+    ]
+    return {"players": players, "max_cards": MAX_CARDS, "created_at": "2024-03-01T20:00:00", "rounds": rounds}
+
+
+def import_lines(db, *records):
+    lines = [record if isinstance(record, str) else json.dumps(record) for record in records]
+    return importer.import_games(db, importer.read_records(lines, "ndjson"))
+
+
+def test_counts_only_players_it_creates(db):
+    """Existing players are reused and not counted as created."""
+    db.add(models.Player(name="Ann"))
+    db.commit()
+
+    result = import_lines(db, game(["Ann", "Bob", "Cas"]), game(["Bob", "Cas", "Dirk"], played=4))
+    assert not result.errors
+    assert result.games_imported == 2
+    assert result.rounds_imported == len(get_round_schedule(MAX_CARDS)) + 4
+    assert result.players_created == 3
+    assert db.execute(select(func.count(models.Player.id))).scalar_one() == 4
+
+    statuses = db.execute(select(models.Game.status).order_by(models.Game.id)).scalars().all()
+    assert statuses == [models.GameStatus.COMPLETED, models.GameStatus.ABANDONED]
+    assert db.execute(select(func.count()).select_from(models.GameResult)).scalar_one() == 1
+
+
+def test_reports_rejected_lines(db):
+    """Invalid records are reported by line number and the valid ones are still imported."""
+    wrong_tricks = game(["Ann", "Bob", "Cas"], played=2)
+    wrong_tricks["rounds"][1]["tricks"] = [1, 0, 0]
+
+    result = import_lines(
+        db,
+        game(["Ann", "Bob", "Cas"]),
+        "{not json",
+        game(["Ann", "Ann", "Bob"]),
+        wrong_tricks,
+        game(["Ann", "Bob"]),
+        game(["Bob", "Cas", "Dirk"], played=3),
+    )
+    assert result.games_imported == 2
+    assert [(error.line, error.detail) for error in result.errors] == [
+        (2, "Invalid JSON: Expecting property name enclosed in double quotes"),
+        (3, "Player names must be unique within a game"),
+        (4, "Round 2 tricks must sum to 2"),
+        (5, "players: List should have at least 3 items after validation, not 2"),
+    ]
+
+
+def test_explicit_cards_must_follow_the_schedule(db):
+    """Explicit card counts are checked against the round schedule instead of trusted."""
+    matching = game(["Ann", "Bob", "Cas"], played=3)
+    for round_data, cards in zip(matching["rounds"], get_round_schedule(MAX_CARDS)):
+        round_data["cards_count"] = cards
+    off_schedule = game(["Ann", "Bob", "Cas"], played=3)
+    off_schedule["rounds"][2].update(cards_count=4, bids=[4, 0, 0], tricks=[4, 0, 0])
+
+    result = import_lines(db, matching, off_schedule)
+    assert result.games_imported == 1
+    assert [(error.line, error.detail) for error in result.errors] == [
+        (2, "Round 3 is dealt 3 cards, got 4"),
+    ]
+    cards = db.execute(select(models.Round.cards_count).order_by(models.Round.round_number)).scalars().all()
+    assert cards == [1, 2, 3]
+
+
+class TrackedSession(Session):
+    """Session that records whether it was closed."""
+    closed = False
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+def export(engine, file_format):
+    """Export every game through the API, checking that the request's session gets closed."""
+    sessions = []
+
+    def session_factory():
+        sessions.append(TrackedSession(engine, autoflush=False))
+        return sessions[-1]
+
+    with api_client(session_factory) as client:
+        response = client.get("/games/export", params={"format": file_format})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(exporter.MEDIA_TYPES[file_format])
+    assert sessions and all(session.closed for session in sessions)
+    return response.text
+
+
+@pytest.mark.parametrize("file_format", ["ndjson", "csv"])
+def test_export_round_trip(file_format):
+    """Importing an export into an empty database recreates the same games."""
+    engine = memory_engine()
+    with Session(engine) as db:
+        assert not importer.import_games(db, sample_records(30)).errors
+    exported = export(engine, file_format)
+
+    copy = memory_engine()
+    with api_client(sessionmaker(autocommit=False, autoflush=False, bind=copy)) as client:
+        response = client.post(
+            "/games/import", params={"format": file_format}, files={"file": (f"games.{file_format}", exported)}
+        )
+    assert response.json()["games_imported"] == 30 and not response.json()["errors"]
+    assert export(copy, file_format) == exported
+
+    results = select(models.GameResult.winner_id, models.GameResult.final_scores).order_by(models.GameResult.game_id)
+    with Session(engine) as db, Session(copy) as copy_db:
+        assert copy_db.execute(results).all() == db.execute(results).all()
+    engine.dispose()
+    copy.dispose()
+
+
+@pytest.mark.parametrize("file_format", ["ndjson", "csv"])
+def test_async_export_matches_sync_export(tmp_path, monkeypatch, file_format):
+    """The async export gives the same output when games are split across fetched batches."""
+    url = f"sqlite:///{tmp_path / 'export.db'}"
+    engine = create_engine(url)
+    models.Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        assert not importer.import_games(db, sample_records(10)).errors
+        expected = "".join(exporter.stream_export(db, schemas.GameHistoryFilter(), file_format))
+    engine.dispose()
+
+    # Small batches, so most games straddle two of them
+    monkeypatch.setattr(exporter, "EXPORT_BATCH_ROWS", 7)
+
+    async def export_async():
+        async_engine = create_async_engine(get_async_database_url(url))
+        try:
+            stream = exporter.stream_export_async(AsyncSession(async_engine), schemas.GameHistoryFilter(), file_format)
+            return "".join([chunk async for chunk in stream])
+        finally:
+            await async_engine.dispose()
+
+    assert asyncio.run(export_async()) == expected
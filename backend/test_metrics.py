@@ -0,0 +1,81 @@
+"""Tests for the request metrics middleware and the Prometheus endpoint.
+
+Uses an in-memory SQLite database.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the app directory to the Python path
+sys.path.append(str(Path(__file__).parent))
+
+from sqlalchemy.orm import sessionmaker
+
+from app.metrics import instrument_engine, request_metrics
+from testutils import MAX_CARDS, api_client, memory_engine
+
+GAME_ROUTE = 'method="GET",route="/games/{game_id}"'
+
+
+@pytest.fixture
+def client():
+    """TestClient on an empty, instrumented in-memory database, with no request metrics yet."""
+    engine = memory_engine()
+    instrument_engine(engine)
+    request_metrics.routes.clear()
+    with api_client(sessionmaker(autocommit=False, autoflush=False, bind=engine)) as client:
+        yield client
+    engine.dispose()
+
+
+def scrape(client) -> dict:
+    """Scrape /metrics into a dict of sample name and labels to value."""
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    samples = {}
+    for line in response.text.splitlines():
+        if line and not line.startswith("#"):
+            sample, value = line.rsplit(" ", 1)
+            samples[sample] = float(value)
+    return samples
+
+
+def test_requests_are_labelled_by_route_template(client):
+    """Requests are counted under their route template, with latency and SQL histograms."""
+    player_ids = [client.post("/players", json={"name": name}).json()["id"] for name in ("Ann", "Bob", "Cas")]
+    game_id = client.post("/games", json={"player_ids": player_ids, "max_cards": MAX_CARDS}).json()["id"]
+    assert client.get(f"/games/{game_id}").status_code == 200
+    assert client.get(f"/games/{game_id}").status_code == 200
+    assert client.get("/games/999999").status_code == 404
+    assert client.get("/no-such-path").status_code == 404
+
+    samples = scrape(client)
+    assert samples[f'http_requests_total{{{GAME_ROUTE},status="200"}}'] == 2
+    assert samples[f'http_requests_total{{{GAME_ROUTE},status="404"}}'] == 1
+    assert samples['http_requests_total{method="POST",route="/players",status="200"}'] == 3
+    assert samples['http_requests_total{method="GET",route="unmatched",status="404"}'] == 1
+    # Raw paths never become labels
+    assert not any(f"/games/{game_id}" in sample or "999999" in sample for sample in samples)
+
+    assert samples[f'http_request_duration_seconds_bucket{{{GAME_ROUTE},le="+Inf"}}'] == 3
+    assert samples[f'http_request_duration_seconds_count{{{GAME_ROUTE}}}'] == 3
+    assert samples[f'http_response_size_bytes_count{{{GAME_ROUTE}}}'] == 3
+    assert samples[f'http_request_db_statements_count{{{GAME_ROUTE}}}'] == 3
+    # Every game lookup runs at least one statement
+    assert samples[f'http_request_db_statements_bucket{{{GAME_ROUTE},le="0.0"}}'] == 0
+    assert samples[f'http_request_db_statements_sum{{{GAME_ROUTE}}}'] >= 3
+    assert samples[f'http_request_db_duration_seconds_sum{{{GAME_ROUTE}}}'] > 0
+
+
+def test_in_flight_gauge_returns_to_zero(client):
+    """Finished requests no longer count as in flight."""
+    client.post("/players", json={"name": "Ann"}).raise_for_status()
+    client.get("/players").raise_for_status()
+
+    samples = scrape(client)
+    assert samples['http_requests_in_flight{method="POST"}'] == 0
+    # The scrape itself is the only GET in flight
+    assert samples['http_requests_in_flight{method="GET"}'] == 1
+    assert scrape(client)['http_requests_in_flight{method="GET"}'] == 1
@@ -0,0 +1,87 @@
+"""Tests for the player name search.
+
+Uses an in-memory SQLite database seeded through the importer.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add the app directory to the Python path
+sys.path.append(str(Path(__file__).parent))
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import importer, models
+from app.crud import RECENT_PLAY_DAYS, get_round_schedule
+from testutils import MAX_CARDS, api_client, memory_engine
+
+
+@pytest.fixture(scope="module")
+def client():
+    """TestClient on an in-memory database with recent and old games."""
+    engine = memory_engine()
+    now = datetime.now()
+    recent = (now - timedelta(days=1)).isoformat()
+    old = (now - timedelta(days=RECENT_PLAY_DAYS + 10)).isoformat()
+
+    def record(players, created_at):
+        rounds = [{"bids": [cards, 0, 0], "tricks": [cards, 0, 0]} for cards in get_round_schedule(MAX_CARDS)]
+        return {"players": players, "max_cards": MAX_CARDS, "created_at": created_at, "rounds": rounds}
+
+    records = [
+        record(["Anton", "andy", "Dan"], recent),
+        record(["Anton", "Dan", "Bob"], recent),
+        *(record(["Ann", "Anne", "Bob"], old) for _ in range(3)),
+    ]
+    with Session(engine) as db:
+        assert not importer.import_games(db, enumerate(records, 1)).errors
+        db.add_all(models.Player(name=name) for name in ("100% Sure", "1000 Club", "a_b", "axb"))
+        db.commit()
+
+    with api_client(sessionmaker(autocommit=False, autoflush=False, bind=engine)) as client:
+        yield client
+    engine.dispose()
+
+
+def search(client, q, **params):
+    response = client.get("/players/search", params={"q": q, **params})
+    assert response.status_code == 200
+    return [(player["name"], player["recent_games"]) for player in response.json()]
+
+
+def test_matches_name_prefixes_ignoring_case(client):
+    """Only names starting with the query match, whatever their case."""
+    assert {name for name, _ in search(client, "an")} == {"Anton", "andy", "Ann", "Anne"}
+    assert {name for name, _ in search(client, "AN")} == {"Anton", "andy", "Ann", "Anne"}
+    assert search(client, "dan") == [("Dan", 2)]
+    assert search(client, "nton") == []
+
+
+def test_ranks_by_recent_games_then_name(client):
+    """Players with more recent games come first; ties are broken by name."""
+    assert search(client, "an") == [("Anton", 2), ("andy", 1), ("Ann", 0), ("Anne", 0)]
+    # Bob's old games don't count
+    assert search(client, "b") == [("Bob", 1)]
+
+
+@pytest.mark.parametrize("q, expected", [
+    ("%", []),
+    ("_", []),
+    ("100%", ["100% Sure"]),
+    ("a_", ["a_b"]),
+    ("ax", ["axb"]),
+])
+def test_wildcards_match_literally(client, q, expected):
+    """% and _ in the query are matched as characters, not as LIKE wildcards."""
+    assert [name for name, _ in search(client, q)] == expected
+
+
+def test_limit(client):
+    """At most limit players are returned, the best ranked ones."""
+    assert search(client, "a", limit=2) == [("Anton", 2), ("andy", 1)]
+    assert len(search(client, "a")) == 6
+    assert client.get("/players/search", params={"q": "a", "limit": 51}).status_code == 422
+    assert client.get("/players/search", params={"q": ""}).status_code == 422
@@ -0,0 +1,102 @@
+"""Tests for the incrementally maintained player statistics.
+
+Uses an in-memory SQLite database.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the app directory to the Python path
+sys.path.append(str(Path(__file__).parent))
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import crud
+from app.crud import get_round_schedule
+from testutils import MAX_CARDS, api_client, memory_engine, round_data
+
+# Final totals of a game played by play_game, per seat
+FIRST_SEAT_TOTAL = 140  # Bids and wins every trick: 9 * 10 + 2 * 25
+SECOND_SEAT_TOTAL = 90  # Bids and wins nothing: 9 * 10
+THIRD_SEAT_TOTAL = 66   # As the second seat, but bids 1 in the two one-card rounds: 7 * 10 - 2 * 2
+
+
+@pytest.fixture
+def engine():
+    engine = memory_engine()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    """TestClient on an empty in-memory database."""
+    with api_client(sessionmaker(autocommit=False, autoflush=False, bind=engine)) as client:
+        yield client
+
+
+def play_game(client, player_ids):
+    """Play a complete game with the final totals above, returning its ID."""
+    game_id = client.post("/games", json={"player_ids": player_ids, "max_cards": MAX_CARDS}).json()["id"]
+    rounds = [round_data(player_ids, number) for number in range(1, len(get_round_schedule(MAX_CARDS)) + 1)]
+    for data in rounds:
+        if data["cards_count"] == 1:
+            data["scores"][2]["bid"] = 1
+    client.post(f"/games/{game_id}/rounds:batch", json={"rounds": rounds}).raise_for_status()
+    assert client.get(f"/games/{game_id}").json()["status"] == "completed"
+    return game_id
+
+
+def by_cards(*rounds_and_exact):
+    """Expected bid accuracy per card count, from (rounds played, exact bids) for 1 to 5 cards."""
+    return [
+        {"cards_count": cards, "rounds_played": rounds, "exact_bids": exact, "accuracy": exact / rounds}
+        for cards, (rounds, exact) in enumerate(rounds_and_exact, start=1)
+    ]
+
+
+def test_stats_add_up_over_completed_games(engine, client):
+    """Totals, best and worst games and bid accuracy per card count match two played games."""
+    ann, bob, cas = (client.post("/players", json={"name": name}).json()["id"] for name in ("Ann", "Bob", "Cas"))
+    first = play_game(client, [ann, bob, cas])
+    second = play_game(client, [cas, ann, bob])
+
+    stats = {player_id: client.get(f"/players/{player_id}/stats").json() for player_id in (ann, bob, cas)}
+    ann_stats, bob_stats, cas_stats = stats.values()
+
+    assert ann_stats["games_played"] == 2 and ann_stats["wins"] == 1
+    assert ann_stats["win_rate"] == 0.5
+    assert ann_stats["average_score"] == (FIRST_SEAT_TOTAL + SECOND_SEAT_TOTAL) / 2
+    assert ann_stats["bid_accuracy"] == 1.0
+    assert ann_stats["best_game"] == {"game_id": first, "final_score": FIRST_SEAT_TOTAL}
+    assert ann_stats["worst_game"] == {"game_id": second, "final_score": SECOND_SEAT_TOTAL}
+    assert ann_stats["bid_accuracy_by_cards"] == by_cards((4, 4), (4, 4), (4, 4), (4, 4), (2, 2))
+
+    assert bob_stats["wins"] == 0 and bob_stats["win_rate"] == 0.0
+    assert bob_stats["average_score"] == (SECOND_SEAT_TOTAL + THIRD_SEAT_TOTAL) / 2
+    assert bob_stats["bid_accuracy"] == 16 / 18
+    assert bob_stats["best_game"] == {"game_id": first, "final_score": SECOND_SEAT_TOTAL}
+    assert bob_stats["worst_game"] == {"game_id": second, "final_score": THIRD_SEAT_TOTAL}
+    assert bob_stats["bid_accuracy_by_cards"] == by_cards((4, 2), (4, 4), (4, 4), (4, 4), (2, 2))
+
+    assert cas_stats["wins"] == 1
+    assert cas_stats["best_game"] == {"game_id": second, "final_score": FIRST_SEAT_TOTAL}
+    assert cas_stats["worst_game"] == {"game_id": first, "final_score": THIRD_SEAT_TOTAL}
+
+    # Recomputing from scratch gives the same statistics
+    with Session(engine) as db:
+        assert crud.PlayerStatsCRUD.rebuild(db) == 2
+    assert {player_id: client.get(f"/players/{player_id}/stats").json() for player_id in stats} == stats
+
+
+def test_unfinished_games_do_not_count(client):
+    """Rounds of a game that isn't completed stay out of the statistics."""
+    player_ids = [client.post("/players", json={"name": name}).json()["id"] for name in ("Ann", "Bob", "Cas")]
+    game_id = client.post("/games", json={"player_ids": player_ids, "max_cards": MAX_CARDS}).json()["id"]
+    client.post(f"/games/{game_id}/rounds", json=round_data(player_ids, 1)).raise_for_status()
+
+    stats = client.get(f"/players/{player_ids[0]}/stats").json()
+    assert (stats["games_played"], stats["bid_accuracy"], stats["best_game"]) == (0, None, None)
+    assert stats["bid_accuracy_by_cards"] == []
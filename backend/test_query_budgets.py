@@ -0,0 +1,294 @@
+"""SQL statement budgets for the API routes.
+
+Seeds a database, calls each route through TestClient and counts the SQL
+statements it issues. A test fails when a route goes over its declared
+budget, which catches N+1 regressions such as lazy loading players or
+results per game on the history page. Budgets hold for every page size.
+
+Uses an in-memory SQLite database by default. Set TEST_DATABASE_URL to run
+against a database that may be wiped, e.g. PostgreSQL.
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+# Add the app directory to the Python path
+sys.path.append(str(Path(__file__).parent))
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+from app import importer, models
+from app.cache import history_count_cache, scoreboard_cache
+from app.crud import get_round_schedule
+from testutils import MAX_CARDS, api_client, memory_engine, round_data, sample_records
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite://")
+NUM_GAMES = 300
+
+# Route templates and the most SQL statements one request may issue, with caches cold
+BUDGETS = {
+    "/players": 1,
+    "/players/search?q=player": 1,
+    "/players/leaderboard": 1,
+    "/players/{player_id}/stats": 3,
+    "/games/{game_id}": 2,
+    "/games/{game_id}/scoreboard": 2,
+    "/games/{game_id}/scoreboard?since_round=3": 2,
+    "/games?page_size={page_size}": 3,
+    "/games?page_size={page_size}&include_total=false": 2,
+    "/games?page_size={page_size}&player_ids={player_id}&player_ids={other_player_id}": 3,
+    "/games?page_size={page_size}&sort_by=winner_score": 3,
+    "/games?page_size={page_size}&cursor={cursor}": 3,
+}
+PAGE_SIZES = (1, 20, 100)
+
+# Budgets for requests whose If-None-Match matches, answered with 304 Not Modified
+CONDITIONAL_BUDGETS = {
+    "/games/{game_id}": 1,
+    "/games/{game_id}/scoreboard": 1,
+    "/games?page_size=20": 1,
+    "/games?page_size=20&include_total=false": 1,
+}
+
+# Most SQL statements one round submission may issue, for a single round or a batch.
+SUBMISSION_BUDGET = 4
+# The final round also records the game's result, statistics and ratings
+FINAL_ROUND_BUDGET = 13
+
+
+class BudgetExceeded(AssertionError):
+    """Raised when a block issues more SQL statements than its budget."""
+
+
+@contextmanager
+def query_budget(engine, budget: int):
+    """
+    Fail if the enclosed block issues more than budget SQL statements.
+
+    Yields the list of statements issued so far, so callers can inspect them.
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    if len(statements) > budget:
+        listing = "\n\n".join(f"[{i}] {statement}" for i, statement in enumerate(statements, 1))
+        raise BudgetExceeded(f"{len(statements)} SQL statements, budget is {budget}:\n\n{listing}")
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """Engine on a freshly seeded test database."""
+    if TEST_DATABASE_URL == "sqlite://":
+        engine = memory_engine()
+    else:
+        engine = create_engine(TEST_DATABASE_URL)
+        models.Base.metadata.drop_all(bind=engine)
+        models.Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        result = importer.import_games(db, sample_records(NUM_GAMES))
+        assert not result.errors
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def session_factory(engine):
+    """Session factory configured like app.database.SessionLocal."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="module")
+def client(session_factory):
+    """TestClient whose requests use sessions on the test database."""
+    with api_client(session_factory) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def sample(session_factory, client):
+    """Path parameters: a completed game, two players who played it and a history cursor."""
+    with session_factory() as db:
+        game_id = db.execute(
+            select(models.Game.id)
+            .where(models.Game.status == models.GameStatus.COMPLETED)
+            .order_by(models.Game.id)
+        ).scalars().first()
+        player_id, other_player_id = db.execute(
+            select(models.GamePlayer.player_id)
+            .where(models.GamePlayer.game_id == game_id)
+            .order_by(models.GamePlayer.position)
+        ).scalars().all()[:2]
+    cursor = client.get("/games", params={"include_total": False}).json()["next_cursor"]
+    return {"game_id": game_id, "player_id": player_id, "other_player_id": other_player_id, "cursor": cursor}
+
+
+def budget_cases():
+    for template, budget in BUDGETS.items():
+        page_sizes = PAGE_SIZES if "{page_size}" in template else (None,)
+        for page_size in page_sizes:
+            case_id = template if page_size is None else template.replace("{page_size}", str(page_size))
+            yield pytest.param(template, page_size, budget, id=case_id)
+
+
+@pytest.mark.parametrize("template,page_size,budget", list(budget_cases()))
+def test_route_stays_within_query_budget(engine, client, sample, template, page_size, budget):
+    """Routes must not issue more SQL statements than their budget, whatever the page size."""
+    path = template.format(page_size=page_size, **sample)
+    scoreboard_cache.clear()
+    history_count_cache.clear()
+    with query_budget(engine, budget):
+        response = client.get(path)
+    assert response.status_code == 200, response.text
+
+
+@pytest.mark.parametrize("template,budget", list(CONDITIONAL_BUDGETS.items()))
+def test_conditional_request_skips_building(engine, client, sample, template, budget):
+    """A request with the current ETag gets 304 Not Modified without loading the response data."""
+    path = template.format(**sample)
+    etag = client.get(path).headers["ETag"]
+    with query_budget(engine, budget):
+        response = client.get(path, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+
+def test_history_page_is_filled(client):
+    """The largest page must actually return a full page, or its budget proves nothing."""
+    games = client.get("/games", params={"page_size": max(PAGE_SIZES)}).json()["games"]
+    assert len(games) == max(PAGE_SIZES)
+    assert all(game["players"] for game in games)
+
+
+@pytest.fixture(scope="module")
+def new_player_ids(client):
+    """Players for new games, in seat order."""
+    return [
+        client.post("/players", json={"name": name}).json()["id"]
+        for name in ("Budget Ann", "Budget Bob", "Budget Cas")
+    ]
+
+
+@pytest.fixture
+def new_game(client, new_player_ids):
+    """Path to a new active game."""
+    game = client.post("/games", json={"player_ids": new_player_ids, "max_cards": MAX_CARDS}).json()
+    return f"/games/{game['id']}"
+
+
+def test_round_submission_stays_within_budget(engine, client, new_player_ids, new_game):
+    """Every round but the last is validated and written in one transaction within budget."""
+    for number in range(1, len(get_round_schedule(MAX_CARDS))):
+        with query_budget(engine, SUBMISSION_BUDGET):
+            response = client.post(f"{new_game}/rounds", json=round_data(new_player_ids, number))
+        assert response.status_code == 200, response.text
+
+
+def test_round_batch_stays_within_budget(engine, client, new_player_ids, new_game):
+    """A batch takes as many SQL statements as a single round, however many rounds it has."""
+    rounds = [round_data(new_player_ids, number) for number in range(1, len(get_round_schedule(MAX_CARDS)))]
+    with query_budget(engine, SUBMISSION_BUDGET):
+        response = client.post(f"{new_game}/rounds:batch", json={"rounds": rounds})
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == len(rounds)
+
+
+def test_history_etag_follows_changes(client, sample, new_player_ids, new_game):
+    """A history ETag changes when a matching game changes, and only then."""
+    own_history = f"/games?player_ids={new_player_ids[0]}"
+    other_history = f"/games?player_ids={sample['player_id']}"
+    own_etag = client.get(own_history).headers["ETag"]
+    other_etag = client.get(other_history).headers["ETag"]
+
+    assert client.post(f"{new_game}/rounds", json=round_data(new_player_ids, 1)).status_code == 200
+    response = client.get(own_history, headers={"If-None-Match": own_etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != own_etag
+    assert client.get(other_history, headers={"If-None-Match": other_etag}).status_code == 304
+
+
+def test_final_round_stays_within_budget(engine, client, session_factory, new_player_ids, new_game):
+    """The final round also completes the game and records its result, statistics and ratings."""
+    schedule = get_round_schedule(MAX_CARDS)
+    rounds = [round_data(new_player_ids, number) for number in range(1, len(schedule))]
+    assert client.post(f"{new_game}/rounds:batch", json={"rounds": rounds}).status_code == 200
+    with query_budget(engine, FINAL_ROUND_BUDGET):
+        response = client.post(f"{new_game}/rounds", json=round_data(new_player_ids, len(schedule)))
+    assert response.status_code == 200, response.text
+
+    game_id = int(new_game.rsplit("/", 1)[1])
+    with session_factory() as db:
+        assert db.get(models.Game, game_id).status == models.GameStatus.COMPLETED
+        result = db.get(models.GameResult, game_id)
+        assert result is not None
+        assert result.winner_id == new_player_ids[0]
+        assert result.final_scores == [
+            sum(10 + 2 * cards for cards in schedule), 10 * len(schedule), 10 * len(schedule)
+        ]
+
+
+def wrong_dealer(rounds):
+    rounds[0]["dealer_position"] = 1
+
+
+def wrong_cards(rounds):
+    rounds[0]["cards_count"] += 1
+
+
+def skipped_round(rounds):
+    del rounds[0]
+
+
+def wrong_players(rounds, other_player_id):
+    rounds[-1]["scores"][-1]["player_id"] = other_player_id
+
+
+@pytest.mark.parametrize("break_rounds,detail", [
+    (wrong_dealer, "Round 1 is dealt by position 0, got 1"),
+    (wrong_cards, "Round 1 is dealt 1 cards, got 2"),
+    (skipped_round, "Expected round 1, got round 2"),
+    (wrong_players, "Round scores must include all game players"),
+])
+def test_rejected_submission_writes_nothing(
+    engine, client, session_factory, sample, new_player_ids, new_game, break_rounds, detail
+):
+    """A batch that doesn't continue the game is rejected without writing anything or bumping the version."""
+    rounds = [round_data(new_player_ids, number) for number in range(1, 4)]
+    if break_rounds is wrong_players:
+        break_rounds(rounds, sample["player_id"])
+    else:
+        break_rounds(rounds)
+    game_id = int(new_game.rsplit("/", 1)[1])
+
+    with query_budget(engine, SUBMISSION_BUDGET) as statements:
+        response = client.post(f"{new_game}/rounds:batch", json={"rounds": rounds})
+    assert response.status_code == 400
+    assert response.json()["detail"] == detail
+    assert not any(statement.lstrip().upper().startswith("INSERT") for statement in statements)
+
+    with session_factory() as db:
+        assert db.get(models.Game, game_id).version == 1
+        assert db.execute(select(models.Round.id).where(models.Round.game_id == game_id)).first() is None
+        assert db.execute(
+            select(models.GamePlayer.current_total).where(models.GamePlayer.game_id == game_id)
+        ).scalars().all() == [0, 0, 0]
+
+
+def test_query_budget_reports_overruns(engine):
+    """The harness itself must fail a block that goes over budget."""
+    with pytest.raises(BudgetExceeded, match="2 SQL statements, budget is 1"):
+        with query_budget(engine, 1), engine.connect() as connection:
+            connection.exec_driver_sql("SELECT 1")
+            connection.exec_driver_sql("SELECT 2")
@@ -0,0 +1,72 @@
+"""Tests for the multiplayer Elo ratings.
+
+Expected ratings were worked out by hand from the rules in app/ratings.py.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add the app directory to the Python path
+sys.path.append(str(Path(__file__).parent))
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app import crud, importer, models
+from app.crud import get_round_schedule
+from app.ratings import INITIAL_RATING, update_ratings
+from testutils import MAX_CARDS, memory_engine
+
+
+def test_first_game_spreads_equal_ratings():
+    """Between equal ratings, each win is worth K / 2 / (n - 1) and each loss costs as much."""
+    ratings = np.full(3, INITIAL_RATING)
+    update_ratings(ratings, [([0, 1, 2], [140, 90, 66])])
+    assert ratings.tolist() == [1516.0, 1500.0, 1484.0]
+
+
+def test_later_games_start_from_earlier_ratings():
+    """A game between unequal ratings rewards an upset more than an expected win."""
+    ratings = np.full(3, INITIAL_RATING)
+    # The second game reseats the players, and its winner was last in the first game
+    update_ratings(ratings, [([0, 1, 2], [140, 90, 66]), ([2, 0, 1], [140, 90, 66])])
+    assert ratings == pytest.approx([1514.8970958, 1484.0, 1501.1029042])
+
+
+def test_draws_and_independent_games():
+    """Equal totals count as draws, and games without a common player don't affect each other."""
+    ratings = np.array([1600.0, 1500.0, 1400.0, 1500.0, INITIAL_RATING, INITIAL_RATING, INITIAL_RATING])
+    update_ratings(ratings, [([0, 1, 2, 3], [50, 50, 20, 20]), ([4, 5, 6], [10, 10, 10])])
+    assert ratings == pytest.approx([1604.9079795, 1510.6666667, 1395.0920205, 1489.3333333, 1500, 1500, 1500])
+
+
+def test_completed_games_update_stored_ratings():
+    """Importing games rates their players incrementally, and a rebuild agrees."""
+    schedule = get_round_schedule(MAX_CARDS)
+
+    def record(players):
+        # The first player bids and wins every trick: 140 points to 90 and 90
+        rounds = [{"bids": [cards, 0, 0], "tricks": [cards, 0, 0]} for cards in schedule]
+        return {"players": players, "max_cards": MAX_CARDS, "created_at": "2024-03-01T20:00:00", "rounds": rounds}
+
+    engine = memory_engine()
+    with Session(engine) as db:
+        result = importer.import_games(db, enumerate([record(["Ann", "Bob", "Cas"]), record(["Cas", "Ann", "Bob"])], 1))
+        assert not result.errors
+
+        def ratings():
+            players = db.execute(select(models.Player).order_by(models.Player.name)).scalars().all()
+            return [(player.name, player.rated_games, player.rating) for player in players]
+
+        expected = [
+            ("Ann", 2, pytest.approx(1506.8965138)),
+            ("Bob", 2, pytest.approx(1484.5517431)),
+            ("Cas", 2, pytest.approx(1508.5517431)),
+        ]
+        assert ratings() == expected
+        assert crud.PlayerRatingCRUD.rebuild(db) == 2
+        assert ratings() == expected
+    engine.dispose()
@@ -0,0 +1,91 @@
+"""Tests that round submissions are all-or-nothing.
+
+Uses an in-memory SQLite database.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the app directory to the Python path
+sys.path.append(str(Path(__file__).parent))
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import crud, models, schemas
+from testutils import MAX_CARDS, api_client, memory_engine, round_data
+
+
+@pytest.fixture
+def engine():
+    engine = memory_engine()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    """TestClient on an empty in-memory database."""
+    with api_client(sessionmaker(autocommit=False, autoflush=False, bind=engine)) as client:
+        yield client
+
+
+@pytest.fixture
+def game(client):
+    """A new active game and its player IDs in seat order, with round 1 played."""
+    player_ids = [client.post("/players", json={"name": name}).json()["id"] for name in ("Ann", "Bob", "Cas")]
+    game_id = client.post("/games", json={"player_ids": player_ids, "max_cards": MAX_CARDS}).json()["id"]
+    client.post(f"/games/{game_id}/rounds", json=round_data(player_ids, 1)).raise_for_status()
+    return game_id, player_ids
+
+
+def game_state(engine, game_id):
+    """The game's version, recorded round numbers and current totals."""
+    with Session(engine) as db:
+        return (
+            db.get(models.Game, game_id).version,
+            db.execute(
+                select(models.Round.round_number).where(models.Round.game_id == game_id).order_by(models.Round.round_number)
+            ).scalars().all(),
+            db.execute(
+                select(models.GamePlayer.current_total)
+                .where(models.GamePlayer.game_id == game_id)
+                .order_by(models.GamePlayer.position)
+            ).scalars().all(),
+        )
+
+
+def test_bad_round_rolls_back_the_batch(engine, client, game):
+    """A batch whose middle round is invalid records none of its rounds."""
+    game_id, player_ids = game
+    before = game_state(engine, game_id)
+    rounds = [round_data(player_ids, number) for number in range(2, 5)]
+    rounds[1]["scores"][0]["tricks_won"] -= 1
+
+    response = client.post(f"/games/{game_id}/rounds:batch", json={"rounds": rounds})
+    assert response.status_code == 400
+    assert game_state(engine, game_id) == before
+
+    # The same batch goes through once the round is fixed
+    rounds[1]["scores"][0]["tricks_won"] += 1
+    assert client.post(f"/games/{game_id}/rounds:batch", json={"rounds": rounds}).status_code == 200
+    version, numbers, totals = game_state(engine, game_id)
+    assert (version, numbers) == (before[0] + 1, [1, 2, 3, 4])
+    assert totals[1:] == [40, 40]
+
+
+def test_failed_insert_rolls_back_updated_totals(engine, game):
+    """A batch that fails on its INSERT also undoes the version bump and the new totals."""
+    game_id, player_ids = game
+    # A stray round 3 keeps the round count at 2, so round 3 passes validation and then collides
+    with Session(engine) as db:
+        db.add(models.Round(game_id=game_id, round_number=3, cards_count=3, dealer_position=2))
+        db.commit()
+    before = game_state(engine, game_id)
+
+    rounds = [schemas.RoundDataSubmission.model_validate(round_data(player_ids, number)) for number in (3, 4)]
+    with Session(engine) as db, pytest.raises(ValueError, match="Round 3 has already been recorded"):
+        crud.RoundCRUD.submit_rounds(db, game_id, rounds)
+    assert game_state(engine, game_id) == before
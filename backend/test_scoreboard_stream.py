@@ -0,0 +1,126 @@
+"""Tests for live scoreboard updates: the stream, the broadcaster behind it and delta polling.
+
+Uses an in-memory SQLite database and the in-process broadcast backend.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add the app directory to the Python path
+sys.path.append(str(Path(__file__).parent))
+
+from sqlalchemy.orm import sessionmaker
+
+from app import schemas
+from app.broadcast import Broadcaster, MemoryBroadcastBackend, SubscriptionClosed, broadcaster
+from app.cache import scoreboard_cache
+from app.crud import get_round_schedule
+from testutils import MAX_CARDS, api_client, memory_engine, round_data
+
+
+@pytest.fixture
+def client():
+    """TestClient on an empty in-memory database."""
+    engine = memory_engine()
+    # Game ids and versions repeat across fresh databases
+    scoreboard_cache.clear()
+    with api_client(sessionmaker(autocommit=False, autoflush=False, bind=engine)) as client:
+        yield client
+    engine.dispose()
+
+
+def read_events(client, path, events):
+    """Collect Server-Sent Events from path until the stream ends."""
+    with client.stream("GET", path) as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        event = {}
+        for line in response.iter_lines():
+            if line:
+                field, _, value = line.partition(": ")
+                event[field] = value
+            elif event:
+                events.append(event)
+                event = {}
+
+
+def test_stream_pushes_committed_rounds(client):
+    """The stream sends a snapshot, then one round event per commit, and ends with the game."""
+    player_ids = [client.post("/players", json={"name": name}).json()["id"] for name in ("Ann", "Bob", "Cas")]
+    game_id = client.post("/games", json={"player_ids": player_ids, "max_cards": MAX_CARDS}).json()["id"]
+    client.post(f"/games/{game_id}/rounds", json=round_data(player_ids, 1)).raise_for_status()
+
+    events = []
+    reader = threading.Thread(target=read_events, args=(client, f"/games/{game_id}/scoreboard/stream", events))
+    reader.start()
+    deadline = time.monotonic() + 5
+    while not broadcaster.stats()["subscribers"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    total_rounds = len(get_round_schedule(MAX_CARDS))
+    client.post(f"/games/{game_id}/rounds", json=round_data(player_ids, 2)).raise_for_status()
+    client.post(f"/games/{game_id}/rounds:batch", json={
+        "rounds": [round_data(player_ids, number) for number in range(3, total_rounds + 1)]
+    }).raise_for_status()
+    reader.join(5)
+    assert not reader.is_alive()
+
+    snapshot = schemas.ScoreboardResponse.model_validate_json(events[0]["data"])
+    assert (events[0]["event"], snapshot.current_round) == ("scoreboard", 2)
+    updates = [schemas.ScoreboardRoundUpdate.model_validate_json(event["data"]) for event in events[1:]]
+    assert [event["event"] for event in events[1:]] == ["round"] * (total_rounds - 1)
+    assert [update.round_number for update in updates] == list(range(2, total_rounds + 1))
+    assert [int(event["id"]) for event in events] == list(range(1, total_rounds + 1))
+
+    final = client.get(f"/games/{game_id}/scoreboard").json()
+    assert updates[-1].is_complete and updates[-1].winner_id == final["winner_id"] == player_ids[0]
+    assert [total.final_total for total in updates[-1].totals] == [p["final_total"] for p in final["players"]]
+    assert broadcaster.stats()["subscribers"] == 0
+
+
+def test_scoreboard_delta_matches_full_scoreboard(client):
+    """Polling with since_round returns the newer rounds as they appear in the full scoreboard."""
+    player_ids = [client.post("/players", json={"name": name}).json()["id"] for name in ("Ann", "Bob", "Cas")]
+    game_id = client.post("/games", json={"player_ids": player_ids, "max_cards": MAX_CARDS}).json()["id"]
+    for number in range(1, 4):
+        client.post(f"/games/{game_id}/rounds", json=round_data(player_ids, number)).raise_for_status()
+
+    full = client.get(f"/games/{game_id}/scoreboard").json()
+    delta = client.get(f"/games/{game_id}/scoreboard", params={"since_round": 1}).json()
+    schemas.ScoreboardDelta.model_validate(delta)
+    assert [round_["round_number"] for round_ in delta["rounds"]] == [2, 3]
+    assert [round_["scores"] for round_ in delta["rounds"]] == [
+        [player["rounds"][number - 1] for player in full["players"]] for number in (2, 3)
+    ]
+    assert [total["final_total"] for total in delta["totals"]] == [player["final_total"] for player in full["players"]]
+    assert (delta["current_round"], delta["is_complete"], delta["winner_id"]) == (4, False, None)
+
+    caught_up = client.get(f"/games/{game_id}/scoreboard", params={"since_round": 3}).json()
+    assert caught_up["rounds"] == [] and caught_up["current_round"] == 4
+    assert client.get(f"/games/{game_id}/scoreboard", params={"since_round": -1}).status_code == 422
+
+
+def test_stream_of_missing_game_is_not_found(client):
+    assert client.get("/games/999/scoreboard/stream").status_code == 404
+    assert broadcaster.stats()["subscribers"] == 0
+
+
+def test_lagging_subscriber_is_closed():
+    """A subscriber too far behind keeps what it was sent, then ends instead of missing messages."""
+    async def scenario():
+        local = Broadcaster(MemoryBroadcastBackend(), max_pending=2)
+        subscription = await local.subscribe("channel")
+        for number in range(4):
+            await local.publish("channel", str(number))
+        received = [await subscription.get(), await subscription.get()]
+        with pytest.raises(SubscriptionClosed):
+            await subscription.get()
+        return received, local.stats()
+
+    received, stats = asyncio.run(scenario())
+    assert received == ["0", "1"]
+    assert stats == {"channels": 0, "subscribers": 0}
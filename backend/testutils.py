@@ -0,0 +1,74 @@
+"""Helpers shared by the test modules: test databases, API clients and game data."""
+
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator, Tuple
+
+# Add the app directory to the Python path
+sys.path.append(str(Path(__file__).parent))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app import models
+from app.crud import get_round_schedule
+from app.database import SessionRunner, get_export_session, get_runner
+from app.main import app
+from app.sample_games import GameGenerator
+
+MAX_CARDS = 5
+
+
+def memory_engine():
+    """Engine on a new in-memory SQLite database with the schema created."""
+    # One shared connection, so every TestClient thread sees the same database
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    models.Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@contextmanager
+def api_client(session_factory) -> Iterator[TestClient]:
+    """TestClient whose requests use sessions from session_factory."""
+    async def get_test_runner():
+        db = session_factory()
+        try:
+            yield SessionRunner(db)
+        finally:
+            db.close()
+
+    async def get_test_export_session():
+        # Closed by the export stream
+        yield session_factory()
+
+    app.dependency_overrides[get_runner] = get_test_runner
+    app.dependency_overrides[get_export_session] = get_test_export_session
+    try:
+        with TestClient(app) as client:
+            yield client
+    finally:
+        app.dependency_overrides.pop(get_runner)
+        app.dependency_overrides.pop(get_export_session)
+
+
+def sample_records(num_games: int, num_players: int = 60, seed: int = 7) -> Iterator[Tuple[int, dict]]:
+    """Deterministic importer records, one game an hour through 2024; most games are completed."""
+    names = [f"Test Player {i}" for i in range(num_players)]
+    return GameGenerator(names, seed).import_records(num_games, datetime(2024, 1, 1), timedelta(hours=1))
+
+
+def round_data(player_ids, round_number):
+    """Round submission in which the first player bids and wins every trick."""
+    cards = get_round_schedule(MAX_CARDS)[round_number - 1]
+    return {
+        "round_number": round_number,
+        "cards_count": cards,
+        "dealer_position": (round_number - 1) % len(player_ids),
+        "scores": [
+            {"player_id": player_id, "bid": cards if seat == 0 else 0, "tricks_won": cards if seat == 0 else 0}
+            for seat, player_id in enumerate(player_ids)
+        ],
+    }
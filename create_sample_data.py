@@ -1,171 +1,221 @@
 #!/usr/bin/env python3
 """
-Script to add sample completed games for testing the game history feature.
+Generate a large, deterministic synthetic dataset of Boerenbridge games.
+
+Games come from app.sample_games.GameGenerator, so they follow the real
+rules and seat players in circles of regulars with the occasional guest.
+Scores come from ScoreCalculator.
+
+Rows are written straight to the database, bypassing the API: COPY on
+PostgreSQL and multi-row INSERTs elsewhere, one transaction per chunk of
+games. Player statistics and ratings are rebuilt at the end.
+
+Usage:
+    python create_sample_data.py --games 100000 --seed 42
+    DATABASE_URL=postgresql://... python create_sample_data.py --games 500000 --reset
 """
 
-import requests
+import argparse
+import io
 import json
-from datetime import datetime, timedelta
-import random
-
-API_BASE = "http://localhost:8000"
-
-def create_player(name):
-    """Create a player and return the player data."""
-    response = requests.post(f"{API_BASE}/players/", json={"name": name})
-    if response.status_code == 200:
-        return response.json()
-    elif response.status_code == 400 and "already exists" in response.text:
-        # Player already exists, get their ID
-        players_response = requests.get(f"{API_BASE}/players/")
-        players = players_response.json()
-        for player in players:
-            if player["name"] == name:
-                return player
-    return None
-
-def create_sample_games():
-    """Create some sample completed games."""
-    
-    # Sample player names
-    player_names = [
-        "Alice", "Bob", "Charlie", "Diana", "Eve", "Frank", "Grace", "Henry", "Iris", "Jack"
-    ]
-    
-    # Create players
-    players = {}
-    for name in player_names:
-        player_data = create_player(name)
-        if player_data:
-            players[name] = player_data
-    
-    print(f"Created/found {len(players)} players")
-    
-    # Create sample games
-    sample_games = [
-        {
-            "players": ["Alice", "Bob", "Charlie", "Diana"],
-            "max_cards": 8,
-            "rounds_data": [
-                # Round 1 (1 card)
-                {"bids": [1, 0, 0, 0], "tricks": [1, 0, 0, 0]},
-                # Round 2 (2 cards) 
-                {"bids": [1, 1, 0, 0], "tricks": [1, 0, 1, 0]},
-                # Round 3 (3 cards)
-                {"bids": [2, 1, 0, 0], "tricks": [2, 1, 0, 0]},
-                # Continue pattern...
-            ]
-        },
-        {
-            "players": ["Eve", "Frank", "Grace"],
-            "max_cards": 10,
-            "rounds_data": []  # We'll generate simple data
-        },
-        {
-            "players": ["Henry", "Iris", "Jack", "Alice", "Bob"],
-            "max_cards": 7,
-            "rounds_data": []
-        }
-    ]
-    
-    for i, game_config in enumerate(sample_games):
-        try:
-            print(f"\nCreating game {i+1}...")
-            
-            # Get player IDs
-            game_players = [players[name] for name in game_config["players"] if name in players]
-            if len(game_players) != len(game_config["players"]):
-                print(f"Skipping game {i+1} - missing players")
-                continue
-            
-            player_ids = [p["id"] for p in game_players]
-            
-            # Create game
-            game_data = {
-                "player_ids": player_ids,
-                "max_cards": game_config["max_cards"]
-            }
-            
-            response = requests.post(f"{API_BASE}/games/", json=game_data)
-            if response.status_code != 200:
-                print(f"Failed to create game {i+1}: {response.text}")
-                continue
-                
-            game = response.json()
-            game_id = game["id"]
-            print(f"Created game {game_id}")
-            
-            # Generate and submit round data
-            max_cards = game_config["max_cards"]
-            total_rounds = (max_cards * 2) - 1
-            
-            for round_num in range(1, total_rounds + 1):
-                # Calculate cards for this round
-                if round_num <= max_cards:
-                    cards_count = round_num
-                else:
-                    cards_count = total_rounds - round_num + 1
-                
-                # Generate random but valid bids and tricks
-                player_count = len(game_players)
-                bids = []
-                tricks = []
-                
-                # Generate bids (ensuring last bidder constraint is sometimes violated for realism)
-                for j, player in enumerate(game_players):
-                    if j == player_count - 1:  # Last bidder
-                        current_bid_total = sum(bids)
-                        # Sometimes make it equal to cards (invalid), sometimes not
-                        if random.random() < 0.3:  # 30% chance of invalid bid
-                            bid = max(0, cards_count - current_bid_total)
-                        else:
-                            possible_bids = [b for b in range(0, cards_count + 1) if b != cards_count - current_bid_total]
-                            bid = random.choice(possible_bids) if possible_bids else 0
-                    else:
-                        bid = random.randint(0, min(cards_count, 3))  # Reasonable bid
-                    bids.append(bid)
-                
-                # Generate tricks (must sum to cards_count)
-                remaining_tricks = cards_count
-                for j in range(player_count - 1):
-                    max_tricks = min(remaining_tricks, bids[j] + 2)  # Somewhat realistic
-                    tricks_won = random.randint(0, max_tricks)
-                    tricks.append(tricks_won)
-                    remaining_tricks -= tricks_won
-                
-                tricks.append(max(0, remaining_tricks))  # Last player gets remaining
-                
-                # Submit round
-                dealer_position = (round_num - 1) % player_count
-                
-                round_data = {
-                    "round_number": round_num,
-                    "cards_count": cards_count,
-                    "dealer_position": dealer_position,
-                    "player_data": []
-                }
-                
-                for j, player in enumerate(game_players):
-                    round_data["player_data"].append({
-                        "player_name": player["name"],
-                        "bid": bids[j],
-                        "tricks_won": tricks[j],
-                        "score": 0,  # Will be calculated by backend
-                        "running_total": 0  # Will be calculated by backend
-                    })
-                
-                response = requests.post(f"{API_BASE}/games/{game_id}/rounds", json=round_data)
-                if response.status_code == 200:
-                    print(f"  Submitted round {round_num}")
-                else:
-                    print(f"  Failed to submit round {round_num}: {response.text}")
-                    break
-            
-            print(f"Completed game {game_id}")
-            
-        except Exception as e:
-            print(f"Error creating game {i+1}: {e}")
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List
+
+# Add the backend directory to the Python path
+sys.path.append(str(Path(__file__).parent / "backend"))
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app import models
+from app.crud import PlayerRatingCRUD, PlayerStatsCRUD, ScoreCalculator, get_round_schedule
+from app.database import engine
+from app.sample_games import GameGenerator
+
+TABLE_COLUMNS = {
+    "games": ("id", "created_at", "max_cards", "status", "version"),
+    "game_players": ("game_id", "player_id", "position", "current_total"),
+    "rounds": ("id", "game_id", "round_number", "cards_count", "dealer_position"),
+    "round_scores": ("id", "round_id", "player_id", "bid", "tricks_won", "score", "running_total"),
+    "game_results": ("game_id", "winner_id", "winner_score", "final_scores", "completed_at", "created_at"),
+}
+
+
+class DatasetGenerator:
+    """Turns generated games into plain row tuples, continuing after the existing IDs."""
+
+    def __init__(self, games: GameGenerator, next_ids: Dict[str, int]):
+        self.games = games
+        self.next_ids = next_ids
+        self.rows: Dict[str, list] = {table: [] for table in TABLE_COLUMNS}
+        self.rounds_generated = 0
+
+    def add_game(self, created_at: datetime) -> None:
+        """Generate one game and append its rows."""
+        game = self.games.play_game()
+        players = game.players
+        schedule = get_round_schedule(game.max_cards)
+
+        game_id = self.next_ids["games"]
+        self.next_ids["games"] += 1
+        status = models.GameStatus.COMPLETED if game.completed else models.GameStatus.ABANDONED
+        self.rows["games"].append((game_id, created_at, game.max_cards, status, 1))
+
+        totals = [0] * len(players)
+        for index, scores in enumerate(game.rounds):
+            round_id = self.next_ids["rounds"]
+            self.next_ids["rounds"] += 1
+            dealer = index % len(players)
+            self.rows["rounds"].append((round_id, game_id, index + 1, schedule[index], dealer))
+            for seat, (bid, tricks_won) in enumerate(scores):
+                score = ScoreCalculator.calculate_score(bid, tricks_won)
+                totals[seat] += score
+                self.rows["round_scores"].append(
+                    (self.next_ids["round_scores"], round_id, players[seat], bid, tricks_won, score, totals[seat])
+                )
+                self.next_ids["round_scores"] += 1
+        self.rounds_generated += len(game.rounds)
+
+        for position, (player_id, total) in enumerate(zip(players, totals)):
+            self.rows["game_players"].append((game_id, player_id, position, total))
+        if game.completed:
+            winner_id = ScoreCalculator.get_winner(list(zip(players, totals)))
+            completed_at = created_at + timedelta(minutes=8 * len(schedule))
+            self.rows["game_results"].append(
+                (game_id, winner_id, max(totals), totals, completed_at, created_at)
+            )
+
+    def take_rows(self) -> Dict[str, list]:
+        """Return the rows generated so far and start a new chunk."""
+        rows = self.rows
+        self.rows = {table: [] for table in rows}
+        return rows
+
+
+def copy_value(value) -> str:
+    """Format a value for COPY's text format."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, models.GameStatus):
+        return value.name
+    if isinstance(value, list):
+        return json.dumps(value)
+    return str(value)
+
+
+def copy_rows(connection, table: str, rows: list) -> None:
+    """Bulk load rows with PostgreSQL COPY."""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(map(copy_value, row)))
+        buffer.write("\n")
+    buffer.seek(0)
+    with connection.connection.dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table} ({', '.join(TABLE_COLUMNS[table])}) FROM STDIN", buffer)
+
+
+def insert_rows(connection, table: str, rows: list) -> None:
+    """Bulk load rows with a multi-row INSERT."""
+    columns = TABLE_COLUMNS[table]
+    connection.execute(models.Base.metadata.tables[table].insert(), [dict(zip(columns, row)) for row in rows])
+
+
+def write_rows(connection, rows: Dict[str, list]) -> None:
+    """Write a chunk of rows in foreign key order."""
+    write = copy_rows if connection.dialect.name == "postgresql" else insert_rows
+    for table in ("games", "game_players", "rounds", "round_scores", "game_results"):
+        if rows.get(table):
+            write(connection, table, rows[table])
+
+
+def create_players(connection, count: int, start: datetime) -> List[int]:
+    """Create synthetic players, reusing ones from an earlier run."""
+    names = [f"Player {number:05d}" for number in range(1, count + 1)]
+    existing = dict(connection.execute(
+        select(models.Player.name, models.Player.id).where(models.Player.name.in_(names))
+    ).all())
+    missing = [name for name in names if name not in existing]
+    if missing:
+        connection.execute(
+            models.Player.__table__.insert(),
+            [{"name": name, "created_at": start} for name in missing]
+        )
+        existing.update(connection.execute(
+            select(models.Player.name, models.Player.id).where(models.Player.name.in_(missing))
+        ).all())
+    return [existing[name] for name in names]
+
+
+def next_ids(connection) -> Dict[str, int]:
+    """First free ID of every table whose IDs the generator assigns."""
+    return {
+        table: (connection.execute(select(func.max(models.Base.metadata.tables[table].c.id))).scalar() or 0) + 1
+        for table in ("games", "rounds", "round_scores")
+    }
+
+
+def reset_sequences(connection) -> None:
+    """Move PostgreSQL ID sequences past the explicitly assigned IDs."""
+    if connection.dialect.name != "postgresql":
+        return
+    for table in ("games", "rounds", "round_scores"):
+        connection.exec_driver_sql(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT coalesce(max(id), 1) FROM {table}))"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a large synthetic Boerenbridge dataset")
+    parser.add_argument("--games", type=int, default=10000, help="Number of games to generate")
+    parser.add_argument("--players", type=int, default=240, help="Number of players, in circles of 12")
+    parser.add_argument("--days", type=int, default=730, help="Spread games over this many days")
+    parser.add_argument("--end", type=datetime.fromisoformat, default=None,
+                        help="Date of the last game (default: today); dates are relative to it")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed; the same seed gives the same games")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Games written per transaction")
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate all tables first")
+    args = parser.parse_args()
+
+    if args.reset:
+        models.Base.metadata.drop_all(bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+
+    end = args.end or datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    start = end - timedelta(days=args.days)
+    step = timedelta(days=args.days) / max(args.games, 1)
+
+    started = time.perf_counter()
+    with engine.begin() as connection:
+        player_ids = create_players(connection, args.players, start)
+        generator = DatasetGenerator(GameGenerator(player_ids, args.seed), next_ids(connection))
+
+    for offset in range(0, args.games, args.chunk_size):
+        for number in range(offset, min(offset + args.chunk_size, args.games)):
+            generator.add_game(start + step * number)
+        with engine.begin() as connection:
+            write_rows(connection, generator.take_rows())
+        print(f"  {min(offset + args.chunk_size, args.games)} games, {generator.rounds_generated} rounds "
+              f"({time.perf_counter() - started:.0f}s)")
+
+    with engine.begin() as connection:
+        reset_sequences(connection)
+
+    with Session(engine) as db:
+        PlayerStatsCRUD.rebuild(db)
+        PlayerRatingCRUD.rebuild(db)
+    if engine.dialect.name == "postgresql":
+        with engine.connect() as connection:
+            connection.exec_driver_sql("ANALYZE")
+            connection.commit()
+
+    print(f"✅ Generated {args.games} games with {generator.rounds_generated} rounds for "
+          f"{len(player_ids)} players in {time.perf_counter() - started:.0f}s")
+
 
 if __name__ == "__main__":
-    create_sample_games()
-    print("\nSample data creation completed!")
+    main()
@@ -62,7 +62,7 @@ const GameHistory: React.FC = () => {
   // Pagination state
   const [currentPage, setCurrentPage] = useState(1);
   const [totalPages, setTotalPages] = useState(1);
-  const [totalGames, setTotalGames] = useState(0);
+  const [totalGames, setTotalGames] = useState<number | null>(0);
   const [pageSize] = useState(20);
 
   // Filter state
@@ -125,8 +125,9 @@ const GameHistory: React.FC = () => {
       const historyData: GameHistoryResponse = await getGameHistory(queryParams);
       
       setGames(historyData.games);
-      setTotalPages(historyData.total_pages);
-            setTotalGames(historyData.total_games);
+      // Without totals, only offer the pages known to exist
+      setTotalPages(historyData.total_pages ?? currentPage + (historyData.next_cursor ? 1 : 0));
+      setTotalGames(historyData.total_games);
     } catch (err) {
       console.error('Error loading game history:', err);
       showError('Fout bij laden van spelgeschiedenis');
@@ -240,7 +241,7 @@ const GameHistory: React.FC = () => {
               Spel Historie
             </Typography>
             <Typography variant="body2" color="text.secondary">
-              {totalGames} {totalGames === 1 ? 'spel' : 'spellen'} gevonden
+              {totalGames !== null && `${totalGames} ${totalGames === 1 ? 'spel' : 'spellen'} gevonden`}
             </Typography>
           </Box>
           <Badge badgeContent={getFilterCount()} color="primary">
@@ -535,7 +536,9 @@ const GameHistory: React.FC = () => {
                     showLastButton
                   />
                   <Typography variant="body2" color="text.secondary" textAlign="center">
-                    Pagina {currentPage} van {totalPages} • {totalGames} totaal
+                    {totalGames !== null
+                      ? `Pagina ${currentPage} van ${totalPages} • ${totalGames} totaal`
+                      : `Pagina ${currentPage}`}
                   </Typography>
                 </Stack>
               </Box>
@@ -25,6 +25,9 @@ api.interceptors.response.use(
 export const playerAPI = {
   // Get all players
   getAll: () => api.get('/players'),
+
+  // Autocomplete players by case-insensitive name prefix, most active first
+  search: (q: string, limit: number = 10) => api.get('/players/search', { params: { q, limit } }),
   
   // Create a new player
   create: (name: string) => api.post('/players', { name }),
@@ -52,6 +55,31 @@ export const gameAPI = {
   getScoreboard: (gameId: string) =>
     api.get(`/games/${gameId}/scoreboard`),
 
+  // Get only the rounds after sinceRound, with the current totals
+  getScoreboardDelta: (gameId: string, sinceRound: number) =>
+    api.get(`/games/${gameId}/scoreboard`, { params: { since_round: sinceRound } }),
+
+  // Follow a scoreboard live: the full scoreboard first, then one update per submitted round.
+  // Call close() on the returned EventSource to stop; it closes itself once the game is complete.
+  streamScoreboard: (
+    gameId: string,
+    onScoreboard: (scoreboard: any) => void,
+    onRound: (update: any) => void
+  ) => {
+    const source = new EventSource(`${API_URL}/games/${gameId}/scoreboard/stream`);
+    source.addEventListener('scoreboard', (event) => {
+      const scoreboard = JSON.parse((event as MessageEvent).data);
+      onScoreboard(scoreboard);
+      if (scoreboard.is_complete) source.close();
+    });
+    source.addEventListener('round', (event) => {
+      const update = JSON.parse((event as MessageEvent).data);
+      onRound(update);
+      if (update.is_complete) source.close();
+    });
+    return source;
+  },
+
   // Get game details for continuing
   getDetails: (gameId: string) =>
     api.get(`/games/${gameId}`),
@@ -30,10 +30,13 @@ export interface GameSummary {
 
 export interface GameHistoryResponse {
   games: GameSummary[];
-  total_games: number;
+  // null when the history was requested with include_total=false
+  total_games: number | null;
   page: number;
   page_size: number;
-  total_pages: number;
+  total_pages: number | null;
+  next_cursor?: string | null;
+  prev_cursor?: string | null;
 }
 
 export interface GameHistoryFilters {